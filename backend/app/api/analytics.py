@@ -0,0 +1,80 @@
+"""
+Velero Dashboard Backend - Analytics API
+
+백업 소요 시간/처리량 분석 엔드포인트 (백업별 지표, 스케줄별 p50/p95와 추세)
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+import logging
+
+from app.config import settings
+from app.services.k8s_client import async_k8s_client
+from app.services.informer import informers
+from app.services.analytics import backup_analytics, BackupAnalytics
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/analytics", tags=["analytics"])
+
+
+async def _analytics() -> BackupAnalytics:
+    """The incremental analytics, or a one-off build until the backups informer has synced"""
+    if informers.informer("backups").has_synced():
+        return backup_analytics
+    analytics = BackupAnalytics()
+    analytics.load(await async_k8s_client.list_backups())
+    return analytics
+
+
+@router.get("/backups")
+async def get_backup_analytics(
+    schedule: Optional[str] = Query(None, description="Schedule name (empty for manual backups)"),
+    limit: int = Query(100, ge=1, le=1000)
+):
+    """
+    Duration, items and throughput of finished backups, newest first
+    
+    Bytes come from the backup's PodVolumeBackups/DataUploads and are null
+    when it has none (or they are no longer tracked).
+    
+    Returns:
+        Per-backup duration, items, bytes and bytes/s
+    """
+    try:
+        analytics = await _analytics()
+        return analytics.backups(schedule, limit)
+    
+    except Exception as e:
+        logger.error(f"Error getting backup analytics: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/schedules")
+async def get_schedule_analytics(
+    schedule: Optional[str] = Query(None),
+    window_days: Optional[float] = Query(None, gt=0, le=365, description="Window length (default ANALYTICS_WINDOW_DAYS)"),
+    windows: Optional[int] = Query(None, ge=1, le=52, description="Number of windows (default ANALYTICS_WINDOWS)")
+):
+    """
+    Backup duration and throughput per schedule over time windows
+    
+    Completed and PartiallyFailed backups are analyzed. Each window reports
+    p50/p95 duration and p50 bytes/s; the trend is the least-squares slope
+    of duration and size per day, and `slowingDown` flags schedules whose
+    p50 duration grew by more than ANALYTICS_SLOWDOWN_THRESHOLD.
+    
+    Returns:
+        Per-schedule window statistics and trend, schedules sorted by name
+    """
+    try:
+        analytics = await _analytics()
+        return analytics.schedules(
+            window_days or settings.analytics_window_days,
+            windows or settings.analytics_windows,
+            schedule
+        )
+    
+    except Exception as e:
+        logger.error(f"Error getting schedule analytics: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -4,19 +4,40 @@ Velero Dashboard Backend - Backups API
 Backup 생성 및 조회 엔드포인트
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Set, Callable, Dict
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
-from app.models.velero import Backup, CreateBackupRequest
-from app.services.k8s_client import k8s_client
+from app.models.velero import (
+    Backup,
+    Restore,
+    CreateBackupRequest,
+    BatchCreateBackupsRequest,
+    BatchDeleteBackupsRequest,
+    BatchResult,
+    OperationStatus
+)
+from app.services.k8s_client import async_k8s_client
+from app.services.informer import informers
+from app.services.batch import run_batch, batch_rate_limiter
+from app.services.operations import deletion_queue
+from app.services.log_fetcher import log_fetcher, LogsNotAvailableError
+from app.config import settings
+from app.api.restores import _convert_restore_to_model
+from app.api.transfers import get_progress, progress_stream
+from app.services.indexes import (
+    SORT_KEYS,
+    start_timestamp_key,
+    encode_cursor,
+    decode_cursor
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/backups", tags=["backups"])
 
-
 def _convert_backup_to_model(backup_cr: dict) -> Backup:
     """Convert Kubernetes Backup CR to Pydantic model"""
     metadata = backup_cr.get("metadata", {})
@@ -34,24 +55,160 @@ def _convert_backup_to_model(backup_cr: dict) -> Backup:
     )
 
 
+def _format_timestamp(value: datetime) -> str:
+    """Format a datetime like Kubernetes timestamps (UTC, RFC3339)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _build_backup_selector(
+    phases: Optional[Set[str]],
+    storage_location: Optional[str],
+    schedule: Optional[str]
+) -> Dict[str, Set[str]]:
+    """Build a secondary index selector from query filters"""
+    selector: Dict[str, Set[str]] = {}
+    if phases:
+        selector["phase"] = phases
+    if storage_location:
+        selector["storageLocation"] = {storage_location}
+    if schedule:
+        selector["schedule"] = {schedule}
+    return selector
+
+
+def _build_backup_filter(
+    since: Optional[str],
+    until: Optional[str],
+    name_prefix: Optional[str]
+) -> Callable[[dict], bool]:
+    """Build a predicate over Backup CRs for filters without an index"""
+    def predicate(backup_cr: dict) -> bool:
+        if name_prefix and not backup_cr.get("metadata", {}).get("name", "").startswith(name_prefix):
+            return False
+        if since or until:
+            started = start_timestamp_key(backup_cr)
+            if since and started < since:
+                return False
+            if until and started >= until:
+                return False
+        return True
+    
+    return predicate
+
+
+def _build_backup_cr(request: CreateBackupRequest) -> dict:
+    """Build a Backup CR from a creation request"""
+    backup_spec = {
+        "apiVersion": "velero.io/v1",
+        "kind": "Backup",
+        "metadata": {
+            "name": request.name,
+        },
+        "spec": {}
+    }
+    
+    # Add optional fields
+    if request.included_namespaces:
+        backup_spec["spec"]["includedNamespaces"] = request.included_namespaces
+    
+    if request.excluded_namespaces:
+        backup_spec["spec"]["excludedNamespaces"] = request.excluded_namespaces
+    
+    if request.ttl:
+        backup_spec["spec"]["ttl"] = request.ttl
+    
+    return backup_spec
+
+
+def _convert_pod_volume_backup(pvb: dict) -> dict:
+    """Convert Kubernetes PodVolumeBackup CR to API dict"""
+    metadata = pvb.get("metadata", {})
+    spec = pvb.get("spec", {})
+    status = pvb.get("status", {})
+    pod = spec.get("pod", {})
+    
+    return {
+        "name": metadata.get("name", ""),
+        "pod": f"{pod.get('namespace', '')}/{pod.get('name', '')}",
+        "volumeName": spec.get("volume", ""),
+        "node": spec.get("node", ""),
+        "phase": status.get("phase", "New"),
+        "message": status.get("message", ""),
+        "progress": status.get("progress", {}),
+        "startTimestamp": status.get("startTimestamp"),
+        "completionTimestamp": status.get("completionTimestamp")
+    }
+
+
 @router.get("", response_model=List[Backup])
-async def list_backups():
+async def list_backups(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size (all backups if omitted)"),
+    continue_token: Optional[str] = Query(None, alias="continue", description="Token from the X-Continue header of the previous page"),
+    phase: Optional[str] = Query(None, description="Comma-separated phases, e.g. Failed,PartiallyFailed"),
+    storage_location: Optional[str] = Query(None, alias="storageLocation"),
+    schedule: Optional[str] = Query(None, description="velero.io/schedule-name label"),
+    since: Optional[datetime] = Query(None, description="startTimestamp >= since"),
+    until: Optional[datetime] = Query(None, description="startTimestamp < until"),
+    name_prefix: Optional[str] = Query(None, alias="namePrefix"),
+    sort: str = Query("-startTimestamp", description="startTimestamp, completionTimestamp or name; prefix '-' for descending")
+):
     """
-    List all Velero Backups
+    List Velero Backups
+    
+    Filtering, sorting and pagination are evaluated against the indexes of
+    the informer cache: phase/storageLocation/schedule filters use the
+    secondary indexes, the sort order and time range use the sorted index. When a page is full, the token for the
+    next page is returned in the X-Continue response header.
     
     Returns:
         List of Backup objects
     """
+    reverse = sort.startswith("-")
+    sort_field = sort.lstrip("-")
+    if sort_field not in SORT_KEYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid sort '{sort}'. Allowed: {', '.join(SORT_KEYS)}"
+        )
+    
+    try:
+        after = decode_cursor(continue_token, sort) if continue_token else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         logger.info("Listing backups")
-        backups_cr = k8s_client.list_backups()
-        backups = [_convert_backup_to_model(b) for b in backups_cr]
         
-        # Sort by start timestamp (descending)
-        backups.sort(
-            key=lambda x: x.start_timestamp if x.start_timestamp else "",
-            reverse=True
+        since_ts = _format_timestamp(since) if since else None
+        until_ts = _format_timestamp(until) if until else None
+        phases = {p.strip() for p in phase.split(",") if p.strip()} if phase else None
+        
+        # Range filters on the sort key narrow the index scan itself
+        lower = upper = None
+        if sort_field == "startTimestamp":
+            lower, upper = since_ts, until_ts
+        elif sort_field == "name" and name_prefix:
+            lower, upper = name_prefix, name_prefix + "\U0010ffff"
+        
+        backups_cr, last_entry = await informers.query(
+            "backups",
+            sort_field,
+            async_k8s_client.list_backups,
+            _build_backup_filter(since_ts, until_ts, name_prefix),
+            _build_backup_selector(phases, storage_location, schedule),
+            limit=limit,
+            after=after,
+            reverse=reverse,
+            lower=lower,
+            upper=upper
         )
+        backups = [_convert_backup_to_model(b) for b in backups_cr]
+        
+        if last_entry is not None:
+            response.headers["X-Continue"] = encode_cursor(sort, last_entry)
         
         logger.info(f"Found {len(backups)} backups")
         return backups
@@ -75,28 +232,8 @@ async def create_backup(request: CreateBackupRequest):
     try:
         logger.info(f"Creating backup: {request.name}")
         
-        # Build Backup CR spec
-        backup_spec = {
-            "apiVersion": "velero.io/v1",
-            "kind": "Backup",
-            "metadata": {
-                "name": request.name,
-            },
-            "spec": {}
-        }
-        
-        # Add optional fields
-        if request.included_namespaces:
-            backup_spec["spec"]["includedNamespaces"] = request.included_namespaces
-        
-        if request.excluded_namespaces:
-            backup_spec["spec"]["excludedNamespaces"] = request.excluded_namespaces
-        
-        if request.ttl:
-            backup_spec["spec"]["ttl"] = request.ttl
-        
         # Create backup
-        created_backup_cr = k8s_client.create_backup(backup_spec)
+        created_backup_cr = await async_k8s_client.create_backup(_build_backup_cr(request))
         backup = _convert_backup_to_model(created_backup_cr)
         
         logger.info(f"Backup created successfully: {backup.name}")
@@ -107,6 +244,104 @@ async def create_backup(request: CreateBackupRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/batch", response_model=BatchResult)
+async def create_backups_batch(request: BatchCreateBackupsRequest):
+    """
+    Create many Backups in one call
+    
+    Backups are created concurrently (K8S_BATCH_CONCURRENCY) under the
+    client-side QPS/burst limit; each item reports its own outcome.
+    
+    Args:
+        request: List of backup creation requests
+    
+    Returns:
+        Per-item results
+    """
+    try:
+        logger.info(f"Creating {len(request.backups)} backups")
+        return await run_batch(
+            request.backups,
+            lambda item: async_k8s_client.create_backup(_build_backup_cr(item)),
+            key=lambda item: item.name,
+            limiter=batch_rate_limiter,
+            concurrency=settings.k8s_batch_concurrency
+        )
+    
+    except Exception as e:
+        logger.error(f"Error creating backups: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/batch-delete", response_model=BatchResult, status_code=202)
+async def delete_backups_batch(request: BatchDeleteBackupsRequest):
+    """
+    Delete many Backups in one call
+    
+    Targets are the given names plus every backup matching the selector.
+    Each backup is queued for deletion (DELETE_PARALLELISM at a time) and
+    gets an operation id to follow with GET /api/operations/{id}. With
+    dryRun the matched backups are returned without deleting anything.
+    
+    Args:
+        request: Backup names and/or selector
+    
+    Returns:
+        Per-item results (operationId of each queued deletion)
+    """
+    if not request.names and request.selector is None:
+        raise HTTPException(status_code=400, detail="Either names or selector is required")
+    selector = request.selector
+    if selector is not None and not any((
+        selector.phase, selector.storage_location, selector.schedule, selector.name_prefix, selector.until
+    )):
+        # An empty selector would match (and delete) every backup
+        raise HTTPException(
+            status_code=400,
+            detail="selector needs at least one of phase, storageLocation, schedule, namePrefix or until"
+        )
+    
+    try:
+        names = list(dict.fromkeys(request.names or []))
+        
+        if selector is not None:
+            matched = await informers.select(
+                "backups",
+                _build_backup_selector(set(selector.phase or []), selector.storage_location, selector.schedule),
+                async_k8s_client.list_backups
+            )
+            predicate = _build_backup_filter(
+                None,
+                _format_timestamp(selector.until) if selector.until else None,
+                selector.name_prefix
+            )
+            requested = set(names)
+            names.extend(sorted(
+                b.get("metadata", {}).get("name", "") for b in matched
+                if predicate(b) and b.get("metadata", {}).get("name", "") not in requested
+            ))
+        
+        logger.info(f"Deleting {len(names)} backups (dry run: {request.dry_run})")
+        
+        if request.dry_run:
+            return BatchResult(
+                total=len(names),
+                succeeded=0,
+                failed=0,
+                items=[{"name": name, "ok": True} for name in names]
+            )
+        
+        items = [
+            {"name": name, "ok": True, "operationId": deletion_queue.submit(name).id}
+            for name in names
+        ]
+        return BatchResult(total=len(items), succeeded=len(items), failed=0, items=items)
+    
+    except Exception as e:
+        logger.error(f"Error deleting backups: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/{name}", response_model=Backup)
 async def get_backup(name: str):
     """
@@ -120,7 +355,7 @@ async def get_backup(name: str):
     """
     try:
         logger.info(f"Getting backup: {name}")
-        backup_cr = k8s_client.get_backup(name)
+        backup_cr = await informers.get("backups", name, async_k8s_client.get_backup)
         backup = _convert_backup_to_model(backup_cr)
         return backup
     
@@ -131,21 +366,53 @@ async def get_backup(name: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.delete("/{name}")
+@router.get("/{name}/restores", response_model=List[Restore])
+async def get_backup_restores(name: str):
+    """
+    Get Restores created from a Backup
+    
+    Served from the restore -> backup secondary index (O(matches)).
+    
+    Args:
+        name: Backup name
+    
+    Returns:
+        List of Restore objects (newest first)
+    """
+    try:
+        logger.info(f"Getting restores of backup: {name}")
+        restores_cr = await informers.select(
+            "restores",
+            {"backupName": {name}},
+            async_k8s_client.list_restores
+        )
+        restores_cr.sort(key=start_timestamp_key, reverse=True)
+        return [_convert_restore_to_model(r) for r in restores_cr]
+    
+    except Exception as e:
+        logger.error(f"Error getting restores of backup {name}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/{name}", response_model=OperationStatus, status_code=202)
 async def delete_backup(name: str):
     """
     Delete a Backup
     
+    Queues a DeleteBackupRequest and returns immediately; Velero removes
+    the backup data, snapshots and finally the Backup CR. Follow the
+    returned operation with GET /api/operations/{id}.
+    
     Args:
         name: Backup name
     
     Returns:
-        Success message
+        Queued operation
     """
     try:
         logger.info(f"Deleting backup: {name}")
-        k8s_client.delete_backup(name)
-        return {"message": f"Backup '{name}' deleted successfully"}
+        await informers.get("backups", name, async_k8s_client.get_backup)
+        return deletion_queue.submit(name).to_dict()
     
     except Exception as e:
         logger.error(f"Error deleting backup {name}: {e}")
@@ -155,24 +422,38 @@ async def delete_backup(name: str):
 
 
 @router.get("/{name}/logs")
-async def get_backup_logs(name: str):
+async def get_backup_logs(
+    name: str,
+    tail: Optional[int] = Query(None, ge=1, le=100000, description="Only the last N lines"),
+    start: Optional[int] = Query(None, ge=1, description="First line (1-based)"),
+    end: Optional[int] = Query(None, ge=1, description="Last line (inclusive)")
+):
     """
-    Get Backup logs (download request)
+    Get Backup logs
+    
+    The log is fetched through a Velero DownloadRequest and streamed as
+    decompressed text while it is downloaded.
     
     Args:
         name: Backup name
     
     Returns:
-        Download URL or logs content
+        text/plain stream
     """
     try:
         logger.info(f"Getting backup logs: {name}")
-        logs = k8s_client.get_backup_logs(name)
-        return {"downloadUrl": logs} if logs else {"message": "Logs not available yet"}
+        await informers.get("backups", name, async_k8s_client.get_backup)
+        chunks = await log_fetcher.run(log_fetcher.open, "BackupLog", name, tail=tail, start=start, end=end)
     
+    except LogsNotAvailableError:
+        raise HTTPException(status_code=404, detail=f"Logs of backup '{name}' not available yet")
     except Exception as e:
         logger.error(f"Error getting backup logs {name}: {e}")
+        if "not found" in str(e).lower():
+            raise HTTPException(status_code=404, detail=f"Backup '{name}' not found")
         raise HTTPException(status_code=500, detail=str(e))
+    
+    return StreamingResponse(log_fetcher.stream(chunks), media_type="text/plain; charset=utf-8")
 
 
 @router.get("/{name}/volume-backups")
@@ -180,6 +461,8 @@ async def get_backup_volume_backups(name: str):
     """
     Get PodVolumeBackups for a Backup
     
+    Served from the informer's velero.io/backup-name index.
+    
     Args:
         name: Backup name
     
@@ -188,25 +471,53 @@ async def get_backup_volume_backups(name: str):
     """
     try:
         logger.info(f"Getting volume backups for: {name}")
-        pvbs_raw = k8s_client.list_pod_volume_backups(backup_name=name)
-        
-        pvbs = []
-        for pvb in pvbs_raw:
-            metadata = pvb.get("metadata", {})
-            spec = pvb.get("spec", {})
-            status = pvb.get("status", {})
-            
-            pvbs.append({
-                "name": metadata.get("name", ""),
-                "pvcName": spec.get("pod", {}).get("volumes", [{}])[0].get("pvcName", ""),
-                "volumeName": spec.get("volume", ""),
-                "phase": status.get("phase", "New"),
-                "message": status.get("message", ""),
-                "progress": status.get("progress", {})
-            })
-        
-        return pvbs
+        pvbs_raw = await informers.select(
+            "podvolumebackups",
+            {"backupName": {name}},
+            lambda: async_k8s_client.list_pod_volume_backups(backup_name=name)
+        )
+        return [_convert_pod_volume_backup(pvb) for pvb in pvbs_raw]
     
     except Exception as e:
         logger.error(f"Error getting volume backups {name}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{name}/progress")
+async def get_backup_progress(name: str):
+    """
+    Get pod volume backup progress of a Backup
+    
+    Aggregated from watch events: bytesDone/totalBytes, current and average
+    throughput (bytes/s) and ETA, overall and per node.
+    
+    Args:
+        name: Backup name
+    
+    Returns:
+        Progress report
+    """
+    try:
+        return await get_progress(
+            "backup",
+            name,
+            "podvolumebackups",
+            lambda: async_k8s_client.list_pod_volume_backups(backup_name=name)
+        )
+    
+    except Exception as e:
+        logger.error(f"Error getting backup progress {name}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{name}/progress/stream")
+async def stream_backup_progress(name: str, request: Request):
+    """
+    Stream pod volume backup progress of a Backup (Server-Sent Events)
+    
+    Each `progress` message has the same payload as /progress.
+    
+    Args:
+        name: Backup name
+    """
+    return progress_stream(request, "backup", name)
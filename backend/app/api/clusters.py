@@ -0,0 +1,131 @@
+"""
+Velero Dashboard Backend - Clusters API
+
+멀티 클러스터 교차 조회 엔드포인트 (fan-out)
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from collections import Counter
+from typing import List, Optional, Dict
+import logging
+
+from app.models.velero import FederatedResponse
+from app.services.federation import federation, ClusterMember
+from app.api.backups import _convert_backup_to_model
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/clusters", tags=["clusters"])
+
+
+def _parse_clusters(clusters: Optional[str]) -> Optional[List[str]]:
+    if not clusters:
+        return None
+    names = [c.strip() for c in clusters.split(",") if c.strip()]
+    unknown = [name for name in names if name not in federation.members]
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Unknown cluster(s): {', '.join(unknown)}")
+    return names
+
+
+def _federated_response(results: List[dict]) -> FederatedResponse:
+    return FederatedResponse(
+        results=results,
+        partial=any(not r["ok"] for r in results)
+    )
+
+
+async def _phase_counts(member: ClusterMember, plural: str) -> Dict[str, int]:
+    """Phase counts from the cluster's phase index (full list before sync)"""
+    informer = member.informers.informer(plural)
+    if informer.has_synced():
+        return informer.index_counts("phase")
+    fallback = getattr(member.async_client, f"list_{plural}")
+    return dict(Counter(
+        item.get("status", {}).get("phase", "New") for item in await fallback()
+    ))
+
+
+@router.get("")
+async def list_clusters():
+    """
+    List clusters served by this backend
+    
+    Returns:
+        Cluster names with cache sync state
+    """
+    return [
+        {
+            "name": member.name,
+            "local": member.local,
+            "synced": all(s["synced"] for s in member.informers.status()),
+        }
+        for member in federation.members.values()
+    ]
+
+
+@router.get("/summary", response_model=FederatedResponse)
+async def get_clusters_summary(
+    clusters: Optional[str] = Query(None, description="Comma-separated cluster names (default: all)")
+):
+    """
+    Backup/restore counts per phase for every cluster
+    
+    Clusters are queried concurrently with a per-cluster timeout; failed or
+    slow clusters are reported with ok=false and the response is partial.
+    
+    Returns:
+        FederatedResponse with {backups: {phase: count}, restores: {...}} per cluster
+    """
+    names = _parse_clusters(clusters)
+    
+    async def query(member: ClusterMember) -> dict:
+        return {
+            "backups": await _phase_counts(member, "backups"),
+            "restores": await _phase_counts(member, "restores"),
+        }
+    
+    try:
+        return _federated_response(await federation.fan_out(query, names))
+    except Exception as e:
+        logger.error(f"Error building cluster summary: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/backups", response_model=FederatedResponse)
+async def list_clusters_backups(
+    clusters: Optional[str] = Query(None, description="Comma-separated cluster names (default: all)"),
+    phase: Optional[str] = Query(None, description="Comma-separated phases, e.g. Failed,PartiallyFailed"),
+    limit: int = Query(50, ge=1, le=1000, description="Newest backups per cluster")
+):
+    """
+    List Backups across clusters
+    
+    Each cluster is answered from its own informer cache and indexes.
+    
+    Returns:
+        FederatedResponse with a list of Backup objects per cluster
+    """
+    names = _parse_clusters(clusters)
+    selector = {"phase": {p.strip() for p in phase.split(",") if p.strip()}} if phase else None
+    
+    async def query(member: ClusterMember) -> list:
+        backups_cr, _ = await member.informers.query(
+            "backups",
+            "startTimestamp",
+            member.async_client.list_backups,
+            lambda _: True,
+            selector,
+            limit=limit,
+            reverse=True
+        )
+        return [
+            _convert_backup_to_model(b).model_dump(by_alias=True)
+            for b in backups_cr
+        ]
+    
+    try:
+        return _federated_response(await federation.fan_out(query, names))
+    except Exception as e:
+        logger.error(f"Error listing backups across clusters: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,201 @@
+"""
+Velero Dashboard Backend - Data Mover API
+
+CSI snapshot data mover (DataUpload/DataDownload) 조회, 노드별 대기열, 정체 감지 엔드포인트
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional, Set, Dict, Any, Callable, Awaitable
+import logging
+import time
+
+from app.services.k8s_client import async_k8s_client
+from app.services.informer import informers
+from app.services.indexes import node_index
+from app.services.transfers import transfer_tracker
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/datamover", tags=["datamover"])
+
+DATA_MOVER_PLURALS = {"datauploads", "datadownloads"}
+
+
+def _transfer_fields(obj: dict) -> dict:
+    """Fields shared by DataUpload and DataDownload"""
+    metadata = obj.get("metadata", {})
+    spec = obj.get("spec", {})
+    status = obj.get("status", {})
+    nodes = node_index(obj)
+    
+    return {
+        "name": metadata.get("name", ""),
+        "dataMover": spec.get("datamover") or "velero",
+        "storageLocation": spec.get("backupStorageLocation", ""),
+        "node": nodes[0] if nodes else "",
+        "phase": status.get("phase", "New"),
+        "message": status.get("message", ""),
+        "progress": status.get("progress", {}),
+        "createdTimestamp": metadata.get("creationTimestamp"),
+        "startTimestamp": status.get("startTimestamp"),
+        "completionTimestamp": status.get("completionTimestamp")
+    }
+
+
+def _convert_data_upload(du: dict) -> dict:
+    """Convert Kubernetes DataUpload CR to API dict"""
+    spec = du.get("spec", {})
+    
+    return {
+        **_transfer_fields(du),
+        "backupName": du.get("metadata", {}).get("labels", {}).get("velero.io/backup-name", ""),
+        "pvc": f"{spec.get('sourceNamespace', '')}/{spec.get('sourcePVC', '')}",
+        "snapshotType": spec.get("snapshotType", ""),
+        "snapshotID": du.get("status", {}).get("snapshotID", "")
+    }
+
+
+def _convert_data_download(dd: dict) -> dict:
+    """Convert Kubernetes DataDownload CR to API dict"""
+    spec = dd.get("spec", {})
+    target = spec.get("targetVolume", {})
+    
+    return {
+        **_transfer_fields(dd),
+        "restoreName": dd.get("metadata", {}).get("labels", {}).get("velero.io/restore-name", ""),
+        "pvc": f"{target.get('namespace', '')}/{target.get('pvc', '')}",
+        "snapshotID": spec.get("snapshotID", "")
+    }
+
+
+async def _list_transfers(
+    plural: str,
+    selector: Dict[str, Set[str]],
+    fallback: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    convert: Callable[[dict], dict]
+) -> List[dict]:
+    """
+    Data mover CRs matching a selector, newest first, with live throughput
+    
+    bytesPerSecond/etaSeconds/stalled come from the transfer tracker (watch
+    samples); they are absent until its informers have synced.
+    """
+    objects = await informers.select(plural, selector, fallback)
+    objects.sort(key=lambda o: o.get("metadata", {}).get("creationTimestamp", ""), reverse=True)
+    
+    now = time.time()
+    live = transfer_tracker.lookup(plural, objects)
+    results = []
+    for obj in objects:
+        result = convert(obj)
+        item = live.get(result["name"])
+        if item is not None:
+            tracked = item.to_dict(now)
+            result["bytesPerSecond"] = tracked["bytesPerSecond"]
+            result["etaSeconds"] = tracked["etaSeconds"]
+            result["stalled"] = tracked["stalled"]
+        results.append(result)
+    return results
+
+
+def _build_selector(owner_index: str, owner: Optional[str], node: Optional[str], phase: Optional[str]) -> Dict[str, Set[str]]:
+    selector: Dict[str, Set[str]] = {}
+    if owner:
+        selector[owner_index] = {owner}
+    if node:
+        selector["node"] = {node}
+    if phase:
+        selector["phase"] = {p.strip() for p in phase.split(",") if p.strip()}
+    return selector
+
+
+@router.get("/uploads")
+async def list_data_uploads(
+    backup: Optional[str] = Query(None, description="Backup name"),
+    node: Optional[str] = Query(None),
+    phase: Optional[str] = Query(None, description="Comma-separated, e.g. InProgress,Accepted")
+):
+    """
+    List DataUploads (CSI snapshot data mover, backup side)
+    
+    Served from the informer's backup/node/phase indexes.
+    
+    Returns:
+        DataUploads with live throughput, ETA and stall reason
+    """
+    try:
+        return await _list_transfers(
+            "datauploads",
+            _build_selector("backupName", backup, node, phase),
+            lambda: async_k8s_client.list_data_uploads(backup_name=backup),
+            _convert_data_upload
+        )
+    
+    except Exception as e:
+        logger.error(f"Error listing data uploads: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/downloads")
+async def list_data_downloads(
+    restore: Optional[str] = Query(None, description="Restore name"),
+    node: Optional[str] = Query(None),
+    phase: Optional[str] = Query(None, description="Comma-separated, e.g. InProgress,Accepted")
+):
+    """
+    List DataDownloads (CSI snapshot data mover, restore side)
+    
+    Served from the informer's restore/node/phase indexes.
+    
+    Returns:
+        DataDownloads with live throughput, ETA and stall reason
+    """
+    try:
+        return await _list_transfers(
+            "datadownloads",
+            _build_selector("restoreName", restore, node, phase),
+            lambda: async_k8s_client.list_data_downloads(restore_name=restore),
+            _convert_data_download
+        )
+    
+    except Exception as e:
+        logger.error(f"Error listing data downloads: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/nodes")
+async def list_data_mover_nodes():
+    """
+    Data mover load per node
+    
+    Running and queued (New/Accepted/Prepared) DataUploads/DataDownloads per
+    node; transfers not yet accepted by a node are reported under node "".
+    
+    Returns:
+        Per-node queue depth, throughput, ETA and stalled count
+    """
+    try:
+        return transfer_tracker.node_queues(DATA_MOVER_PLURALS)
+    
+    except Exception as e:
+        logger.error(f"Error getting data mover nodes: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/stalled")
+async def list_stalled_data_movers():
+    """
+    Stuck data mover transfers
+    
+    Transfers queued, or running without bytesDone progress, for longer than
+    TRANSFER_STALL_SECONDS.
+    
+    Returns:
+        Stalled transfers with the reason
+    """
+    try:
+        return transfer_tracker.stalled(DATA_MOVER_PLURALS)
+    
+    except Exception as e:
+        logger.error(f"Error listing stalled data movers: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,109 @@
+"""
+Velero Dashboard Backend - Events API
+
+CR 변경 사항 실시간 스트리밍 (Server-Sent Events)
+"""
+
+from fastapi import APIRouter, Header, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Optional, AsyncIterator, Dict, Any
+import asyncio
+import json
+import logging
+
+from app.config import settings
+from app.services.event_bus import event_broadcaster
+from app.services.informer import informers
+from app.api.backups import _convert_backup_to_model, _convert_pod_volume_backup
+from app.api.restores import _convert_restore_to_model, _convert_pod_volume_restore
+from app.api.schedules import _convert_schedule_to_model
+from app.api.storage import _convert_bsl_to_model
+from app.api.datamover import _convert_data_upload, _convert_data_download
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/events", tags=["events"])
+
+# plural -> CR to API payload (same shape as the list endpoints)
+EVENT_SERIALIZERS = {
+    "backups": lambda cr: _convert_backup_to_model(cr).model_dump(by_alias=True),
+    "restores": lambda cr: _convert_restore_to_model(cr).model_dump(by_alias=True),
+    "schedules": lambda cr: _convert_schedule_to_model(cr).model_dump(by_alias=True),
+    "backupstoragelocations": lambda cr: _convert_bsl_to_model(cr).model_dump(by_alias=True),
+    "podvolumebackups": _convert_pod_volume_backup,
+    "podvolumerestores": _convert_pod_volume_restore,
+    "datauploads": _convert_data_upload,
+    "datadownloads": _convert_data_download,
+}
+
+
+def register_event_handlers() -> None:
+    """Publish informer changes to the event broadcaster (call before informers start)"""
+    event_broadcaster.attach(informers, EVENT_SERIALIZERS)
+
+
+def _format_sse(event: Dict[str, Any]) -> str:
+    """Format an event as a text/event-stream message"""
+    lines = []
+    if event.get("id"):
+        lines.append(f"id: {event['id']}")
+    lines.append(f"event: {event['event']}")
+    lines.append(f"data: {json.dumps(event['data'], separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+@router.get("")
+async def stream_events(
+    request: Request,
+    resources: Optional[str] = Query(
+        None,
+        description=f"Comma-separated plurals (default: all of {', '.join(EVENT_SERIALIZERS)})"
+    ),
+    since: Optional[str] = Query(None, description="Resume cursor (same as Last-Event-ID)"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID")
+):
+    """
+    Stream add/modify/delete deltas of Velero CRs (Server-Sent Events)
+    
+    Each message has `event: <plural>` and a JSON payload
+    `{type, resource, name, resourceVersion, object}` where `object` has the
+    same shape as the corresponding list endpoint item.
+    
+    The first message is `sync` (carrying the current cursor) or the replay
+    of events missed since `Last-Event-ID`. A `resync` message means the
+    cursor can no longer be resumed and the client must refetch its lists.
+    """
+    wanted = {r.strip() for r in resources.split(",") if r.strip()} if resources else None
+    subscription, initial = event_broadcaster.subscribe(wanted, last_event_id or since)
+    logger.info(f"Event stream opened ({event_broadcaster.subscriber_count()} subscribers)")
+    
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            for event in initial:
+                yield _format_sse(event)
+            
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.queue.get(),
+                        timeout=settings.event_heartbeat_seconds
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                
+                yield _format_sse(event)
+                if subscription.overflowed and event["event"] == "resync":
+                    break
+        finally:
+            event_broadcaster.unsubscribe(subscription)
+            logger.info("Event stream closed")
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        }
+    )
@@ -0,0 +1,149 @@
+"""
+Velero Dashboard Backend - History API
+
+종료된 백업/복원 이력 조회 엔드포인트 (CR 삭제 후에도 유지)
+"""
+
+from fastapi import APIRouter, HTTPException, Query, Response
+from typing import Optional, List, Tuple
+from datetime import datetime, timedelta, timezone
+import logging
+
+from app.services.history import history_store
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/history", tags=["history"])
+
+
+def _split(value: Optional[str]) -> Optional[List[str]]:
+    return [v.strip() for v in value.split(",") if v.strip()] if value else None
+
+
+def _completion_bound(name: str, value: Optional[str]) -> Optional[str]:
+    """
+    Normalize an RFC3339 bound to the stored format (UTC, whole seconds)
+    
+    Stored timestamps have whole seconds, so a fractional bound is rounded
+    up: ">= 10:00:00.5" and "< 10:00:00.5" become ">= / < 10:00:01".
+    
+    Raises:
+        HTTPException: 400 when the value is not an RFC3339 timestamp
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name} '{value}', expected RFC3339")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    if parsed.microsecond:
+        parsed = parsed.replace(microsecond=0) + timedelta(seconds=1)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _completion_range(since: Optional[str], until: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    return _completion_bound("since", since), _completion_bound("until", until)
+
+
+@router.get("/backups")
+async def get_backup_history(
+    response: Response,
+    since: Optional[str] = Query(None, description="Completed at or after (RFC3339)"),
+    until: Optional[str] = Query(None, description="Completed before (RFC3339)"),
+    schedule: Optional[str] = Query(None),
+    phase: Optional[str] = Query(None, description="Comma-separated, e.g. Failed,PartiallyFailed"),
+    limit: int = Query(100, ge=1, le=1000),
+    continue_token: Optional[int] = Query(None, alias="continue", description="Token from the X-Continue header of the previous page")
+):
+    """
+    History of finished backups, newest completion first
+    
+    Served from the local history database, so backups already expired
+    (garbage-collected by Velero) are included with their deletedAt time.
+    
+    Returns:
+        List of backup summaries
+    """
+    since, until = _completion_range(since, until)
+    
+    try:
+        runs, next_before = await history_store.run(
+            history_store.query,
+            "backup",
+            since=since,
+            until=until,
+            schedule=schedule,
+            phases=_split(phase),
+            limit=limit,
+            before=continue_token
+        )
+        
+        if next_before is not None:
+            response.headers["X-Continue"] = str(next_before)
+        
+        return runs
+    
+    except Exception as e:
+        logger.error(f"Error getting backup history: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/restores")
+async def get_restore_history(
+    response: Response,
+    since: Optional[str] = Query(None, description="Completed at or after (RFC3339)"),
+    until: Optional[str] = Query(None, description="Completed before (RFC3339)"),
+    schedule: Optional[str] = Query(None, description="Restores of this schedule's backups"),
+    backup: Optional[str] = Query(None, description="Source backup name"),
+    phase: Optional[str] = Query(None, description="Comma-separated, e.g. Failed,PartiallyFailed"),
+    limit: int = Query(100, ge=1, le=1000),
+    continue_token: Optional[int] = Query(None, alias="continue", description="Token from the X-Continue header of the previous page")
+):
+    """
+    History of finished restores, newest completion first
+    
+    Returns:
+        List of restore summaries
+    """
+    since, until = _completion_range(since, until)
+    
+    try:
+        runs, next_before = await history_store.run(
+            history_store.query,
+            "restore",
+            since=since,
+            until=until,
+            schedule=schedule,
+            backup_name=backup,
+            phases=_split(phase),
+            limit=limit,
+            before=continue_token
+        )
+        
+        if next_before is not None:
+            response.headers["X-Continue"] = str(next_before)
+        
+        return runs
+    
+    except Exception as e:
+        logger.error(f"Error getting restore history: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/stats")
+async def get_history_stats():
+    """
+    Get history database statistics
+    
+    Returns:
+        Runs per kind and phase, oldest completion, runs whose CR is gone
+        and database size
+    """
+    try:
+        return await history_store.run(history_store.stats)
+    
+    except Exception as e:
+        logger.error(f"Error getting history stats: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
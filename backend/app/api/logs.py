@@ -0,0 +1,87 @@
+"""
+Velero Dashboard Backend - Logs API
+
+백업/복원 로그 전문 검색 엔드포인트
+"""
+
+from fastapi import APIRouter, HTTPException, Query, Response
+from typing import Optional
+import logging
+
+from app.services.log_index import log_index, log_indexer
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/logs", tags=["logs"])
+
+
+@router.get("/search")
+async def search_logs(
+    response: Response,
+    q: Optional[str] = Query(None, description="Full-text query (FTS5 syntax or plain words)"),
+    level: Optional[str] = Query(None, description="Comma-separated levels, e.g. error,warning"),
+    backup: Optional[str] = Query(None, description="Only the log of this backup"),
+    restore: Optional[str] = Query(None, description="Only the log of this restore"),
+    namespace: Optional[str] = Query(None),
+    resource: Optional[str] = Query(None, description="e.g. persistentvolumeclaims"),
+    limit: int = Query(100, ge=1, le=1000),
+    continue_token: Optional[int] = Query(None, alias="continue", description="Token from the X-Continue header of the previous page")
+):
+    """
+    Search indexed backup/restore logs
+    
+    Logs of finished backups and restores are indexed automatically; the
+    search runs against the local full-text index, newest records first.
+    
+    Returns:
+        List of log records {id, kind, name, line, time, level, resource,
+        namespace, item, msg, error}
+    """
+    if backup and restore:
+        raise HTTPException(status_code=400, detail="Use either backup or restore, not both")
+    
+    try:
+        logger.info(f"Searching logs: q={q}")
+        levels = [l.strip() for l in level.split(",") if l.strip()] if level else None
+        kind = name = None
+        if backup:
+            kind, name = "BackupLog", backup
+        elif restore:
+            kind, name = "RestoreLog", restore
+        
+        records, next_before = await log_indexer.run(
+            log_index.search,
+            q=q,
+            levels=levels,
+            kind=kind,
+            name=name,
+            namespace=namespace,
+            resource=resource,
+            limit=limit,
+            before=continue_token
+        )
+        
+        if next_before is not None:
+            response.headers["X-Continue"] = str(next_before)
+        
+        return records
+    
+    except Exception as e:
+        logger.error(f"Error searching logs: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/index")
+async def get_log_index_status():
+    """
+    Get log index statistics
+    
+    Returns:
+        {runs, lines, bytes}
+    """
+    try:
+        return await log_indexer.run(log_index.stats)
+    
+    except Exception as e:
+        logger.error(f"Error reading log index: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,115 @@
+"""
+Velero Dashboard Backend - Metrics API
+
+Prometheus /metrics 엔드포인트와 Velero 도메인 지표 (단계별 백업/복원 수,
+스케줄별 마지막 성공 백업 경과 시간, 노드별 전송 중인 바이트)
+
+도메인 지표는 scrape 시점에 summary/transfer/informer 캐시에서 계산되므로
+API server 호출을 만들지 않습니다.
+"""
+
+from fastapi import APIRouter, Response
+from prometheus_client import REGISTRY, CONTENT_TYPE_LATEST, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from datetime import datetime
+from typing import Iterator
+import logging
+import time
+
+from app.services.informer import informers
+from app.services.metrics import NAMESPACE
+from app.services.repositories import repository_health
+from app.services.summary import summary_aggregator
+from app.services.transfers import transfer_tracker
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["metrics"])
+
+
+class VeleroCollector(Collector):
+    """Velero-domain gauges computed from the in-memory caches at scrape time"""
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        now = time.time()
+        snapshot = summary_aggregator.snapshot()
+        
+        for kind in ("backups", "restores"):
+            family = GaugeMetricFamily(
+                f"{NAMESPACE}_{kind}",
+                f"Velero {kind} by phase",
+                labels=["phase"]
+            )
+            for phase, count in sorted(snapshot[kind]["byPhase"].items()):
+                family.add_metric([phase], count)
+            yield family
+        
+        last_success = GaugeMetricFamily(
+            f"{NAMESPACE}_schedule_last_success_age_seconds",
+            "Seconds since the last successful backup of each schedule",
+            labels=["schedule"]
+        )
+        for schedule, backup in sorted(snapshot["lastSuccessfulBackups"].items()):
+            if not backup["completionTimestamp"]:
+                continue
+            completed = datetime.fromisoformat(backup["completionTimestamp"].replace("Z", "+00:00"))
+            last_success.add_metric([schedule], max(now - completed.timestamp(), 0.0))
+        yield last_success
+        
+        yield from self._transfers()
+        yield from self._repositories(now)
+
+    def _transfers(self) -> Iterator[GaugeMetricFamily]:
+        remaining = GaugeMetricFamily(
+            f"{NAMESPACE}_transfer_bytes_remaining",
+            "Bytes left to move by running and queued volume transfers",
+            labels=["kind", "node"]
+        )
+        rate = GaugeMetricFamily(
+            f"{NAMESPACE}_transfer_bytes_per_second",
+            "Smoothed throughput of running volume transfers",
+            labels=["kind", "node"]
+        )
+        active = GaugeMetricFamily(
+            f"{NAMESPACE}_transfers_active",
+            "Running and queued volume transfers",
+            labels=["kind", "node"]
+        )
+        for node, items in sorted(transfer_tracker.active_by_node().items()):
+            by_kind = {}
+            for item in items:
+                by_kind.setdefault(item.plural, []).append(item)
+            for kind, kind_items in sorted(by_kind.items()):
+                labels = [kind, node]
+                remaining.add_metric(labels, sum(max(i.total_bytes - i.bytes_done, 0) for i in kind_items))
+                rate.add_metric(labels, sum(i.rate for i in kind_items))
+                active.add_metric(labels, len(kind_items))
+        yield remaining
+        yield rate
+        yield active
+
+    def _repositories(self, now: float) -> Iterator[GaugeMetricFamily]:
+        informer = informers.informers.get("backuprepositories")
+        if informer is None or not informer.has_synced():
+            return
+        lag = GaugeMetricFamily(
+            f"{NAMESPACE}_repository_maintenance_lag_seconds",
+            "Seconds since the last maintenance of each backup repository",
+            labels=["repository", "storage_location"]
+        )
+        for repo in informer.list():
+            health = repository_health(repo, now)
+            if health["lagSeconds"] is not None:
+                lag.add_metric([health["name"], health["storageLocation"]], health["lagSeconds"])
+        yield lag
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus exposition of the process, request and Velero metrics"""
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+
+# Global collector registration
+REGISTRY.register(VeleroCollector())
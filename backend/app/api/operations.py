@@ -0,0 +1,46 @@
+"""
+Velero Dashboard Backend - Operations API
+
+비동기 작업(백업 삭제) 진행 상태 조회 엔드포인트
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional
+import logging
+
+from app.models.velero import OperationStatus
+from app.services.operations import deletion_queue
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/operations", tags=["operations"])
+
+
+@router.get("", response_model=List[OperationStatus])
+async def list_operations(
+    state: Optional[str] = Query(None, description="Queued, InProgress, Completed or Failed")
+):
+    """
+    List tracked operations (newest first)
+    
+    Returns:
+        List of operations
+    """
+    return [op.to_dict() for op in deletion_queue.list(state)]
+
+
+@router.get("/{operation_id}", response_model=OperationStatus)
+async def get_operation(operation_id: str):
+    """
+    Get an operation
+    
+    Args:
+        operation_id: Id returned when the operation was submitted
+    
+    Returns:
+        Operation status
+    """
+    operation = deletion_queue.get(operation_id)
+    if operation is None:
+        raise HTTPException(status_code=404, detail=f"Operation '{operation_id}' not found")
+    return operation.to_dict()
@@ -4,8 +4,9 @@ Velero Dashboard Backend - Restores API
 Restore 생성 및 조회 엔드포인트
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
 import logging
 import yaml
 
@@ -15,7 +16,10 @@ from app.models.velero import (
     CreateRestoreWithModificationsRequest,
     ResourceModifierRule
 )
-from app.services.k8s_client import k8s_client
+from app.services.k8s_client import async_k8s_client
+from app.services.informer import informers
+from app.services.log_fetcher import log_fetcher, LogsNotAvailableError
+from app.api.transfers import get_progress, progress_stream
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +89,26 @@ def _convert_restore_to_model(restore_cr: dict) -> Restore:
     )
 
 
+def _convert_pod_volume_restore(pvr: dict) -> dict:
+    """Convert Kubernetes PodVolumeRestore CR to API dict"""
+    metadata = pvr.get("metadata", {})
+    spec = pvr.get("spec", {})
+    status = pvr.get("status", {})
+    pod = spec.get("pod", {})
+    
+    return {
+        "name": metadata.get("name", ""),
+        "pod": f"{pod.get('namespace', '')}/{pod.get('name', '')}",
+        "volumeName": spec.get("volume", ""),
+        "node": status.get("node", ""),
+        "phase": status.get("phase", "New"),
+        "message": status.get("message", ""),
+        "progress": status.get("progress", {}),
+        "startTimestamp": status.get("startTimestamp"),
+        "completionTimestamp": status.get("completionTimestamp")
+    }
+
+
 @router.get("", response_model=List[Restore])
 async def list_restores():
     """
@@ -95,7 +119,7 @@ async def list_restores():
     """
     try:
         logger.info("Listing restores")
-        restores_cr = k8s_client.list_restores()
+        restores_cr = await informers.list("restores", async_k8s_client.list_restores)
         restores = [_convert_restore_to_model(r) for r in restores_cr]
         
         # Sort by start timestamp (descending)
@@ -146,7 +170,7 @@ async def create_restore(request: CreateRestoreRequest):
             restore_spec["spec"]["excludedNamespaces"] = request.excluded_namespaces
         
         # Create restore
-        created_restore_cr = k8s_client.create_restore(restore_spec)
+        created_restore_cr = await async_k8s_client.create_restore(restore_spec)
         restore = _convert_restore_to_model(created_restore_cr)
         
         logger.info(f"Restore created successfully: {restore.name}")
@@ -200,7 +224,7 @@ async def create_restore_with_modifications(request: CreateRestoreWithModificati
         configmap_name = f"restore-resource-modifiers-{request.name}"
         modifiers_yaml = _build_resource_modifiers_yaml(request.resource_modifier_rules)
         
-        k8s_client.create_config_map(
+        await async_k8s_client.create_config_map(
             name=configmap_name,
             data={"resource-modifiers.yaml": modifiers_yaml},
             labels={
@@ -235,7 +259,7 @@ async def create_restore_with_modifications(request: CreateRestoreWithModificati
             restore_spec["spec"]["excludedNamespaces"] = request.excluded_namespaces
         
         # 3. Create restore
-        created_restore_cr = k8s_client.create_restore(restore_spec)
+        created_restore_cr = await async_k8s_client.create_restore(restore_spec)
         restore = _convert_restore_to_model(created_restore_cr)
         
         logger.info(f"Restore with modifications created successfully: {restore.name}")
@@ -248,7 +272,7 @@ async def create_restore_with_modifications(request: CreateRestoreWithModificati
         # Try to cleanup ConfigMap if restore creation failed
         if configmap_name:
             try:
-                k8s_client.delete_config_map(configmap_name)
+                await async_k8s_client.delete_config_map(configmap_name)
                 logger.info(f"Cleaned up ConfigMap {configmap_name} after failure")
             except Exception as cleanup_error:
                 logger.warning(f"Failed to cleanup ConfigMap: {cleanup_error}")
@@ -269,7 +293,7 @@ async def get_restore(name: str):
     """
     try:
         logger.info(f"Getting restore: {name}")
-        restore_cr = k8s_client.get_restore(name)
+        restore_cr = await informers.get("restores", name, async_k8s_client.get_restore)
         restore = _convert_restore_to_model(restore_cr)
         return restore
     
@@ -281,21 +305,102 @@ async def get_restore(name: str):
 
 
 @router.get("/{name}/logs")
-async def get_restore_logs(name: str):
+async def get_restore_logs(
+    name: str,
+    tail: Optional[int] = Query(None, ge=1, le=100000, description="Only the last N lines"),
+    start: Optional[int] = Query(None, ge=1, description="First line (1-based)"),
+    end: Optional[int] = Query(None, ge=1, description="Last line (inclusive)")
+):
     """
-    Get Restore logs (download request)
+    Get Restore logs
+    
+    The log is fetched through a Velero DownloadRequest and streamed as
+    decompressed text while it is downloaded.
     
     Args:
         name: Restore name
     
     Returns:
-        Download URL or logs content
+        text/plain stream
     """
     try:
         logger.info(f"Getting restore logs: {name}")
-        logs = k8s_client.get_restore_logs(name)
-        return {"downloadUrl": logs} if logs else {"message": "Logs not available yet"}
+        await informers.get("restores", name, async_k8s_client.get_restore)
+        chunks = await log_fetcher.run(log_fetcher.open, "RestoreLog", name, tail=tail, start=start, end=end)
     
+    except LogsNotAvailableError:
+        raise HTTPException(status_code=404, detail=f"Logs of restore '{name}' not available yet")
     except Exception as e:
         logger.error(f"Error getting restore logs {name}: {e}")
+        if "not found" in str(e).lower():
+            raise HTTPException(status_code=404, detail=f"Restore '{name}' not found")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return StreamingResponse(log_fetcher.stream(chunks), media_type="text/plain; charset=utf-8")
+
+
+@router.get("/{name}/volume-restores")
+async def get_restore_volume_restores(name: str):
+    """
+    Get PodVolumeRestores for a Restore
+    
+    Served from the informer's velero.io/restore-name index.
+    
+    Args:
+        name: Restore name
+    
+    Returns:
+        List of PodVolumeRestore objects
+    """
+    try:
+        logger.info(f"Getting volume restores for: {name}")
+        pvrs_raw = await informers.select(
+            "podvolumerestores",
+            {"restoreName": {name}},
+            lambda: async_k8s_client.list_pod_volume_restores(restore_name=name)
+        )
+        return [_convert_pod_volume_restore(pvr) for pvr in pvrs_raw]
+    
+    except Exception as e:
+        logger.error(f"Error getting volume restores {name}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{name}/progress")
+async def get_restore_progress(name: str):
+    """
+    Get pod volume restore progress of a Restore
+    
+    Aggregated from watch events: bytesDone/totalBytes, current and average
+    throughput (bytes/s) and ETA, overall and per node.
+    
+    Args:
+        name: Restore name
+    
+    Returns:
+        Progress report
+    """
+    try:
+        return await get_progress(
+            "restore",
+            name,
+            "podvolumerestores",
+            lambda: async_k8s_client.list_pod_volume_restores(restore_name=name)
+        )
+    
+    except Exception as e:
+        logger.error(f"Error getting restore progress {name}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{name}/progress/stream")
+async def stream_restore_progress(name: str, request: Request):
+    """
+    Stream pod volume restore progress of a Restore (Server-Sent Events)
+    
+    Each `progress` message has the same payload as /progress.
+    
+    Args:
+        name: Restore name
+    """
+    return progress_stream(request, "restore", name)
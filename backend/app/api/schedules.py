@@ -4,12 +4,23 @@ Velero Dashboard Backend - Schedules API
 Schedule 생성, 조회, 삭제 엔드포인트
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional, Literal, Dict, Any, Tuple
 import logging
 
-from app.models.velero import Schedule, CreateScheduleRequest, ScheduleTemplate
-from app.services.k8s_client import k8s_client
+from app.models.velero import (
+    Backup, Schedule, CreateScheduleRequest, ScheduleTemplate,
+    ScheduleSelector, BatchUpdateSchedulesRequest, StaggerSchedulesRequest,
+    BatchResult, StaggerResult
+)
+from app.services.k8s_client import async_k8s_client
+from app.services.informer import informers
+from app.services.batch import run_batch, batch_rate_limiter
+from app.services.cron import stagger
+from app.services.indexes import start_timestamp_key
+from app.services.forecast import schedule_forecaster
+from app.config import settings
+from app.api.backups import _convert_backup_to_model
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +47,7 @@ def _convert_schedule_to_model(schedule_cr: dict) -> Schedule:
         name=metadata.get("name", ""),
         schedule=spec.get("schedule", ""),
         last_backup=status.get("lastBackup"),
+        next_run_time=schedule_forecaster.next_run(schedule_cr),
         enabled=not spec.get("paused", False),
         template=template
     )
@@ -51,7 +63,7 @@ async def list_schedules():
     """
     try:
         logger.info("Listing schedules")
-        schedules_cr = k8s_client.list_schedules()
+        schedules_cr = await informers.list("schedules", async_k8s_client.list_schedules)
         schedules = [_convert_schedule_to_model(s) for s in schedules_cr]
         
         logger.info(f"Found {len(schedules)} schedules")
@@ -62,6 +74,199 @@ async def list_schedules():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/forecast")
+async def get_schedule_forecast(
+    hours: Optional[float] = Query(None, gt=0, le=168, description="Horizon (default FORECAST_HORIZON_HOURS)"),
+    slot_minutes: Optional[int] = Query(None, ge=1, le=1440, description="Timeline slot (default FORECAST_SLOT_MINUTES)"),
+    runs: int = Query(5, ge=1, le=100, description="Next runs listed per schedule"),
+    duration: Literal["p50", "p95"] = Query("p50", description="Historical duration assumed per run"),
+    threshold: Optional[int] = Query(None, ge=1, description="Concurrency reported as a collision (default SCHEDULE_COLLISION_THRESHOLD)")
+):
+    """
+    Forecast schedule runs and backup-window collisions
+    
+    Next runs come from each schedule's cached cron evaluation (CRON_TZ and
+    @every supported); every run is overlaid with the schedule's historical
+    backup duration to predict how many backups run at once.
+    
+    Returns:
+        Per-schedule next runs and estimated duration, timeline slots, the
+        concurrency peak and the time ranges at or above the threshold
+    """
+    try:
+        schedules_cr = await informers.list("schedules", async_k8s_client.list_schedules)
+        return schedule_forecaster.forecast(
+            schedules_cr,
+            hours=hours or settings.forecast_horizon_hours,
+            slot_minutes=slot_minutes or settings.forecast_slot_minutes,
+            runs=runs,
+            duration=duration,
+            threshold=threshold or settings.schedule_collision_threshold
+        )
+    
+    except Exception as e:
+        logger.error(f"Error forecasting schedules: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _select_schedules(selector: ScheduleSelector) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Resolve the schedules of a batch request
+    
+    Returns:
+        (matched Schedule CRs in request order then by name, failed items
+        of requested names that do not exist)
+    """
+    if selector.name_prefix is not None and not selector.name_prefix.strip():
+        raise HTTPException(status_code=400, detail="namePrefix must not be blank")
+    if not selector.names and selector.name_prefix is None:
+        raise HTTPException(status_code=400, detail="Either names or namePrefix is required")
+    
+    schedules_cr = await informers.list("schedules", async_k8s_client.list_schedules)
+    by_name = {s.get("metadata", {}).get("name", ""): s for s in schedules_cr}
+    
+    names = list(dict.fromkeys(selector.names or []))
+    missing = [
+        {"name": name, "ok": False, "status": 404, "error": "Not Found"}
+        for name in names if name not in by_name
+    ]
+    names = [name for name in names if name in by_name]
+    if selector.name_prefix is not None:
+        requested = set(names)
+        names.extend(sorted(
+            name for name in by_name
+            if name.startswith(selector.name_prefix) and name not in requested
+        ))
+    return [by_name[name] for name in names], missing
+
+
+def _batch_result(result: Dict[str, Any], missing: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Append unknown schedules to a run_batch result as failed items"""
+    return {
+        **result,
+        "total": result["total"] + len(missing),
+        "failed": result["failed"] + len(missing),
+        "items": result["items"] + missing,
+    }
+
+
+@router.patch("/batch", response_model=BatchResult)
+async def update_schedules_batch(request: BatchUpdateSchedulesRequest):
+    """
+    Pause/resume many Schedules and change their backup templates
+    
+    Targets are the given names plus every schedule starting with
+    namePrefix. `paused` is set with server-side apply (field manager
+    velero-dashboard-pause); template fields are merge-patched, so fields
+    left out are kept and fields set to null are removed. Updates run
+    concurrently (K8S_BATCH_CONCURRENCY) under the client-side QPS/burst
+    limit. With dryRun the matched schedules are returned unchanged.
+    
+    Args:
+        request: Schedule names and/or prefix, paused and template changes
+    
+    Returns:
+        Per-item results (unknown names fail with status 404)
+    """
+    template = request.template.model_dump(exclude_unset=True, by_alias=True) if request.template else {}
+    if request.paused is None and not template:
+        raise HTTPException(status_code=400, detail="Either paused or template is required")
+    
+    schedules_cr, missing = await _select_schedules(request)
+    
+    try:
+        logger.info(f"Updating {len(schedules_cr)} schedules (dry run: {request.dry_run})")
+        
+        if request.dry_run:
+            items = [{"name": s["metadata"]["name"], "ok": True} for s in schedules_cr]
+            return _batch_result({"total": len(items), "succeeded": 0, "failed": 0, "items": items}, missing)
+        
+        async def update(schedule_cr: Dict[str, Any]) -> None:
+            name = schedule_cr["metadata"]["name"]
+            if request.paused is not None:
+                await async_k8s_client.apply_schedule(
+                    name, {"paused": request.paused}, field_manager="velero-dashboard-pause"
+                )
+            if template:
+                await async_k8s_client.patch_schedule(name, {"spec": {"template": template}})
+        
+        result = await run_batch(
+            schedules_cr,
+            update,
+            key=lambda s: s["metadata"]["name"],
+            limiter=batch_rate_limiter,
+            concurrency=settings.k8s_batch_concurrency
+        )
+        return _batch_result(result, missing)
+    
+    except Exception as e:
+        logger.error(f"Error updating schedules: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/stagger", response_model=StaggerResult)
+async def stagger_schedules(request: StaggerSchedulesRequest):
+    """
+    Spread the start minutes of schedules that fire in the same hours
+    
+    Selected schedules are grouped by time zone and hour/day/month fields
+    (identical firing hours and days); each group of two or more gets
+    evenly spaced minutes over windowMinutes, starting
+    at its earliest minute. Only the minute field changes, so runs move by
+    less than an hour. The new cron expressions are set with server-side
+    apply (field manager velero-dashboard-stagger) concurrently under the
+    batch limits. Schedules using @every, minute lists/ranges/steps or an
+    invalid cron expression are skipped.
+    
+    Args:
+        request: Schedule names and/or prefix, window and dryRun
+    
+    Returns:
+        Per-item results of the rewritten schedules, the cron changes and
+        the skipped schedules
+    """
+    schedules_cr, missing = await _select_schedules(request)
+    
+    try:
+        expressions = {
+            s["metadata"]["name"]: s.get("spec", {}).get("schedule", "")
+            for s in schedules_cr
+        }
+        changes, skipped = stagger(expressions, request.window_minutes)
+        logger.info(f"Staggering {len(changes)} of {len(expressions)} schedules (dry run: {request.dry_run})")
+        
+        names = sorted(changes)
+        if request.dry_run:
+            items = [{"name": name, "ok": True} for name in names]
+            result = {"total": len(items), "succeeded": 0, "failed": 0, "items": items}
+        else:
+            result = await run_batch(
+                names,
+                lambda name: async_k8s_client.apply_schedule(
+                    name, {"schedule": changes[name]}, field_manager="velero-dashboard-stagger"
+                ),
+                key=lambda name: name,
+                limiter=batch_rate_limiter,
+                concurrency=settings.k8s_batch_concurrency
+            )
+        
+        return {
+            **_batch_result(result, missing),
+            "changes": [
+                {"name": name, "previous": expressions[name], "schedule": changes[name]}
+                for name in names
+            ],
+            "skipped": [
+                {"name": name, "ok": False, "error": reason}
+                for name, reason in sorted(skipped.items())
+            ],
+        }
+    
+    except Exception as e:
+        logger.error(f"Error staggering schedules: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("", response_model=Schedule)
 async def create_schedule(request: CreateScheduleRequest):
     """
@@ -100,7 +305,7 @@ async def create_schedule(request: CreateScheduleRequest):
             schedule_spec["spec"]["template"]["ttl"] = request.ttl
         
         # Create schedule
-        created_schedule_cr = k8s_client.create_schedule(schedule_spec)
+        created_schedule_cr = await async_k8s_client.create_schedule(schedule_spec)
         schedule = _convert_schedule_to_model(created_schedule_cr)
         
         logger.info(f"Schedule created successfully: {schedule.name}")
@@ -124,7 +329,7 @@ async def delete_schedule(name: str):
     """
     try:
         logger.info(f"Deleting schedule: {name}")
-        k8s_client.delete_schedule(name)
+        await async_k8s_client.delete_schedule(name)
         logger.info(f"Schedule deleted successfully: {name}")
         return {"message": f"Schedule '{name}' deleted successfully"}
     
@@ -148,7 +353,7 @@ async def get_schedule(name: str):
     """
     try:
         logger.info(f"Getting schedule: {name}")
-        schedule_cr = k8s_client.get_schedule(name)
+        schedule_cr = await informers.get("schedules", name, async_k8s_client.get_schedule)
         schedule = _convert_schedule_to_model(schedule_cr)
         return schedule
     
@@ -157,3 +362,37 @@ async def get_schedule(name: str):
         if "not found" in str(e).lower():
             raise HTTPException(status_code=404, detail=f"Schedule '{name}' not found")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{name}/backups", response_model=List[Backup])
+async def get_schedule_backups(
+    name: str,
+    phase: Optional[str] = Query(None, description="Comma-separated phases")
+):
+    """
+    Get Backups created by a Schedule
+    
+    Served from the velero.io/schedule-name secondary index (O(matches)).
+    
+    Args:
+        name: Schedule name
+        phase: Optional phase filter
+    
+    Returns:
+        List of Backup objects (newest first)
+    """
+    try:
+        logger.info(f"Getting backups of schedule: {name}")
+        selector = {"schedule": {name}}
+        if phase:
+            selector["phase"] = {p.strip() for p in phase.split(",") if p.strip()}
+        
+        backups_cr = await informers.select(
+            "backups", selector, async_k8s_client.list_backups
+        )
+        backups_cr.sort(key=start_timestamp_key, reverse=True)
+        return [_convert_backup_to_model(b) for b in backups_cr]
+    
+    except Exception as e:
+        logger.error(f"Error getting backups of schedule {name}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -4,19 +4,31 @@ Velero Dashboard Backend - Storage API
 BackupStorageLocation 조회, 수정, S3 검증 엔드포인트
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, AsyncIterator
+import asyncio
+import json
 import logging
+import time
 
 from app.models.velero import (
+    Backup,
     BackupStorageLocation,
     UpdateBSLRequest,
     ValidateStorageRequest,
     ValidateStorageResponse,
+    StorageInventoryRequest,
     BSLConfig
 )
-from app.services.k8s_client import k8s_client
-from app.services.s3_client import s3_validation_service
+from app.services.k8s_client import async_k8s_client
+from app.services.informer import informers
+from app.services.indexes import start_timestamp_key
+from app.api.backups import _convert_backup_to_model
+from app.services.s3_client import s3_validation_service, S3ValidationService
+from app.services.bucket_index import bucket_index
+from app.services.storage_usage import storage_usage_analyzer
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -61,7 +73,7 @@ async def list_backup_storage_locations():
     """
     try:
         logger.info("Listing BackupStorageLocations")
-        bsls_cr = k8s_client.list_backup_storage_locations()
+        bsls_cr = await informers.list("backupstoragelocations", async_k8s_client.list_backup_storage_locations)
         bsls = [_convert_bsl_to_model(b) for b in bsls_cr]
         
         logger.info(f"Found {len(bsls)} BackupStorageLocations")
@@ -72,6 +84,40 @@ async def list_backup_storage_locations():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/bsl/{name}/backups", response_model=List[Backup])
+async def get_bsl_backups(
+    name: str,
+    phase: Optional[str] = Query(None, description="Comma-separated phases, e.g. Failed")
+):
+    """
+    Get Backups stored in a BackupStorageLocation
+    
+    Served from the spec.storageLocation secondary index (O(matches)).
+    
+    Args:
+        name: BSL name
+        phase: Optional phase filter
+    
+    Returns:
+        List of Backup objects (newest first)
+    """
+    try:
+        logger.info(f"Getting backups of BSL: {name}")
+        selector = {"storageLocation": {name}}
+        if phase:
+            selector["phase"] = {p.strip() for p in phase.split(",") if p.strip()}
+        
+        backups_cr = await informers.select(
+            "backups", selector, async_k8s_client.list_backups
+        )
+        backups_cr.sort(key=start_timestamp_key, reverse=True)
+        return [_convert_backup_to_model(b) for b in backups_cr]
+    
+    except Exception as e:
+        logger.error(f"Error getting backups of BSL {name}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.patch("/bsl", response_model=BackupStorageLocation)
 async def update_backup_storage_location(request: UpdateBSLRequest):
     """
@@ -112,7 +158,7 @@ async def update_backup_storage_location(request: UpdateBSLRequest):
                 patch["spec"]["config"] = config_dict
         
         # Apply patch
-        updated_bsl_cr = k8s_client.patch_backup_storage_location(
+        updated_bsl_cr = await async_k8s_client.patch_backup_storage_location(
             name=request.name,
             patch=patch
         )
@@ -150,7 +196,7 @@ async def validate_storage(request: ValidateStorageRequest):
         secret_key = request.secret_key or settings.s3_secret_key
         
         success, message, object_count, latest_backup = (
-            s3_validation_service.validate_storage(
+            await s3_validation_service.validate_storage_async(
                 s3_url=request.s3_url,
                 bucket=request.bucket,
                 region=request.region,
@@ -172,3 +218,243 @@ async def validate_storage(request: ValidateStorageRequest):
     except Exception as e:
         logger.error(f"Error validating storage: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/validate-all")
+async def validate_all_storage(
+    concurrency: Optional[int] = Query(None, ge=1, le=64, description="Concurrent checks (default S3_VALIDATE_CONCURRENCY)"),
+    timeout: Optional[float] = Query(None, gt=0, le=300, description="Per-BSL timeout in seconds (default S3_VALIDATE_TIMEOUT_SECONDS)")
+):
+    """
+    Validate every BackupStorageLocation concurrently
+    
+    Each BSL is checked with its own endpoint, bucket and prefix and the
+    backend S3 credentials. Results are streamed as NDJSON in completion
+    order, so the total time is close to the slowest BSL rather than the sum.
+    
+    Returns:
+        application/x-ndjson stream of {"type": "result", "bsl", "success", ...}
+        lines followed by a {"type": "summary", ...} line
+    """
+    try:
+        logger.info("Validating all backup storage locations")
+        bsls_cr = await informers.list(
+            "backupstoragelocations",
+            async_k8s_client.list_backup_storage_locations
+        )
+    
+    except Exception as e:
+        logger.error(f"Error listing BSLs: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    concurrency = concurrency or settings.s3_validate_concurrency
+    timeout = timeout or settings.s3_validate_timeout_seconds
+    # Own pool sized to the requested concurrency: the shared S3 pool is
+    # smaller and a check stuck on a dead endpoint must not delay the others
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(concurrency, len(bsls_cr))),
+        thread_name_prefix="s3-validate"
+    )
+    
+    async def check(bsl_cr: dict) -> dict:
+        target = S3ValidationService.bsl_target(bsl_cr)
+        result = {
+            "type": "result",
+            "bsl": bsl_cr.get("metadata", {}).get("name", ""),
+            "s3Url": target["s3_url"],
+            "bucket": target["bucket"],
+        }
+        loop = asyncio.get_running_loop()
+        started: asyncio.Future = loop.create_future()
+        
+        def mark_started() -> None:
+            if not started.done():
+                started.set_result(time.monotonic())
+        
+        def validate():
+            loop.call_soon_threadsafe(mark_started)
+            return s3_validation_service.validate_storage(timeout=timeout, **target)
+        
+        work = loop.run_in_executor(executor, validate)
+        # The timeout covers the check itself, not the wait for a free worker
+        started_at = await started
+        try:
+            success, message, object_count, latest_backup = await asyncio.wait_for(work, timeout)
+        except asyncio.TimeoutError:
+            success, message, object_count, latest_backup = (
+                False, f"Timed out after {timeout}s", None, None
+            )
+        result["latencyMs"] = round((time.monotonic() - started_at) * 1000, 1)
+        
+        result.update(ValidateStorageResponse(
+            success=success,
+            message=message,
+            object_count=object_count,
+            latest_backup=latest_backup
+        ).model_dump(by_alias=True))
+        return result
+    
+    async def ndjson() -> AsyncIterator[str]:
+        started = time.monotonic()
+        tasks = [asyncio.ensure_future(check(bsl_cr)) for bsl_cr in bsls_cr]
+        succeeded = 0
+        try:
+            for finished in asyncio.as_completed(tasks):
+                result = await finished
+                succeeded += result["success"]
+                yield json.dumps(result) + "\n"
+        finally:
+            # Client went away: stop the remaining checks
+            for task in tasks:
+                task.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        yield json.dumps({
+            "type": "summary",
+            "total": len(tasks),
+            "succeeded": succeeded,
+            "failed": len(tasks) - succeeded,
+            "durationMs": round((time.monotonic() - started) * 1000, 1),
+        }) + "\n"
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@router.post("/inventory")
+async def get_storage_inventory(request: StorageInventoryRequest):
+    """
+    Stream the backup inventory of a bucket as NDJSON
+    
+    Lists every backup directory under `<prefix>/backups/` with continuation
+    tokens and emits one line per backup with its object count and total
+    bytes, followed by a summary line. Results are streamed as they are
+    computed, so the backend never holds the whole bucket listing.
+    
+    Args:
+        request: Storage inventory request
+    
+    Returns:
+        application/x-ndjson stream of {"type": "backup" | "summary" | "error", ...}
+    """
+    logger.info(f"Scanning inventory of: {request.s3_url}/{request.bucket}")
+    
+    inventory = s3_validation_service.iter_inventory(
+        s3_url=request.s3_url,
+        bucket=request.bucket,
+        region=request.region,
+        access_key=request.access_key or settings.s3_access_key,
+        secret_key=request.secret_key or settings.s3_secret_key,
+        prefix=request.prefix
+    )
+    
+    async def ndjson() -> AsyncIterator[str]:
+        async for record in s3_validation_service.stream(inventory):
+            yield json.dumps(record) + "\n"
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@router.get("/index")
+async def get_bucket_index_usage(bsl: Optional[str] = Query(None, description="BSL name (all indexed BSLs if omitted)")):
+    """
+    Get per-BSL totals from the local bucket index
+    
+    Answered from the on-disk index without touching S3; refresh it with
+    POST /api/storage/index/{name}/refresh.
+    
+    Returns:
+        List of {bsl, bucket, prefix, refreshedAt, backups, repositories,
+        objects, totalBytes, backupObjects, backupBytes, repositoryObjects,
+        repositoryBytes}
+    """
+    try:
+        logger.info("Getting bucket index usage")
+        return await s3_validation_service.run(bucket_index.usage, bsl)
+    
+    except Exception as e:
+        logger.error(f"Error reading bucket index: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/index/{name}")
+async def get_bucket_index_backups(name: str):
+    """
+    Get the indexed backup directories of a BSL
+    
+    Args:
+        name: BSL name
+    
+    Returns:
+        List of {name, prefix, objectCount, totalBytes, lastModified, complete}
+    """
+    try:
+        logger.info(f"Getting bucket index of BSL: {name}")
+        return await s3_validation_service.run(lambda: list(bucket_index.iter_backups(name)))
+    
+    except Exception as e:
+        logger.error(f"Error reading bucket index {name}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/index/{name}/refresh")
+async def refresh_bucket_index(name: str):
+    """
+    Incrementally refresh the bucket index of a BSL
+    
+    Only backup directories that are new, or were still being written when
+    last indexed, are listed again; interrupted scans resume where they
+    stopped.
+    
+    Args:
+        name: BSL name
+    
+    Returns:
+        Refresh statistics
+    """
+    try:
+        logger.info(f"Refreshing bucket index of BSL: {name}")
+        bsl_cr = await informers.get(
+            "backupstoragelocations",
+            name,
+            async_k8s_client.get_backup_storage_location
+        )
+        return await s3_validation_service.run(bucket_index.refresh_bsl, bsl_cr)
+    
+    except Exception as e:
+        logger.error(f"Error refreshing bucket index {name}: {e}")
+        if "not found" in str(e).lower():
+            raise HTTPException(status_code=404, detail=f"BSL '{name}' not found")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/usage")
+async def get_storage_usage(
+    response: Response,
+    refresh: bool = Query(False, description="Start a new analysis in the background")
+):
+    """
+    Get storage usage per BSL
+    
+    Reports bytes and objects per BSL, per-schedule size and daily growth,
+    orphaned backup prefixes (in the bucket without a Backup CR) and
+    Completed backups missing from the bucket. The report is produced by a
+    background job (STORAGE_USAGE_INTERVAL_SECONDS) since it scans whole
+    buckets; requests never run it inline.
+    
+    Returns:
+        The last report {generatedAt, durationSeconds, locations: [...]},
+        or 202 with the progress of the running analysis {running,
+        startedAt, totalLocations, locations done so far, lastGeneratedAt}
+        when no report exists yet or refresh was requested
+    """
+    try:
+        logger.info("Getting storage usage")
+        if refresh or storage_usage_analyzer.report is None:
+            storage_usage_analyzer.trigger()
+            response.status_code = 202
+            return storage_usage_analyzer.progress()
+        return storage_usage_analyzer.report
+    
+    except Exception as e:
+        logger.error(f"Error analyzing storage usage: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
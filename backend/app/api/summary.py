@@ -0,0 +1,79 @@
+"""
+Velero Dashboard Backend - Summary API
+
+대시보드 KPI 요약 엔드포인트
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+import asyncio
+import logging
+
+from app.models.velero import DashboardSummary
+from app.services.k8s_client import async_k8s_client
+from app.services.informer import informers
+from app.services.summary import summary_aggregator, SummaryAggregator
+from app.services.indexes import start_timestamp_key
+from app.api.backups import _convert_backup_to_model
+from app.api.restores import _convert_restore_to_model
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/summary", tags=["summary"])
+
+
+def _match_all(_: dict) -> bool:
+    return True
+
+
+@router.get("", response_model=DashboardSummary)
+async def get_summary(
+    recent: int = Query(3, ge=0, le=20, description="Number of recent backups/restores")
+):
+    """
+    Get dashboard summary
+    
+    Counts per phase, warning/error totals and last successful backup per
+    schedule are maintained incrementally from informer events; recent items
+    come from the sorted startTimestamp index.
+    
+    Returns:
+        DashboardSummary
+    """
+    try:
+        synced = all(
+            informers.informer(plural).has_synced()
+            for plural in ("backups", "restores", "schedules")
+        )
+        
+        if synced:
+            snapshot = summary_aggregator.snapshot()
+            recent_backups = recent_restores = []
+            if recent:
+                recent_backups, _ = informers.informer("backups").query(
+                    "startTimestamp", _match_all, limit=recent, reverse=True
+                )
+                recent_restores, _ = informers.informer("restores").query(
+                    "startTimestamp", _match_all, limit=recent, reverse=True
+                )
+        else:
+            # Informers still loading: aggregate once from fresh lists
+            backups_cr, restores_cr, schedules_cr = await asyncio.gather(
+                async_k8s_client.list_backups(),
+                async_k8s_client.list_restores(),
+                async_k8s_client.list_schedules()
+            )
+            aggregator = SummaryAggregator()
+            aggregator.load(backups_cr, restores_cr, schedules_cr)
+            snapshot = aggregator.snapshot()
+            recent_backups = sorted(backups_cr, key=start_timestamp_key, reverse=True)[:recent]
+            recent_restores = sorted(restores_cr, key=start_timestamp_key, reverse=True)[:recent]
+        
+        return DashboardSummary(
+            **snapshot,
+            recentBackups=[_convert_backup_to_model(b) for b in recent_backups],
+            recentRestores=[_convert_restore_to_model(r) for r in recent_restores]
+        )
+    
+    except Exception as e:
+        logger.error(f"Error building summary: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,14 +1,18 @@
 """
 Velero Dashboard Backend - System API
 
-시스템 상태 모니터링 엔드포인트 (Repositories, Node Agents)
+시스템 상태 모니터링 엔드포인트 (Repositories, Node Agents, Cache)
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional
 import logging
+import time
 
-from app.services.k8s_client import k8s_client
+from app.services.k8s_client import async_k8s_client
+from app.services.informer import informers
+from app.services.transfers import transfer_tracker, node_load
+from app.services.repositories import repository_monitor, repository_health
 
 logger = logging.getLogger(__name__)
 
@@ -16,30 +20,26 @@ router = APIRouter(prefix="/api", tags=["system"])
 
 
 @router.get("/repositories")
-async def get_repositories():
+async def get_repositories(
+    overdue: Optional[bool] = Query(None, description="Only overdue (true) or on-time (false) repositories")
+):
     """
-    Get Velero Backup Repositories status
+    Get Velero Backup Repositories status and maintenance health
     
     Returns:
-        List of backup repository objects with status
+        List of backup repositories with phase, maintenance lag
+        (seconds since the last maintenance), next due time and whether
+        maintenance is overdue against maintenanceFrequency
     """
     try:
         logger.info("Getting backup repositories")
-        repos_raw = k8s_client.list_backup_repositories()
+        repos_raw = await informers.list("backuprepositories", async_k8s_client.list_backup_repositories)
         
-        repos = []
-        for repo in repos_raw:
-            metadata = repo.get("metadata", {})
-            spec = repo.get("spec", {})
-            status = repo.get("status", {})
-            
-            repos.append({
-                "name": metadata.get("name", ""),
-                "phase": status.get("phase", "Unknown"),
-                "maintenanceFrequency": spec.get("maintenanceFrequency"),
-                "lastMaintenanceTime": status.get("lastMaintenanceTime"),
-                "message": status.get("message", "")
-            })
+        now = time.time()
+        repos = [repository_health(repo, now) for repo in repos_raw]
+        if overdue is not None:
+            repos = [repo for repo in repos if repo["overdue"] == overdue]
+        repos.sort(key=lambda r: r["lagSeconds"] or 0, reverse=True)
         
         logger.info(f"Found {len(repos)} repositories")
         return repos
@@ -49,38 +49,106 @@ async def get_repositories():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/repositories/metrics")
+async def get_repository_metrics():
+    """
+    Get maintenance-lag metrics of all Backup Repositories
+    
+    Returns:
+        Counts per phase, overdue / never maintained / last maintenance
+        failed counts, lag max/mean/p95 and a per-BSL breakdown
+    """
+    try:
+        repos_raw = await informers.list("backuprepositories", async_k8s_client.list_backup_repositories)
+        now = time.time()
+        return repository_monitor.metrics([repository_health(repo, now) for repo in repos_raw])
+    
+    except Exception as e:
+        logger.error(f"Error getting repository metrics: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/repositories/{name}/history")
+async def get_repository_history(name: str):
+    """
+    Get the maintenance/phase history of a Backup Repository
+    
+    Recorded from watch events (seeded from status.recentMaintenance), so
+    it covers the time since the dashboard started.
+    
+    Args:
+        name: BackupRepository name
+    
+    Returns:
+        Entries oldest first: observedAt, phase, lastMaintenanceTime and
+        intervalSeconds since the previous maintenance
+    """
+    history = repository_monitor.history(name)
+    if history is None:
+        raise HTTPException(status_code=404, detail=f"Repository '{name}' not found")
+    return history
+
+
 @router.get("/node-agents")
 async def get_node_agents():
     """
-    Get Velero Node Agent pods status
+    Get Velero Node Agent pods status and load
+    
+    Each node-agent pod is joined with the running and queued volume
+    transfers (PodVolumeBackups/Restores, DataUploads/Downloads) of its node.
+    Pods come from the node-agent informer and transfers from the transfer
+    tracker's per-node index, so no pods or CRs are listed per request.
     
     Returns:
-        List of node agent pods with status
+        List of node agent pods with status, concurrent transfers, queue
+        length, throughput (bytes/s) and saturation
     """
     try:
         logger.info("Getting node agent pods")
-        pods = k8s_client.list_node_agent_pods()
+        pods = await informers.list("nodeagents", async_k8s_client.list_node_agent_pods)
+        load_by_node = transfer_tracker.active_by_node()
+        now = time.time()
         
         agents = []
         for pod in pods:
             metadata = pod.get("metadata", {})
             spec = pod.get("spec", {})
             status = pod.get("status", {})
+            node_name = spec.get("nodeName", "")
             
             # Get container statuses
             container_statuses = status.get("containerStatuses", [])
-            restart_count = container_statuses[0].get("restartCount", 0) if container_statuses else 0
+            restart_count = sum(c.get("restartCount", 0) for c in container_statuses)
+            ready = bool(container_statuses) and all(c.get("ready") for c in container_statuses)
+            
+            load = node_load(node_name, load_by_node.get(node_name, []), now)
+            del load["node"]
             
             agents.append({
                 "name": metadata.get("name", ""),
-                "nodeName": spec.get("nodeName", ""),
+                "nodeName": node_name,
                 "status": status.get("phase", "Unknown"),
-                "restartCount": restart_count
+                "ready": ready,
+                "restartCount": restart_count,
+                **load
             })
         
+        agents.sort(key=lambda a: a["nodeName"])
         logger.info(f"Found {len(agents)} node agents")
         return agents
     
     except Exception as e:
         logger.error(f"Error getting node agents: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/cache")
+async def get_cache_status():
+    """
+    Get informer cache status
+    
+    Returns:
+        Per-resource cache status (synced, item count, resourceVersion,
+        cache age and staleness in seconds)
+    """
+    return informers.status()
@@ -0,0 +1,109 @@
+"""
+Velero Dashboard Backend - Transfers API
+
+볼륨 전송(PodVolumeBackup/PodVolumeRestore) 진행률, 처리량, ETA 엔드포인트
+"""
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from typing import List, Dict, Any, Callable, Awaitable, AsyncIterator
+import asyncio
+import json
+import logging
+import time
+
+from app.config import settings
+from app.services.transfers import transfer_tracker, progress_report, TransferItem
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/transfers", tags=["transfers"])
+
+
+async def get_progress(
+    kind: str,
+    name: str,
+    plural: str,
+    fallback: Callable[[], Awaitable[List[Dict[str, Any]]]]
+) -> Dict[str, Any]:
+    """
+    Progress of one backup/restore
+    
+    Served from the transfer tracker once its informers have synced; before
+    that the transfers are listed once (throughput is then the average since
+    each volume started).
+    """
+    if transfer_tracker.synced():
+        return transfer_tracker.progress(kind, name)
+    now = time.time()
+    items = [TransferItem(plural, obj, now, name) for obj in await fallback()]
+    return progress_report(kind, name, items)
+
+
+def progress_stream(request: Request, kind: str, name: str) -> StreamingResponse:
+    """
+    Server-Sent Events stream of a backup/restore's progress
+    
+    A `progress` message is sent on connect and after every change, at most
+    once per PROGRESS_STREAM_INTERVAL_SECONDS.
+    """
+    changed = transfer_tracker.watch(kind, name)
+    
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            while not await request.is_disconnected():
+                changed.clear()
+                progress = transfer_tracker.progress(kind, name)
+                yield f"event: progress\ndata: {json.dumps(progress, separators=(',', ':'))}\n\n"
+    
+                await asyncio.sleep(settings.progress_stream_interval_seconds)
+                while not changed.is_set():
+                    try:
+                        await asyncio.wait_for(changed.wait(), timeout=settings.event_heartbeat_seconds)
+                    except asyncio.TimeoutError:
+                        if await request.is_disconnected():
+                            return
+                        yield ": keep-alive\n\n"
+        finally:
+            transfer_tracker.unwatch(kind, name, changed)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+
+@router.get("")
+async def list_active_transfers():
+    """
+    Backups/restores with running volume transfers
+    
+    Returns:
+        Progress of each (bytes, throughput, ETA, per-node breakdown)
+    """
+    try:
+        return transfer_tracker.active()
+    
+    except Exception as e:
+        logger.error(f"Error listing transfers: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/nodes")
+async def list_node_transfers():
+    """
+    Running and queued volume transfers aggregated per node
+    
+    Returns:
+        Per-node volumes, queue depth, bytes, throughput, ETA and stalled count
+    """
+    try:
+        return transfer_tracker.node_queues()
+    
+    except Exception as e:
+        logger.error(f"Error listing node transfers: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
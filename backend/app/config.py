@@ -15,6 +15,18 @@ class Settings(BaseSettings):
     kubeconfig_path: Optional[str] = None
     """Path to kubeconfig file. If None, uses in-cluster config."""
     
+    k8s_client_max_workers: int = 16
+    """Thread pool size for blocking Kubernetes API calls (max concurrent calls)"""
+    
+    k8s_batch_qps: float = 20.0
+    """Client-side request rate of batch operations (like client-go QPS)"""
+    
+    k8s_batch_burst: int = 40
+    """Requests allowed above the steady rate (like client-go Burst)"""
+    
+    k8s_batch_concurrency: int = 10
+    """Maximum in-flight API calls of one batch operation"""
+    
     # Velero Configuration
     velero_namespace: str = "velero"
     """Namespace where Velero is installed"""
@@ -23,6 +35,13 @@ class Settings(BaseSettings):
     cluster_name: str = "cluster1"
     """Name of this cluster (cluster1 or cluster2)"""
     
+    # Multi-Cluster Federation
+    federation_contexts: str = ""
+    """Comma-separated kubeconfig contexts served in addition to this cluster"""
+    
+    federation_timeout_seconds: float = 5.0
+    """Per-cluster timeout of fan-out queries"""
+    
     # API Server Configuration
     host: str = "0.0.0.0"
     port: int = 8000
@@ -35,6 +54,156 @@ class Settings(BaseSettings):
     s3_access_key: Optional[str] = None
     s3_secret_key: Optional[str] = None
     
+    s3_client_pool_size: int = 32
+    """Maximum number of pooled boto3 clients (endpoint/region/credentials)"""
+    
+    s3_client_ttl_seconds: int = 900
+    """Idle pooled clients are dropped after this many seconds"""
+    
+    s3_max_pool_connections: int = 10
+    """HTTP keep-alive connections per pooled client"""
+    
+    s3_max_workers: int = 8
+    """Thread pool size for blocking S3 calls"""
+    
+    s3_connect_timeout_seconds: float = 5.0
+    s3_read_timeout_seconds: float = 30.0
+    
+    s3_validate_concurrency: int = 8
+    """Concurrent BSL checks of /api/storage/validate-all"""
+    
+    s3_validate_timeout_seconds: float = 10.0
+    """Per-BSL timeout of /api/storage/validate-all"""
+    
+    # Logs (DownloadRequest)
+    download_request_timeout_seconds: int = 30
+    """Time to wait for Velero to process a DownloadRequest"""
+    
+    log_fetch_max_workers: int = 8
+    """Concurrent log downloads"""
+    
+    log_cache_max_bytes: int = 64 * 1024 * 1024
+    """Total size of the in-memory LRU cache of decompressed logs"""
+    
+    log_cache_max_entry_bytes: int = 8 * 1024 * 1024
+    """Larger logs are streamed without being cached"""
+    
+    # Log Search Index
+    log_index_enabled: bool = True
+    """Index logs of finished backups/restores for /api/logs/search"""
+    
+    log_index_max_age_days: int = 30
+    """Logs of runs completed earlier than this are not indexed / are evicted"""
+    
+    log_index_max_bytes: int = 1024 * 1024 * 1024
+    """Oldest runs are evicted when the index grows beyond this size"""
+    
+    # Backup/Restore History (survives Velero garbage collection)
+    history_enabled: bool = True
+    """Record finished backups/restores in the local history database"""
+    
+    history_retention_days: int = 365
+    """Runs completed longer ago are pruned from the history (0 keeps everything)"""
+    
+    # Local Data (persistent indexes)
+    data_dir: str = "./data"
+    """Directory of the on-disk indexes (mount a volume to keep them across restarts)"""
+    
+    bucket_index_settle_seconds: int = 3600
+    """Backup directories indexed within this window are rescanned on refresh"""
+    
+    bucket_index_repository_rescan_seconds: int = 21600
+    """kopia/restic repositories are recounted on refresh when last scanned longer ago"""
+    
+    storage_usage_interval_seconds: int = 3600
+    """Interval of the background storage usage analysis (0 disables it)"""
+    
+    storage_usage_growth_days: int = 14
+    """Days in the per-schedule growth series"""
+    
+    storage_usage_max_orphans: int = 1000
+    """Orphaned backup prefixes listed per BSL (all are counted)"""
+    
+    # Backup Deletion
+    delete_parallelism: int = 4
+    """Backup deletions (DeleteBackupRequests) processed by Velero at a time"""
+    
+    delete_timeout_seconds: int = 1800
+    """A deletion slot is released after this long (tracking continues)"""
+    
+    operation_history_size: int = 1000
+    """Tracked operations kept in memory (oldest finished are dropped)"""
+    
+    # Informer Cache (list + watch)
+    informer_enabled: bool = True
+    """Serve list endpoints from a watch-backed in-memory cache"""
+    
+    informer_watch_timeout_seconds: int = 300
+    """Server-side timeout of each watch request (re-watched from last resourceVersion)"""
+    
+    informer_max_staleness_seconds: int = 600
+    """Cache is reported as stale when not confirmed fresh within this window"""
+    
+    # Event Stream (SSE)
+    event_history_size: int = 5000
+    """Number of recent events kept for Last-Event-ID replay"""
+    
+    event_queue_size: int = 1000
+    """Per-client buffer; slower clients are told to resync"""
+    
+    event_heartbeat_seconds: int = 15
+    """Interval of SSE keep-alive comments"""
+    
+    # Backup Repository Health
+    repository_maintenance_grace_seconds: int = 3600
+    """A repository is overdue when maintenance is this much later than maintenanceFrequency"""
+    
+    repository_history_size: int = 50
+    """Maintenance/phase changes kept per repository"""
+    
+    # Backup Analytics
+    analytics_window_days: float = 7
+    """Default length of the per-schedule analytics windows"""
+    
+    analytics_windows: int = 4
+    """Default number of analytics windows (the newest ends now)"""
+    
+    analytics_slowdown_threshold: float = 0.25
+    """A schedule is slowing down when its p50 duration grew by more than this fraction"""
+    
+    # Schedule Forecast
+    forecast_horizon_hours: float = 24
+    """Default horizon of /api/schedules/forecast"""
+    
+    forecast_slot_minutes: int = 15
+    """Default slot length of the forecast timeline"""
+    
+    forecast_default_duration_seconds: int = 1800
+    """Assumed backup duration of schedules without finished backups"""
+    
+    schedule_collision_threshold: int = 3
+    """Backups predicted to run at once that are reported as a collision"""
+    
+    # Transfer Progress (pod volume backups/restores)
+    progress_stream_interval_seconds: float = 1.0
+    """Minimum interval between progress SSE messages of one backup/restore"""
+    
+    transfer_rate_smoothing: float = 0.3
+    """Weight of the newest sample in the throughput moving average (0-1]"""
+    
+    transfer_stall_seconds: int = 900
+    """Transfers queued or without progress for longer are reported as stalled"""
+    
+    node_agent_concurrency: int = 1
+    """Concurrent transfers per node-agent (its loadConcurrency); a node is saturated when all are busy and more wait"""
+    
+    # Metrics (Prometheus)
+    metrics_enabled: bool = True
+    """Expose /metrics and instrument requests"""
+    
+    event_loop_lag_interval_seconds: float = 0.5
+    """Sampling interval of the event loop lag metric (0 disables)"""
+    
     # Logging
     log_level: str = "INFO"
     
@@ -48,6 +217,11 @@ class Settings(BaseSettings):
     def cors_origins_list(self) -> list[str]:
         """Parse CORS origins as list"""
         return [origin.strip() for origin in self.cors_origins.split(",")]
+    
+    @property
+    def federation_contexts_list(self) -> list[str]:
+        """Parse federation contexts as list"""
+        return [c.strip() for c in self.federation_contexts.split(",") if c.strip()]
 
 
 # Global settings instance
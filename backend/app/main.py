@@ -4,11 +4,24 @@ Velero Dashboard Backend - Main FastAPI Application
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 import logging
 import sys
 
 from app.config import settings
-from app.api import backups, restores, schedules, storage, system
+from app.api import backups, restores, schedules, storage, system, events, summary, clusters, operations, logs, transfers, datamover, analytics, history, metrics
+from app.services.informer import informers
+from app.services.summary import summary_aggregator
+from app.services.federation import federation
+from app.services.storage_usage import storage_usage_analyzer
+from app.services.operations import deletion_queue
+from app.services.log_index import log_indexer
+from app.services.transfers import transfer_tracker
+from app.services.repositories import repository_monitor
+from app.services.analytics import backup_analytics
+from app.services.history import history_recorder
+from app.services.forecast import schedule_forecaster
+from app.services.metrics import MetricsMiddleware, event_loop_lag_monitor
 
 # Configure logging
 logging.basicConfig(
@@ -19,13 +32,46 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start/stop background informers and jobs"""
+    events.register_event_handlers()
+    summary_aggregator.attach(informers)
+    deletion_queue.attach(informers)
+    log_indexer.attach(informers)
+    transfer_tracker.attach(informers)
+    repository_monitor.attach(informers)
+    backup_analytics.attach(informers)
+    history_recorder.attach(informers)
+    schedule_forecaster.attach(informers)
+    informers.start()
+    transfer_tracker.start()
+    history_recorder.start()
+    federation.start()
+    deletion_queue.start()
+    log_indexer.start()
+    storage_usage_analyzer.start()
+    if settings.metrics_enabled:
+        event_loop_lag_monitor.start()
+    yield
+    await event_loop_lag_monitor.stop()
+    await storage_usage_analyzer.stop()
+    await log_indexer.stop()
+    await deletion_queue.stop()
+    federation.stop()
+    informers.stop()
+    history_recorder.stop()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Velero Dashboard API",
     description="Backend API for Velero backup/restore management",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -35,14 +81,30 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Continue"],
 )
 
+# Request latency metrics
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 # Include API routers
 app.include_router(backups.router)
 app.include_router(restores.router)
 app.include_router(schedules.router)
 app.include_router(storage.router)
 app.include_router(system.router)
+app.include_router(events.router)
+app.include_router(summary.router)
+app.include_router(clusters.router)
+app.include_router(operations.router)
+app.include_router(logs.router)
+app.include_router(transfers.router)
+app.include_router(datamover.router)
+app.include_router(analytics.router)
+app.include_router(history.router)
+if settings.metrics_enabled:
+    app.include_router(metrics.router)
 
 
 @app.get("/")
@@ -37,6 +37,65 @@ class CreateBackupRequest(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+class BatchCreateBackupsRequest(BaseModel):
+    """Request body for creating many backups"""
+    backups: List[CreateBackupRequest] = Field(min_length=1, max_length=1000)
+
+
+class BackupSelector(BaseModel):
+    """Backup filters of batch operations"""
+    phase: Optional[List[str]] = None
+    storage_location: Optional[str] = Field(None, alias="storageLocation")
+    schedule: Optional[str] = None
+    name_prefix: Optional[str] = Field(None, alias="namePrefix")
+    until: Optional[datetime] = None  # startTimestamp < until
+    
+    model_config = {"populate_by_name": True}
+
+
+class BatchDeleteBackupsRequest(BaseModel):
+    """Request body for deleting many backups (by name and/or selector)"""
+    names: Optional[List[str]] = Field(None, max_length=1000)
+    selector: Optional[BackupSelector] = None
+    dry_run: bool = Field(False, alias="dryRun")
+    
+    model_config = {"populate_by_name": True}
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of one item of a batch operation"""
+    name: str
+    ok: bool
+    status: Optional[int] = None  # HTTP status of the failed API call
+    error: Optional[str] = None
+    operation_id: Optional[str] = Field(None, alias="operationId")  # queued deletions
+    
+    model_config = {"populate_by_name": True}
+
+
+class BatchResult(BaseModel):
+    """Result of a batch operation"""
+    total: int
+    succeeded: int
+    failed: int
+    items: List[BatchItemResult]
+
+
+class OperationStatus(BaseModel):
+    """Asynchronous operation (e.g. backup deletion) tracked by the backend"""
+    id: str
+    kind: str  # "DeleteBackup"
+    target: str  # Backup name
+    state: str  # "Queued", "InProgress", "Completed" or "Failed"
+    phase: Optional[str] = None  # DeleteBackupRequest phase
+    request_name: Optional[str] = Field(None, alias="requestName")
+    errors: List[str] = Field(default_factory=list)
+    created_at: str = Field(alias="createdAt")
+    updated_at: str = Field(alias="updatedAt")
+    
+    model_config = {"populate_by_name": True}
+
+
 # ===== RESTORE MODELS =====
 class Restore(BaseModel):
     """Restore resource response"""
@@ -116,6 +175,7 @@ class Schedule(BaseModel):
     name: str
     schedule: str  # cron expression
     last_backup: Optional[str] = Field(None, alias="lastBackup")
+    next_run_time: Optional[str] = Field(None, alias="nextRunTime")
     enabled: bool = True
     template: Optional[ScheduleTemplate] = None
     
@@ -133,6 +193,44 @@ class CreateScheduleRequest(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+class ScheduleSelector(BaseModel):
+    """Schedules targeted by a batch operation (names and/or prefix)"""
+    names: Optional[List[str]] = Field(None, max_length=1000)
+    name_prefix: Optional[str] = Field(None, alias="namePrefix", min_length=1)  # "" would match every schedule
+    
+    model_config = {"populate_by_name": True}
+
+
+class BatchUpdateSchedulesRequest(ScheduleSelector):
+    """
+    Request body for pausing/resuming schedules and changing their templates
+    
+    Template fields left out are kept; fields set to null are removed.
+    """
+    paused: Optional[bool] = None
+    template: Optional[ScheduleTemplate] = None
+    dry_run: bool = Field(False, alias="dryRun")
+
+
+class StaggerSchedulesRequest(ScheduleSelector):
+    """Request body for spreading schedule start minutes over a window"""
+    window_minutes: int = Field(60, ge=1, le=60, alias="windowMinutes")
+    dry_run: bool = Field(False, alias="dryRun")
+
+
+class ScheduleChange(BaseModel):
+    """Cron rewrite of one schedule by the stagger operation"""
+    name: str
+    previous: str
+    schedule: str
+
+
+class StaggerResult(BatchResult):
+    """Result of the stagger operation"""
+    changes: List[ScheduleChange]
+    skipped: List[BatchItemResult]  # schedules whose cron cannot be staggered
+
+
 # ===== BACKUP STORAGE LOCATION MODELS =====
 class BSLConfig(BaseModel):
     """BackupStorageLocation configuration"""
@@ -181,6 +279,11 @@ class ValidateStorageRequest(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+class StorageInventoryRequest(ValidateStorageRequest):
+    """Request body for scanning the backup inventory of a bucket"""
+    pass
+
+
 class ValidateStorageResponse(BaseModel):
     """Response for storage validation"""
     success: bool
@@ -189,3 +292,55 @@ class ValidateStorageResponse(BaseModel):
     latest_backup: Optional[str] = Field(None, alias="latestBackup")
     
     model_config = {"populate_by_name": True}
+
+
+# ===== DASHBOARD SUMMARY MODELS =====
+class ResourceSummary(BaseModel):
+    """Phase counts and warning/error totals of one resource type"""
+    total: int = 0
+    by_phase: Dict[str, int] = Field(default_factory=dict, alias="byPhase")
+    warnings: int = 0
+    errors: int = 0
+    
+    model_config = {"populate_by_name": True}
+
+
+class LastSuccessfulBackup(BaseModel):
+    """Newest Completed backup of a schedule"""
+    name: str
+    completion_timestamp: str = Field(alias="completionTimestamp")
+    
+    model_config = {"populate_by_name": True}
+
+
+class DashboardSummary(BaseModel):
+    """Response for the dashboard summary"""
+    backups: ResourceSummary
+    restores: ResourceSummary
+    schedules_total: int = Field(0, alias="schedulesTotal")
+    schedules_active: int = Field(0, alias="schedulesActive")
+    recent_backups: List[Backup] = Field(default_factory=list, alias="recentBackups")
+    recent_restores: List[Restore] = Field(default_factory=list, alias="recentRestores")
+    last_successful_backups: Dict[str, LastSuccessfulBackup] = Field(
+        default_factory=dict, alias="lastSuccessfulBackups"
+    )
+    
+    model_config = {"populate_by_name": True}
+
+
+# ===== MULTI-CLUSTER MODELS =====
+class ClusterResult(BaseModel):
+    """Result of a fan-out query for one cluster"""
+    cluster: str
+    ok: bool
+    latency_ms: float = Field(alias="latencyMs")
+    data: Optional[Any] = None
+    error: Optional[str] = None
+    
+    model_config = {"populate_by_name": True}
+
+
+class FederatedResponse(BaseModel):
+    """Response of a cross-cluster query (partial when any cluster failed)"""
+    results: List[ClusterResult]
+    partial: bool = False
@@ -0,0 +1,264 @@
+"""
+Velero Dashboard Backend - Backup Analytics
+
+백업별 소요 시간, 항목 수, 전송 바이트, 처리량과 스케줄별 기간 집계
+(p50/p95 소요 시간, 추세)
+
+Informer 이벤트마다 끝난 백업을 스케줄별 시작 시각 순 목록에 반영하므로,
+집계 조회는 요청한 기간의 백업만 bisect로 잘라 계산합니다. 바이트 수는
+transfer tracker가 추적하는 PVB/DataUpload에서 가져옵니다.
+"""
+
+from bisect import bisect_left, insort
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Tuple
+import threading
+import time
+
+from app.config import settings
+from app.services.indexes import schedule_name_index
+from app.services.transfers import transfer_tracker
+
+FINISHED_PHASES = ("Completed", "PartiallyFailed", "Failed", "FailedValidation")
+
+# Durations of failed backups say little about how long a schedule takes
+ANALYZED_PHASES = ("Completed", "PartiallyFailed")
+
+DAY_SECONDS = 86400
+
+
+def _timestamp(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def _isoformat(value: float) -> str:
+    return datetime.fromtimestamp(value, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of sorted values (None when empty)"""
+    if not values:
+        return None
+    return values[min(int(len(values) * q), len(values) - 1)]
+
+
+def slope_per_day(points: List[Tuple[float, float]]) -> Optional[float]:
+    """Least-squares slope of (timestamp, value) points, in value units per day"""
+    n = len(points)
+    if n < 2:
+        return None
+    mean_t = sum(t for t, _ in points) / n
+    mean_v = sum(v for _, v in points) / n
+    var_t = sum((t - mean_t) ** 2 for t, _ in points)
+    if var_t == 0:
+        return None
+    cov = sum((t - mean_t) * (v - mean_v) for t, v in points)
+    return cov / var_t * DAY_SECONDS
+
+
+class BackupRecord:
+    """Duration and item counts of one finished backup"""
+
+    __slots__ = ("name", "schedule", "phase", "started", "completed", "items_backed_up", "total_items")
+
+    def __init__(self, obj: Dict[str, Any]):
+        status = obj.get("status", {})
+        progress = status.get("progress") or {}
+        schedules = schedule_name_index(obj)
+
+        self.name = obj.get("metadata", {}).get("name", "")
+        self.schedule = schedules[0] if schedules else ""
+        self.phase = status.get("phase", "New")
+        self.started = _timestamp(status.get("startTimestamp"))
+        self.completed = _timestamp(status.get("completionTimestamp"))
+        self.items_backed_up = int(progress.get("itemsBackedUp") or 0)
+        self.total_items = int(progress.get("totalItems") or 0)
+
+    @property
+    def duration(self) -> float:
+        return max(self.completed - self.started, 0.0)
+
+    @property
+    def analyzed(self) -> bool:
+        return self.phase in ANALYZED_PHASES
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Record with the bytes of its volume transfers (None when not tracked)"""
+        transfers = transfer_tracker.items("backup", self.name)
+        bytes_done = sum(item.bytes_done for item in transfers) if transfers else None
+        duration = self.duration
+        return {
+            "name": self.name,
+            "schedule": self.schedule,
+            "phase": self.phase,
+            "startTimestamp": _isoformat(self.started),
+            "completionTimestamp": _isoformat(self.completed),
+            "durationSeconds": round(duration),
+            "itemsBackedUp": self.items_backed_up,
+            "totalItems": self.total_items,
+            "itemsPerSecond": round(self.items_backed_up / duration, 2) if duration > 0 else None,
+            "volumes": len(transfers),
+            "totalBytes": sum(item.total_bytes for item in transfers) if transfers else None,
+            "bytesDone": bytes_done,
+            "bytesPerSecond": round(bytes_done / duration) if bytes_done and duration > 0 else None,
+        }
+
+
+def window_stats(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Duration/throughput distribution of the backups of one window"""
+    durations = sorted(row["durationSeconds"] for row in rows)
+    rates = sorted(row["bytesPerSecond"] for row in rows if row["bytesPerSecond"] is not None)
+    sizes = [row["bytesDone"] for row in rows if row["bytesDone"] is not None]
+    return {
+        "backups": len(rows),
+        "p50DurationSeconds": percentile(durations, 0.5),
+        "p95DurationSeconds": percentile(durations, 0.95),
+        "maxDurationSeconds": durations[-1] if durations else None,
+        "p50BytesPerSecond": percentile(rates, 0.5),
+        "meanBytes": round(sum(sizes) / len(sizes)) if sizes else None,
+    }
+
+
+class BackupAnalytics:
+    """
+    Finished backups kept per schedule in startTimestamp order
+
+    Only the phase and timestamps are read from each event; bytes are
+    joined from the transfer tracker when a report is built.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records: Dict[str, BackupRecord] = {}
+        # schedule -> sorted (startTimestamp, name) of analyzed backups
+        self._by_schedule: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+
+    def attach(self, informers) -> None:
+        """Follow finished backups through the backups informer"""
+        informers.informer("backups").add_event_handler(self._on_backup)
+
+    def load(self, backups: List[Dict[str, Any]]) -> None:
+        """Build from a plain list (used before the informer has synced)"""
+        for backup in backups:
+            self._on_backup("ADDED", backup, None)
+
+    # ===== WATCH EVENTS =====
+
+    def _on_backup(self, event_type: str, obj: Dict[str, Any], old: Optional[Dict[str, Any]]) -> None:
+        name = obj.get("metadata", {}).get("name", "")
+        status = obj.get("status", {})
+        finished = (
+            event_type != "DELETED"
+            and status.get("phase") in FINISHED_PHASES
+            and status.get("startTimestamp")
+            and status.get("completionTimestamp")
+        )
+        with self._lock:
+            previous = self._records.pop(name, None)
+            if previous is not None and previous.analyzed:
+                entries = self._by_schedule[previous.schedule]
+                position = bisect_left(entries, (previous.started, name))
+                if position < len(entries) and entries[position] == (previous.started, name):
+                    del entries[position]
+                if not entries:
+                    del self._by_schedule[previous.schedule]
+            if not finished:
+                return
+            record = BackupRecord(obj)
+            self._records[name] = record
+            if record.analyzed:
+                insort(self._by_schedule[record.schedule], (record.started, name))
+
+    # ===== READ API =====
+
+    def backups(self, schedule: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Finished backups (optionally of one schedule, "" = manual), newest first"""
+        with self._lock:
+            records = [
+                r for r in self._records.values()
+                if schedule is None or r.schedule == schedule
+            ]
+        records.sort(key=lambda r: r.started, reverse=True)
+        return [record.to_dict() for record in records[:limit]]
+
+    def durations(self, schedule: str, limit: int = 50) -> List[float]:
+        """Durations of the newest analyzed backups of a schedule, sorted"""
+        with self._lock:
+            entries = self._by_schedule.get(schedule, [])[-limit:]
+            return sorted(self._records[name].duration for _, name in entries)
+
+    def schedules(
+        self,
+        window_days: float,
+        windows: int,
+        schedule: Optional[str] = None,
+        now: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Per-schedule statistics over consecutive time windows
+
+        Args:
+            window_days: Length of each window
+            windows: Number of windows, the newest ending now
+            schedule: Only this schedule
+
+        Returns:
+            Per schedule: the windows (oldest first) with p50/p95 duration
+            and throughput, the least-squares trend of duration and size
+            per day, and `slowingDown` when the newest window's p50
+            duration exceeds the oldest one's by ANALYTICS_SLOWDOWN_THRESHOLD
+        """
+        now = now or time.time()
+        window_seconds = window_days * DAY_SECONDS
+        since = now - window_seconds * windows
+
+        with self._lock:
+            selected = [
+                (name, [self._records[n] for _, n in entries[bisect_left(entries, (since, "")):]])
+                for name, entries in self._by_schedule.items()
+                if name and (schedule is None or name == schedule)
+            ]
+
+        reports = []
+        for name, records in sorted(selected):
+            buckets: List[List[Dict[str, Any]]] = [[] for _ in range(windows)]
+            points_duration = []
+            points_bytes = []
+            for record in records:
+                row = record.to_dict()
+                index = min(int((record.started - since) // window_seconds), windows - 1)
+                buckets[index].append(row)
+                points_duration.append((record.started, row["durationSeconds"]))
+                if row["bytesDone"] is not None:
+                    points_bytes.append((record.started, row["bytesDone"]))
+
+            window_reports = [
+                {
+                    "start": _isoformat(since + i * window_seconds),
+                    "end": _isoformat(since + (i + 1) * window_seconds),
+                    **window_stats(rows),
+                }
+                for i, rows in enumerate(buckets)
+            ]
+            medians = [w["p50DurationSeconds"] for w in window_reports if w["p50DurationSeconds"]]
+            change = medians[-1] / medians[0] - 1 if len(medians) >= 2 else None
+            duration_slope = slope_per_day(points_duration)
+            bytes_slope = slope_per_day(points_bytes)
+
+            reports.append({
+                "schedule": name,
+                **window_stats([row for rows in buckets for row in rows]),
+                "windows": window_reports,
+                "durationTrendSecondsPerDay": round(duration_slope, 2) if duration_slope is not None else None,
+                "bytesTrendPerDay": round(bytes_slope) if bytes_slope is not None else None,
+                "p50DurationChange": round(change, 3) if change is not None else None,
+                "slowingDown": change is not None and change > settings.analytics_slowdown_threshold,
+            })
+        return reports
+
+
+# Global backup analytics instance
+backup_analytics = BackupAnalytics()
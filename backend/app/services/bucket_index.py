@@ -0,0 +1,393 @@
+"""
+Velero Dashboard Backend - Bucket Index
+
+BSL 버킷 내용의 로컬 인덱스 (SQLite)
+
+백업 디렉터리별 object 수/크기/최종 수정 시각을 디스크에 저장하고,
+갱신 시에는 새로 생긴/변경 중인 디렉터리만 다시 스캔합니다.
+재시작 후에도 전체 재스캔 없이 바로 조회할 수 있습니다.
+
+파일 시스템 백업/데이터 무버가 쓰는 kopia/restic 저장소(<prefix>/kopia/,
+<prefix>/restic/)는 백업 디렉터리와 별도로 저장소(namespace)별로 집계합니다.
+"""
+
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+from datetime import datetime
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from app.config import settings
+from app.services.s3_client import s3_validation_service, S3ValidationService
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS backup_prefixes (
+    bsl TEXT NOT NULL,
+    name TEXT NOT NULL,
+    prefix TEXT NOT NULL,
+    object_count INTEGER NOT NULL DEFAULT 0,
+    total_bytes INTEGER NOT NULL DEFAULT 0,
+    last_modified TEXT,
+    last_key TEXT,
+    complete INTEGER NOT NULL DEFAULT 0,
+    scanned_at REAL NOT NULL,
+    PRIMARY KEY (bsl, name)
+);
+CREATE TABLE IF NOT EXISTS repository_prefixes (
+    bsl TEXT NOT NULL,
+    repository_type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    prefix TEXT NOT NULL,
+    object_count INTEGER NOT NULL DEFAULT 0,
+    total_bytes INTEGER NOT NULL DEFAULT 0,
+    last_modified TEXT,
+    scanned_at REAL NOT NULL,
+    PRIMARY KEY (bsl, repository_type, name)
+);
+CREATE TABLE IF NOT EXISTS bsl_scans (
+    bsl TEXT PRIMARY KEY,
+    bucket TEXT NOT NULL,
+    root TEXT NOT NULL,
+    refreshed_at REAL NOT NULL
+);
+"""
+
+# Rows written per transaction while scanning a backup directory
+COMMIT_EVERY = 1000
+
+# Unified repository layouts under the BSL prefix (file system backup / data mover)
+REPOSITORY_TYPES = ("kopia", "restic")
+
+
+class BucketIndex:
+    """On-disk index of Velero backup directories per BSL"""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+
+    # ===== REFRESH =====
+
+    def refresh_bsl(self, bsl_cr: Dict[str, Any]) -> Dict[str, Any]:
+        """Refresh the index of a BackupStorageLocation CR (backend S3 credentials)"""
+        return self.refresh(
+            bsl=bsl_cr.get("metadata", {}).get("name", ""),
+            **S3ValidationService.bsl_target(bsl_cr)
+        )
+
+    def refresh(
+        self,
+        bsl: str,
+        s3_url: Optional[str],
+        bucket: str,
+        region: Optional[str] = None,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        prefix: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Incrementally refresh the index of one BSL (blocking)
+
+        - Backup directories are enumerated with Delimiter "/" (one request
+          per 1000 backups).
+        - New directories, and directories that were still being written
+          when last indexed (modified within the settle window), are scanned.
+        - Interrupted scans resume with StartAfter=last indexed key.
+        - Directories that disappeared from the bucket are dropped.
+        - kopia/restic repositories are rescanned whole once their last scan
+          is older than BUCKET_INDEX_REPOSITORY_RESCAN_SECONDS (maintenance
+          rewrites and deletes packs, so they never settle).
+
+        Returns:
+            Refresh statistics
+        """
+        started = time.monotonic()
+        root = S3ValidationService.backups_root(prefix)
+        s3_client = s3_validation_service.client_pool.get(s3_url, region, access_key, secret_key)
+        known = {row["name"]: row for row in self._rows(bsl)}
+
+        seen = set()
+        scanned = skipped = 0
+        for backup_prefix in S3ValidationService.iter_backup_prefixes(s3_client, bucket, root):
+            name = backup_prefix[len(root):].rstrip("/")
+            seen.add(name)
+            row = known.get(name)
+
+            if row is not None and row["complete"]:
+                if self._is_settled(row):
+                    skipped += 1
+                    continue
+                # Directory was still being written when indexed: rescan it
+                row = None
+
+            self._scan_prefix(s3_client, bsl, bucket, name, backup_prefix, row)
+            scanned += 1
+
+        repositories, repositories_scanned = self._refresh_repositories(
+            s3_client, bsl, bucket, prefix
+        )
+
+        removed = [name for name in known if name not in seen]
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM backup_prefixes WHERE bsl = ? AND name = ?",
+                [(bsl, name) for name in removed]
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO bsl_scans (bsl, bucket, root, refreshed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (bsl, bucket, root, time.time())
+            )
+            self._conn.commit()
+
+        stats = {
+            "bsl": bsl,
+            "backups": len(seen),
+            "scanned": scanned,
+            "skipped": skipped,
+            "removed": len(removed),
+            "repositories": repositories,
+            "repositoriesScanned": repositories_scanned,
+            "durationSeconds": round(time.monotonic() - started, 3),
+        }
+        logger.info(f"Bucket index refreshed: {stats}")
+        return stats
+
+    @staticmethod
+    def _is_settled(row: sqlite3.Row) -> bool:
+        """Whether no object was written in the settle window before the last scan"""
+        if not row["last_modified"]:
+            return True
+        modified = datetime.fromisoformat(row["last_modified"]).timestamp()
+        return row["scanned_at"] - modified >= settings.bucket_index_settle_seconds
+
+    def _scan_prefix(
+        self,
+        s3_client,
+        bsl: str,
+        bucket: str,
+        name: str,
+        backup_prefix: str,
+        row: Optional[sqlite3.Row]
+    ) -> None:
+        """Scan one backup directory, checkpointing so it can resume"""
+        if row is not None:
+            # Resume an interrupted scan after the last indexed key
+            count, size = row["object_count"], row["total_bytes"]
+            last_modified, last_key = row["last_modified"], row["last_key"]
+        else:
+            count = size = 0
+            last_modified = last_key = None
+
+        def save(complete: bool) -> None:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO backup_prefixes "
+                    "(bsl, name, prefix, object_count, total_bytes, last_modified, "
+                    "last_key, complete, scanned_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (bsl, name, backup_prefix, count, size, last_modified,
+                     last_key, int(complete), time.time())
+                )
+                self._conn.commit()
+
+        for i, obj in enumerate(
+            S3ValidationService.iter_objects(s3_client, bucket, backup_prefix, start_after=last_key),
+            start=1
+        ):
+            count += 1
+            size += obj.get("Size", 0)
+            modified = obj.get("LastModified")
+            if modified:
+                modified = modified.isoformat()
+                if last_modified is None or modified > last_modified:
+                    last_modified = modified
+            last_key = obj["Key"]
+            if i % COMMIT_EVERY == 0:
+                save(complete=False)
+
+        save(complete=True)
+
+    def _refresh_repositories(
+        self,
+        s3_client,
+        bsl: str,
+        bucket: str,
+        prefix: Optional[str]
+    ) -> Tuple[int, int]:
+        """
+        Refresh the kopia/restic repository totals of a BSL
+
+        Returns:
+            (repositories found, repositories scanned)
+        """
+        with self._lock:
+            known = {
+                (row["repository_type"], row["name"]): row["scanned_at"]
+                for row in self._conn.execute(
+                    "SELECT repository_type, name, scanned_at FROM repository_prefixes WHERE bsl = ?",
+                    (bsl,)
+                )
+            }
+
+        seen = set()
+        scanned = 0
+        for repository_type in REPOSITORY_TYPES:
+            root = S3ValidationService.repository_root(prefix, repository_type)
+            for repository_prefix in S3ValidationService.iter_backup_prefixes(s3_client, bucket, root):
+                key = (repository_type, repository_prefix[len(root):].rstrip("/"))
+                seen.add(key)
+                scanned_at = known.get(key)
+                if scanned_at is not None and (
+                    time.time() - scanned_at < settings.bucket_index_repository_rescan_seconds
+                ):
+                    continue
+                self._scan_repository(s3_client, bsl, bucket, key, repository_prefix)
+                scanned += 1
+
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM repository_prefixes WHERE bsl = ? AND repository_type = ? AND name = ?",
+                [(bsl, *key) for key in known if key not in seen]
+            )
+            self._conn.commit()
+        return len(seen), scanned
+
+    def _scan_repository(
+        self,
+        s3_client,
+        bsl: str,
+        bucket: str,
+        key: Tuple[str, str],
+        repository_prefix: str
+    ) -> None:
+        """Count the objects of one repository (replaces its previous totals)"""
+        count = size = 0
+        last_modified = None
+        for obj in S3ValidationService.iter_objects(s3_client, bucket, repository_prefix):
+            count += 1
+            size += obj.get("Size", 0)
+            modified = obj.get("LastModified")
+            if modified:
+                modified = modified.isoformat()
+                if last_modified is None or modified > last_modified:
+                    last_modified = modified
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO repository_prefixes "
+                "(bsl, repository_type, name, prefix, object_count, total_bytes, "
+                "last_modified, scanned_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (bsl, *key, repository_prefix, count, size, last_modified, time.time())
+            )
+            self._conn.commit()
+
+    # ===== QUERIES =====
+
+    def _rows(self, bsl: str) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT * FROM backup_prefixes WHERE bsl = ?", (bsl,)
+            ).fetchall()
+
+    def iter_backups(self, bsl: str) -> Iterator[Dict[str, Any]]:
+        """Indexed backup directories of a BSL, in name order (streamed)"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT name, prefix, object_count, total_bytes, last_modified, complete "
+                "FROM backup_prefixes WHERE bsl = ? ORDER BY name",
+                (bsl,)
+            )
+            rows = cursor.fetchmany(COMMIT_EVERY)
+        while rows:
+            for row in rows:
+                yield {
+                    "name": row["name"],
+                    "prefix": row["prefix"],
+                    "objectCount": row["object_count"],
+                    "totalBytes": row["total_bytes"],
+                    "lastModified": row["last_modified"],
+                    "complete": bool(row["complete"]),
+                }
+            with self._lock:
+                rows = cursor.fetchmany(COMMIT_EVERY)
+
+    def repositories(self, bsl: str) -> List[Dict[str, Any]]:
+        """Indexed kopia/restic repositories of a BSL"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT repository_type, name, prefix, object_count, total_bytes, last_modified "
+                "FROM repository_prefixes WHERE bsl = ? ORDER BY repository_type, name",
+                (bsl,)
+            ).fetchall()
+        return [
+            {
+                "type": row["repository_type"],
+                "name": row["name"],
+                "prefix": row["prefix"],
+                "objectCount": row["object_count"],
+                "totalBytes": row["total_bytes"],
+                "lastModified": row["last_modified"],
+            }
+            for row in rows
+        ]
+
+    def usage(self, bsl: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Per-BSL totals (aggregated in SQLite)
+
+        objects/totalBytes cover both the backup directories and the
+        kopia/restic repositories; each part is also reported on its own.
+        """
+        query = (
+            "SELECT s.bsl, s.bucket, s.root, s.refreshed_at, "
+            "COUNT(p.name) AS backups, COALESCE(SUM(p.object_count), 0) AS objects, "
+            "COALESCE(SUM(p.total_bytes), 0) AS total_bytes, "
+            "(SELECT COUNT(*) FROM repository_prefixes r WHERE r.bsl = s.bsl) AS repositories, "
+            "(SELECT COALESCE(SUM(r.object_count), 0) FROM repository_prefixes r "
+            "WHERE r.bsl = s.bsl) AS repository_objects, "
+            "(SELECT COALESCE(SUM(r.total_bytes), 0) FROM repository_prefixes r "
+            "WHERE r.bsl = s.bsl) AS repository_bytes "
+            "FROM bsl_scans s LEFT JOIN backup_prefixes p ON p.bsl = s.bsl "
+        )
+        params: tuple = ()
+        if bsl:
+            query += "WHERE s.bsl = ? "
+            params = (bsl,)
+        query += "GROUP BY s.bsl ORDER BY s.bsl"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            {
+                "bsl": row["bsl"],
+                "bucket": row["bucket"],
+                "prefix": row["root"],
+                "refreshedAt": row["refreshed_at"],
+                "backups": row["backups"],
+                "repositories": row["repositories"],
+                "objects": row["objects"] + row["repository_objects"],
+                "totalBytes": row["total_bytes"] + row["repository_bytes"],
+                "backupObjects": row["objects"],
+                "backupBytes": row["total_bytes"],
+                "repositoryObjects": row["repository_objects"],
+                "repositoryBytes": row["repository_bytes"],
+            }
+            for row in rows
+        ]
+
+
+# Global bucket index instance
+bucket_index = BucketIndex(os.path.join(settings.data_dir, "bucket_index.db"))
@@ -0,0 +1,280 @@
+"""
+Velero Dashboard Backend - Cron Engine
+
+Velero Schedule cron 식 해석과 다음 실행 시각 계산
+
+Velero가 쓰는 robfig/cron 표준 파서와 같은 문법을 지원합니다: 5개 필드
+(분 시 일 월 요일), 월/요일 이름, 범위/목록/간격, @daily 등의 descriptor,
+@every <duration>, CRON_TZ=/TZ= 시간대 접두사.
+"""
+
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Optional, List, Dict, Tuple, Iterator
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.services.repositories import parse_go_duration
+
+MONTH_NAMES = {
+    name: number
+    for number, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"),
+        start=1
+    )
+}
+
+DOW_NAMES = {name: number for number, name in enumerate(("sun", "mon", "tue", "wed", "thu", "fri", "sat"))}
+
+# (min, max, names) of minute, hour, day of month, month, day of week
+FIELDS: Tuple[Tuple[int, int, dict], ...] = (
+    (0, 59, {}),
+    (0, 23, {}),
+    (1, 31, {}),
+    (1, 12, MONTH_NAMES),
+    (0, 6, DOW_NAMES),
+)
+
+DESCRIPTORS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+# Give up looking for a matching time after this many years (e.g. "0 0 30 2 *")
+SEARCH_YEARS = 5
+
+
+class CronError(ValueError):
+    """Invalid cron expression"""
+
+
+def _split_prefix(expression: str) -> Tuple[str, str]:
+    """(CRON_TZ=/TZ= prefix or "", rest of the expression)"""
+    spec = expression.strip()
+    if spec.startswith(("CRON_TZ=", "TZ=")):
+        prefix, _, spec = spec.partition(" ")
+        return prefix, spec.strip()
+    return "", spec
+
+
+def _parse_value(value: str, names: dict) -> int:
+    number = names.get(value.lower())
+    if number is not None:
+        return number
+    try:
+        return int(value)
+    except ValueError:
+        raise CronError(f"Invalid value {value!r}")
+
+
+def _parse_field(field: str, low: int, high: int, names: dict) -> Tuple[List[int], bool]:
+    """
+    Values of one cron field
+
+    Returns:
+        (sorted values, whether the field is an unrestricted * or ?) - like
+        robfig/cron, a step such as */2 restricts the field
+    """
+    values = set()
+    star = False
+    for part in field.split(","):
+        range_part, _, step_part = part.partition("/")
+        step = 1
+        if step_part:
+            step = _parse_value(step_part, {})
+            if step <= 0:
+                raise CronError(f"Invalid step in {part!r}")
+
+        if range_part in ("*", "?"):
+            start, end = low, high
+            star = star or step == 1
+        elif "-" in range_part:
+            first, _, last = range_part.partition("-")
+            start, end = _parse_value(first, names), _parse_value(last, names)
+        else:
+            start = _parse_value(range_part, names)
+            # "5/10" means 5-max/10
+            end = high if step_part else start
+
+        if start < low or end > high or start > end:
+            raise CronError(f"{part!r} is outside {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return sorted(values), star
+
+
+class CronSchedule:
+    """
+    Parsed cron expression
+
+    Example:
+        CronSchedule.parse("CRON_TZ=Asia/Seoul 0 2 * * 1-5").next(now)
+    """
+
+    def __init__(
+        self,
+        expression: str,
+        tz: tzinfo,
+        fields: Optional[List[List[int]]] = None,
+        day_star: Tuple[bool, bool] = (True, True),
+        every: Optional[timedelta] = None
+    ):
+        self.expression = expression
+        self.tz = tz
+        self.every = every
+        if fields is not None:
+            self.minutes, self.hours, self.days, self.months, self.weekdays = fields
+            self._sets = [set(values) for values in fields]
+        self.day_star = day_star
+
+    @classmethod
+    def parse(cls, expression: str) -> "CronSchedule":
+        """
+        Parse a Velero schedule expression
+
+        Raises:
+            CronError: Invalid expression or time zone
+        """
+        prefix, spec = _split_prefix(expression)
+        tz: tzinfo = timezone.utc
+        if prefix:
+            name = prefix.split("=", 1)[1]
+            try:
+                tz = ZoneInfo(name)
+            except (ZoneInfoNotFoundError, ValueError):
+                raise CronError(f"Unknown time zone {name!r}")
+
+        if spec.startswith("@every"):
+            seconds = parse_go_duration(spec[len("@every"):].strip())
+            if not seconds:
+                raise CronError(f"Invalid duration in {expression!r}")
+            # Go rounds to whole seconds, at least one
+            return cls(expression, tz, every=timedelta(seconds=max(round(seconds), 1)))
+
+        spec = DESCRIPTORS.get(spec.lower(), spec)
+        parts = spec.split()
+        if len(parts) != len(FIELDS):
+            raise CronError(f"Expected 5 fields in {expression!r}, got {len(parts)}")
+
+        fields = []
+        stars = []
+        for part, (low, high, names) in zip(parts, FIELDS):
+            values, star = _parse_field(part, low, high, names)
+            fields.append(values)
+            stars.append(star)
+        return cls(expression, tz, fields, (stars[2], stars[4]))
+
+    def _day_matches(self, t: datetime) -> bool:
+        # Like cron: when both day fields are restricted, either one matching is enough
+        dom = t.day in self._sets[2]
+        dow = t.isoweekday() % 7 in self._sets[4]
+        if self.day_star[0] or self.day_star[1]:
+            return dom and dow
+        return dom or dow
+
+    def next(self, after: datetime) -> Optional[datetime]:
+        """
+        First activation strictly after a time (aware datetime)
+
+        Returns:
+            Aware datetime in UTC, or None when the expression never matches
+        """
+        if self.every is not None:
+            return (after + self.every).replace(microsecond=0).astimezone(timezone.utc)
+
+        t = after.astimezone(self.tz).replace(tzinfo=None, second=0, microsecond=0) + timedelta(minutes=1)
+        limit = t.year + SEARCH_YEARS
+        while t.year <= limit:
+            if t.month not in self._sets[3]:
+                i = bisect_right(self.months, t.month)
+                if i < len(self.months):
+                    t = datetime(t.year, self.months[i], 1)
+                else:
+                    t = datetime(t.year + 1, self.months[0], 1)
+                continue
+            if not self._day_matches(t):
+                t = datetime(t.year, t.month, t.day) + timedelta(days=1)
+                continue
+            if t.hour not in self._sets[1]:
+                i = bisect_right(self.hours, t.hour)
+                if i < len(self.hours):
+                    t = t.replace(hour=self.hours[i], minute=0)
+                else:
+                    t = datetime(t.year, t.month, t.day) + timedelta(days=1)
+                continue
+            if t.minute not in self._sets[0]:
+                i = bisect_right(self.minutes, t.minute)
+                if i < len(self.minutes):
+                    t = t.replace(minute=self.minutes[i])
+                else:
+                    t = t.replace(minute=0) + timedelta(hours=1)
+                continue
+
+            result = t.replace(tzinfo=self.tz).astimezone(timezone.utc)
+            if result > after:
+                return result
+            # Wall time repeated by a DST change: already passed
+            t += timedelta(minutes=1)
+        return None
+
+    def runs(self, after: datetime, until: datetime) -> Iterator[datetime]:
+        """Activations in (after, until]"""
+        t = self.next(after)
+        while t is not None and t <= until:
+            yield t
+            t = self.next(t)
+
+
+def stagger(expressions: Dict[str, str], window_minutes: int) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Spread the start minutes of schedules firing in the same hours
+
+    Schedules are grouped by time zone and their hour, day of month, month
+    and day of week fields, so schedules on different days are left alone.
+    Within a group of two or more, minutes are set evenly apart over
+    window_minutes, starting at the group's earliest minute (moved back so
+    the window fits in the hour). Only the minute field is rewritten;
+    descriptors such as @daily are expanded to their 5 fields.
+
+    Args:
+        expressions: Schedule name -> cron expression
+        window_minutes: Spread of each group (1-60)
+
+    Returns:
+        (name -> new expression of changed schedules, name -> reason of
+        schedules that cannot be staggered)
+    """
+    groups: Dict[Tuple[str, ...], List[Tuple[str, List[str]]]] = defaultdict(list)
+    skipped: Dict[str, str] = {}
+    for name, expression in sorted(expressions.items()):
+        try:
+            CronSchedule.parse(expression)
+        except CronError as e:
+            skipped[name] = str(e)
+            continue
+        prefix, spec = _split_prefix(expression)
+        if spec.startswith("@every"):
+            skipped[name] = "@every schedules have no fixed minute"
+            continue
+        fields = DESCRIPTORS.get(spec.lower(), spec).split()
+        if not fields[0].isdigit():
+            skipped[name] = f"Minute field {fields[0]!r} is not a single value"
+            continue
+        groups[(prefix, *fields[1:])].append((name, fields))
+
+    changes: Dict[str, str] = {}
+    for (prefix, *_), members in groups.items():
+        if len(members) < 2:
+            continue
+        start = min(min(int(fields[0]) for _, fields in members), 60 - window_minutes)
+        for i, (name, fields) in enumerate(members):
+            minute = start + i * window_minutes // len(members)
+            if minute == int(fields[0]):
+                continue
+            rewritten = " ".join([str(minute)] + fields[1:])
+            changes[name] = f"{prefix} {rewritten}" if prefix else rewritten
+    return changes, skipped
@@ -0,0 +1,192 @@
+"""
+Velero Dashboard Backend - Event Broadcaster
+
+Informer 변경 이벤트를 SSE 구독자들에게 전달 (fan-out)
+
+API 서버 watch는 리소스당 1개뿐이고, 브라우저 탭 수와 무관하게
+이 broadcaster가 모든 구독자에게 delta를 전달합니다.
+"""
+
+from collections import deque
+from typing import Optional, List, Dict, Any, Callable, Set, Tuple
+import asyncio
+import logging
+import threading
+import time
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+Serializer = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class Subscription:
+    """A single SSE client"""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        resources: Optional[Set[str]],
+        queue_size: int
+    ):
+        self.loop = loop
+        self.resources = resources
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def wants(self, resource: str) -> bool:
+        return self.resources is None or resource in self.resources
+
+    def offer(self, event: Dict[str, Any]) -> None:
+        """Enqueue an event (runs on the subscriber's event loop)"""
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Client too slow: tell it to resync instead of buffering forever
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(
+                {"id": None, "event": "resync", "data": {"reason": "overflow"}}
+            )
+
+
+class EventBroadcaster:
+    """
+    Fan-out of informer events with a replay buffer
+
+    Every event gets a cursor "<epoch>-<seq>". Clients reconnecting with
+    Last-Event-ID get the missed events replayed from the buffer, or a
+    "resync" event if the cursor is too old or from a previous process.
+    """
+
+    def __init__(self, history_size: int):
+        self.epoch = format(int(time.time()), "x")
+        self._seq = 0
+        self._history: deque = deque(maxlen=history_size)
+        self._subscribers: Set[Subscription] = set()
+        self._lock = threading.Lock()
+
+    # ===== PUBLISHING =====
+
+    def attach(self, informers, serializers: Dict[str, Serializer]) -> None:
+        """
+        Publish changes of the given informers
+
+        Args:
+            informers: InformerManager
+            serializers: plural -> function converting a CR to the API model
+        """
+        for plural, serializer in serializers.items():
+            informers.informer(plural).add_event_handler(
+                self._make_handler(plural, serializer)
+            )
+
+    def _make_handler(self, plural: str, serializer: Serializer):
+        def handler(event_type: str, obj: Dict[str, Any], old: Optional[Dict[str, Any]]) -> None:
+            self.publish(plural, event_type, obj, serializer)
+        return handler
+
+    def publish(
+        self,
+        resource: str,
+        event_type: str,
+        obj: Dict[str, Any],
+        serializer: Serializer
+    ) -> None:
+        """Record an event and deliver it to subscribers (thread-safe)"""
+        metadata = obj.get("metadata", {})
+        try:
+            payload = serializer(obj)
+        except Exception as e:
+            logger.warning(f"Cannot serialize {resource} event: {e}")
+            return
+
+        with self._lock:
+            self._seq += 1
+            event = {
+                "id": self.cursor(self._seq),
+                "event": resource,
+                "data": {
+                    "type": event_type,
+                    "resource": resource,
+                    "name": metadata.get("name", ""),
+                    "resourceVersion": metadata.get("resourceVersion"),
+                    "object": payload,
+                },
+            }
+            self._history.append((self._seq, event))
+            subscribers = [s for s in self._subscribers if s.wants(resource)]
+
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # Event loop already closed
+                self.unsubscribe(subscription)
+
+    # ===== SUBSCRIBING =====
+
+    def cursor(self, seq: int) -> str:
+        return f"{self.epoch}-{seq}"
+
+    def _parse_cursor(self, cursor: str) -> Optional[int]:
+        """Sequence number of a cursor from this process, else None"""
+        epoch, _, seq = cursor.partition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def subscribe(
+        self,
+        resources: Optional[Set[str]] = None,
+        last_event_id: Optional[str] = None
+    ) -> Tuple[Subscription, List[Dict[str, Any]]]:
+        """
+        Register a subscriber
+
+        Returns:
+            (subscription, initial events) - initial events are either the
+            replay after last_event_id, or a single "sync"/"resync" event
+            carrying the current cursor.
+        """
+        subscription = Subscription(
+            asyncio.get_running_loop(),
+            resources,
+            settings.event_queue_size
+        )
+
+        with self._lock:
+            cursor = self.cursor(self._seq)
+            current = {"id": cursor, "event": "sync", "data": {"cursor": cursor}}
+            initial: List[Dict[str, Any]] = [current]
+
+            if last_event_id:
+                seq = self._parse_cursor(last_event_id)
+                oldest = self._history[0][0] if self._history else self._seq + 1
+                if seq is None or seq > self._seq or seq < oldest - 1:
+                    current["event"] = "resync"
+                else:
+                    initial = [
+                        event for event_seq, event in self._history
+                        if event_seq > seq and subscription.wants(event["event"])
+                    ]
+
+            self._subscribers.add(subscription)
+
+        return subscription, initial
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+
+# Global event broadcaster instance
+event_broadcaster = EventBroadcaster(settings.event_history_size)
@@ -0,0 +1,137 @@
+"""
+Velero Dashboard Backend - Multi-Cluster Federation
+
+여러 kubeconfig context를 하나의 backend에서 조회 (fan-out)
+
+클러스터마다 별도의 KubernetesClient / informer 캐시를 두고, 교차 클러스터
+조회는 모든 클러스터에 동시에 요청합니다. 전체 지연 시간은 가장 느린
+클러스터(최대 timeout)와 같고, 실패한 클러스터는 부분 결과로 보고됩니다.
+"""
+
+from typing import Optional, List, Dict, Any, Callable, Awaitable
+import asyncio
+import logging
+import time
+
+from app.config import settings
+from app.services.k8s_client import (
+    KubernetesClient,
+    AsyncKubernetesClient,
+    k8s_client,
+    async_k8s_client
+)
+from app.services.informer import InformerManager, informers
+
+logger = logging.getLogger(__name__)
+
+
+class ClusterMember:
+    """Client and cache of one cluster"""
+
+    def __init__(
+        self,
+        name: str,
+        sync_client: KubernetesClient,
+        async_client: AsyncKubernetesClient,
+        cache: InformerManager,
+        local: bool = False
+    ):
+        self.name = name
+        self.client = sync_client
+        self.async_client = async_client
+        self.informers = cache
+        self.local = local
+
+
+class ClusterFederation:
+    """Registry of clusters and concurrent fan-out queries"""
+
+    def __init__(self):
+        self.members: Dict[str, ClusterMember] = {
+            settings.cluster_name: ClusterMember(
+                settings.cluster_name,
+                k8s_client,
+                async_k8s_client,
+                informers,
+                local=True
+            )
+        }
+
+        for context in settings.federation_contexts_list:
+            if context in self.members:
+                continue
+            try:
+                sync_client = KubernetesClient(context=context)
+            except Exception as e:
+                logger.error(f"Skipping cluster context {context}: {e}")
+                continue
+            self.members[context] = ClusterMember(
+                context,
+                sync_client,
+                AsyncKubernetesClient(sync_client, settings.k8s_client_max_workers),
+                InformerManager(sync_client)
+            )
+
+    def start(self) -> None:
+        """Start informers of the remote clusters (local ones are started by main)"""
+        for member in self.members.values():
+            if not member.local:
+                member.informers.start()
+
+    def stop(self) -> None:
+        for member in self.members.values():
+            if not member.local:
+                member.informers.stop()
+
+    def select(self, clusters: Optional[List[str]] = None) -> List[ClusterMember]:
+        """
+        Members by name (all when None)
+
+        Raises:
+            KeyError: Unknown cluster name
+        """
+        if not clusters:
+            return list(self.members.values())
+        return [self.members[name] for name in clusters]
+
+    async def fan_out(
+        self,
+        query: Callable[[ClusterMember], Awaitable[Any]],
+        clusters: Optional[List[str]] = None,
+        timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a query against every cluster concurrently
+
+        Args:
+            query: Coroutine function taking a ClusterMember
+            clusters: Cluster names (all when None)
+            timeout: Per-cluster timeout in seconds
+
+        Returns:
+            One result per cluster:
+            {cluster, ok, latencyMs, data | error}
+        """
+        timeout = timeout or settings.federation_timeout_seconds
+
+        async def run(member: ClusterMember) -> Dict[str, Any]:
+            started = time.monotonic()
+            result: Dict[str, Any] = {"cluster": member.name}
+            try:
+                result["data"] = await asyncio.wait_for(query(member), timeout)
+                result["ok"] = True
+            except asyncio.TimeoutError:
+                result["ok"] = False
+                result["error"] = f"Timed out after {timeout}s"
+            except Exception as e:
+                logger.warning(f"Cluster {member.name} query failed: {e}")
+                result["ok"] = False
+                result["error"] = str(e)
+            result["latencyMs"] = round((time.monotonic() - started) * 1000, 1)
+            return result
+
+        return await asyncio.gather(*(run(m) for m in self.select(clusters)))
+
+
+# Global federation instance
+federation = ClusterFederation()
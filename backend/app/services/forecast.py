@@ -0,0 +1,270 @@
+"""
+Velero Dashboard Backend - Schedule Forecast
+
+스케줄별 다음 실행 시각 예측과 백업 시간대 충돌(동시 실행 피크) 감지
+
+Schedule마다 파싱한 cron 식과 계산된 다음 실행 목록을 캐시하고, informer
+이벤트로 스케줄이 바뀌면 무효화합니다. 과거 소요 시간(p50/p95)을 실행
+시각에 겹쳐 시간 슬롯별 동시 실행 수를 계산합니다.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Tuple
+import threading
+
+from app.config import settings
+from app.services.analytics import backup_analytics, percentile
+from app.services.cron import CronSchedule, CronError
+
+# Bound of cached runs per schedule (e.g. "@every 1m" over a week)
+MAX_CACHED_RUNS = 2000
+
+DURATION_QUANTILES = {"p50": 0.5, "p95": 0.95}
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _isoformat(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class ScheduleEntry:
+    """Parsed cron expression and cached upcoming runs of one Schedule"""
+
+    def __init__(self, obj: Dict[str, Any]):
+        metadata = obj.get("metadata", {})
+        spec = obj.get("spec", {})
+        status = obj.get("status", {})
+
+        self.name = metadata.get("name", "")
+        self.resource_version = metadata.get("resourceVersion")
+        self.expression = spec.get("schedule", "")
+        self.paused = bool(spec.get("paused", False))
+        self.cron: Optional[CronSchedule] = None
+        self.error: Optional[str] = None
+        self.first: Optional[datetime] = None
+        self.truncated = False  # last upcoming() stopped at MAX_CACHED_RUNS
+        self._runs: List[datetime] = []
+
+        try:
+            self.cron = CronSchedule.parse(self.expression)
+        except CronError as e:
+            self.error = str(e)
+            return
+        # Like Velero: the next run follows the last backup (or the creation)
+        anchor = _parse_time(status.get("lastBackup") or metadata.get("creationTimestamp"))
+        if anchor is not None:
+            self.first = self.cron.next(anchor)
+
+    def due(self, now: datetime) -> bool:
+        """Whether Velero should already have started the next backup"""
+        return not self.paused and self.first is not None and self.first <= now
+
+    def upcoming(self, now: datetime, until: datetime, count: int) -> List[datetime]:
+        """
+        Runs after now: all of them up to until, and at least count
+
+        The cached list is trimmed and extended instead of recomputed; it
+        holds at most MAX_CACHED_RUNS runs, so `truncated` is set when
+        until is not reached.
+        """
+        self.truncated = False
+        if self.cron is None or self.paused:
+            return []
+        runs = [t for t in self._runs if t > now]
+        if not runs and self.first is not None and self.first > now:
+            runs = [self.first]
+        cursor = runs[-1] if runs else now
+        while len(runs) < MAX_CACHED_RUNS and (len(runs) < count or runs[-1] < until):
+            t = self.cron.next(cursor)
+            if t is None:
+                break
+            runs.append(t)
+            cursor = t
+        self._runs = runs
+        if len(runs) >= MAX_CACHED_RUNS and runs[-1] < until:
+            following = self.cron.next(runs[-1])
+            self.truncated = following is not None and following <= until
+        return [t for i, t in enumerate(runs) if i < count or t <= until]
+
+
+def _peaks(intervals: List[Tuple[datetime, datetime, str]], threshold: int) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Sweep over predicted runs
+
+    Returns:
+        (highest concurrency, time ranges where concurrency >= threshold)
+    """
+    events = sorted(
+        [(start, 1, name) for start, _, name in intervals]
+        + [(end, -1, name) for _, end, name in intervals],
+        key=lambda e: (e[0], e[1])  # ends before starts at the same instant
+    )
+    running: Dict[str, int] = {}
+    peak: Dict[str, Any] = {"concurrency": 0, "start": None, "schedules": []}
+    collisions: List[Dict[str, Any]] = []
+    current: Optional[Dict[str, Any]] = None
+
+    for i, (at, delta, name) in enumerate(events):
+        running[name] = running.get(name, 0) + delta
+        if not running[name]:
+            del running[name]
+        if i + 1 < len(events) and events[i + 1][0] == at:
+            continue  # settle every event of this instant first
+        concurrency = sum(running.values())
+        if concurrency > peak["concurrency"]:
+            peak = {"concurrency": concurrency, "start": _isoformat(at), "schedules": sorted(running)}
+        if concurrency >= threshold:
+            if current is None:
+                current = {"start": _isoformat(at), "maxConcurrency": 0, "schedules": set()}
+                collisions.append(current)
+            current["maxConcurrency"] = max(current["maxConcurrency"], concurrency)
+            current["schedules"].update(running)
+        elif current is not None:
+            current["end"] = _isoformat(at)
+            current = None
+
+    for collision in collisions:
+        collision["schedules"] = sorted(collision["schedules"])
+    return peak, collisions
+
+
+class ScheduleForecaster:
+    """Cache of ScheduleEntry per Schedule, invalidated by informer events"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, ScheduleEntry] = {}
+
+    def attach(self, informers) -> None:
+        """Rebuild an entry whenever its Schedule changes"""
+        informers.informer("schedules").add_event_handler(self._on_schedule)
+
+    def _on_schedule(self, event_type: str, obj: Dict[str, Any], old: Optional[Dict[str, Any]]) -> None:
+        name = obj.get("metadata", {}).get("name", "")
+        entry = None if event_type == "DELETED" else ScheduleEntry(obj)
+        with self._lock:
+            if entry is None:
+                self._entries.pop(name, None)
+            else:
+                self._entries[name] = entry
+
+    def entry(self, obj: Dict[str, Any]) -> ScheduleEntry:
+        """Cached entry of a Schedule CR (built on the fly when the cache is behind)"""
+        metadata = obj.get("metadata", {})
+        with self._lock:
+            entry = self._entries.get(metadata.get("name", ""))
+        if entry is not None and entry.resource_version == metadata.get("resourceVersion"):
+            return entry
+        return ScheduleEntry(obj)
+
+    def next_run(self, obj: Dict[str, Any], now: Optional[datetime] = None) -> Optional[str]:
+        """Next run of a Schedule (now when it is due, None when paused or invalid)"""
+        now = now or datetime.now(timezone.utc)
+        entry = self.entry(obj)
+        if entry.due(now):
+            return _isoformat(now)
+        with self._lock:
+            runs = entry.upcoming(now, now, 1)
+        return _isoformat(runs[0]) if runs else None
+
+    def forecast(
+        self,
+        schedules: List[Dict[str, Any]],
+        hours: float,
+        slot_minutes: int,
+        runs: int,
+        duration: str,
+        threshold: int,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Upcoming runs of every schedule and their predicted overlap
+
+        Each run is assumed to last the schedule's historical p50 (or p95)
+        backup duration, FORECAST_DEFAULT_DURATION_SECONDS without history.
+
+        Args:
+            schedules: Schedule CRs
+            hours: Forecast horizon
+            slot_minutes: Slot length of the timeline
+            runs: Next runs listed per schedule
+            duration: "p50" or "p95"
+            threshold: Concurrency reported as a collision
+
+        Returns:
+            Per-schedule next runs, non-empty slots with the schedules
+            starting/running in them, the peak and the collision ranges.
+            A schedule with more than MAX_CACHED_RUNS runs in the horizon
+            (e.g. @every 1m over a week) is counted up to that bound and
+            flagged `runsTruncated`, also listed in `truncatedSchedules`.
+        """
+        now = (now or datetime.now(timezone.utc)).replace(microsecond=0)
+        until = now + timedelta(hours=hours)
+        quantile = DURATION_QUANTILES[duration]
+
+        reports = []
+        intervals: List[Tuple[datetime, datetime, str]] = []
+        for obj in sorted(schedules, key=lambda s: s.get("metadata", {}).get("name", "")):
+            entry = self.entry(obj)
+            with self._lock:
+                upcoming = entry.upcoming(now, until, runs)
+                truncated = entry.truncated
+            due = entry.due(now)
+
+            estimate = percentile(backup_analytics.durations(entry.name), quantile)
+            seconds = estimate if estimate is not None else settings.forecast_default_duration_seconds
+            starts = ([now] if due else []) + [t for t in upcoming if t <= until]
+            intervals.extend((start, start + timedelta(seconds=seconds), entry.name) for start in starts)
+
+            reports.append({
+                "name": entry.name,
+                "schedule": entry.expression,
+                "paused": entry.paused,
+                "error": entry.error,
+                "due": due,
+                "nextRuns": [_isoformat(t) for t in upcoming[:runs]],
+                "runsInHorizon": len(starts),
+                "runsTruncated": truncated,
+                "estimatedDurationSeconds": round(seconds),
+                "durationSource": duration if estimate is not None else "default",
+            })
+
+        slot = timedelta(minutes=slot_minutes)
+        slots: Dict[int, Dict[str, Any]] = {}
+        for start, end, name in intervals:
+            first = int((start - now) / slot)
+            last = max(int((min(end, until) - now - timedelta(microseconds=1)) / slot), first)
+            for index in range(first, last + 1):
+                bucket = slots.setdefault(index, {"starting": set(), "running": set()})
+                bucket["running"].add(name)
+            slots[first]["starting"].add(name)
+
+        peak, collisions = _peaks(intervals, threshold)
+        return {
+            "from": _isoformat(now),
+            "until": _isoformat(until),
+            "slotMinutes": slot_minutes,
+            "collisionThreshold": threshold,
+            "schedules": reports,
+            "slots": [
+                {
+                    "start": _isoformat(now + index * slot),
+                    "starting": sorted(bucket["starting"]),
+                    "running": sorted(bucket["running"]),
+                    "concurrency": len(bucket["running"]),
+                }
+                for index, bucket in sorted(slots.items())
+            ],
+            "peak": peak,
+            "collisions": collisions,
+            "truncatedSchedules": [r["name"] for r in reports if r["runsTruncated"]],
+        }
+
+
+# Global schedule forecaster instance
+schedule_forecaster = ScheduleForecaster()
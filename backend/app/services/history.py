@@ -0,0 +1,419 @@
+"""
+Velero Dashboard Backend - Backup/Restore History
+
+종료된 백업/복원 요약의 영구 이력 저장소 (SQLite)
+
+Backup/Restore가 종료 phase가 되면 요약 한 행을 기록합니다. Velero가 TTL
+만료로 CR을 삭제해도 이력은 남으며(deletedAt 기록), 기간/스케줄/phase
+인덱스로 조회하므로 장기 리포트가 etcd나 큰 목록 조회에 의존하지 않습니다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Tuple, Callable
+import asyncio
+import functools
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from app.config import settings
+from app.services.indexes import schedule_name_index
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_PHASES = {"Completed", "PartiallyFailed", "Failed", "FailedValidation"}
+
+HISTORY_KINDS = {"backups": "backup", "restores": "restore"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    name TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    schedule TEXT,
+    backup_name TEXT,
+    storage_location TEXT,
+    started_at TEXT,
+    completed_at TEXT NOT NULL,
+    duration_seconds REAL,
+    items INTEGER,
+    total_items INTEGER,
+    warnings INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    failure_reason TEXT,
+    details TEXT,
+    deleted_at TEXT,
+    UNIQUE (kind, uid)
+);
+CREATE INDEX IF NOT EXISTS history_completed ON history (kind, completed_at, id);
+CREATE INDEX IF NOT EXISTS history_schedule ON history (kind, schedule, completed_at, id);
+CREATE INDEX IF NOT EXISTS history_phase ON history (kind, phase, completed_at, id);
+CREATE INDEX IF NOT EXISTS history_name ON history (kind, name);
+"""
+
+COLUMNS = (
+    "kind", "uid", "name", "phase", "schedule", "backup_name", "storage_location",
+    "started_at", "completed_at", "duration_seconds", "items", "total_items",
+    "warnings", "errors", "failure_reason", "details"
+)
+
+BATCH_SIZE = 500
+
+PRUNE_INTERVAL_SECONDS = 3600
+
+# Shutdown waits this long for queued rows to be written
+STOP_TIMEOUT_SECONDS = 10
+
+
+def _timestamp(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def _isoformat(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def history_row(kind: str, obj: Dict[str, Any]) -> Dict[str, Any]:
+    """Summary of a finished Backup ("backup") or Restore ("restore") CR"""
+    metadata = obj.get("metadata", {})
+    spec = obj.get("spec", {})
+    status = obj.get("status", {})
+    progress = status.get("progress") or {}
+    started = _timestamp(status.get("startTimestamp"))
+    completed = _timestamp(status.get("completionTimestamp"))
+
+    if kind == "backup":
+        schedules = schedule_name_index(obj)
+        schedule = schedules[0] if schedules else None
+        backup_name = None
+        storage_location = spec.get("storageLocation", "default")
+        items = progress.get("itemsBackedUp")
+        details = {
+            "includedNamespaces": spec.get("includedNamespaces") or [],
+            "excludedNamespaces": spec.get("excludedNamespaces") or [],
+            "ttl": spec.get("ttl"),
+            "expiration": status.get("expiration"),
+            "volumeSnapshotsCompleted": status.get("volumeSnapshotsCompleted"),
+            "csiVolumeSnapshotsCompleted": status.get("csiVolumeSnapshotsCompleted"),
+            "backupItemOperationsCompleted": status.get("backupItemOperationsCompleted"),
+        }
+    else:
+        schedule = spec.get("scheduleName") or None
+        backup_name = spec.get("backupName")
+        storage_location = None
+        items = progress.get("itemsRestored")
+        details = {
+            "includedNamespaces": spec.get("includedNamespaces") or [],
+            "namespaceMapping": spec.get("namespaceMapping") or {},
+            "restoreItemOperationsCompleted": status.get("restoreItemOperationsCompleted"),
+        }
+
+    return {
+        "kind": kind,
+        "uid": metadata.get("uid") or metadata.get("name", ""),
+        "name": metadata.get("name", ""),
+        "phase": status.get("phase", ""),
+        "schedule": schedule,
+        "backup_name": backup_name,
+        "storage_location": storage_location,
+        "started_at": status.get("startTimestamp"),
+        "completed_at": status.get("completionTimestamp") or metadata.get("creationTimestamp", ""),
+        "duration_seconds": completed - started if started and completed else None,
+        "items": items,
+        "total_items": progress.get("totalItems"),
+        "warnings": status.get("warnings") or 0,
+        "errors": status.get("errors") or 0,
+        "failure_reason": status.get("failureReason") or None,
+        "details": json.dumps({k: v for k, v in details.items() if v not in (None, [], {})}),
+    }
+
+
+class HistoryStore:
+    """On-disk history of finished backups and restores"""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self.query_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="history-query")
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking query off the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.query_executor,
+            functools.partial(func, *args, **kwargs)
+        )
+
+    # ===== WRITES =====
+
+    def record(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert or update finished runs (keyed by kind and uid)"""
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        updates = ", ".join(f"{c} = excluded.{c}" for c in COLUMNS if c not in ("kind", "uid"))
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT INTO history ({', '.join(COLUMNS)}) VALUES ({placeholders}) "
+                f"ON CONFLICT (kind, uid) DO UPDATE SET {updates}, deleted_at = NULL",
+                [tuple(row[c] for c in COLUMNS) for row in rows]
+            )
+            self._conn.commit()
+
+    def mark_deleted(self, kind: str, uid: str, deleted_at: str) -> None:
+        """Record that the CR is gone (garbage-collected or deleted)"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE history SET deleted_at = ? WHERE kind = ? AND uid = ? AND deleted_at IS NULL",
+                (deleted_at, kind, uid)
+            )
+            self._conn.commit()
+
+    def prune(self, retention_days: int) -> int:
+        """
+        Drop runs completed more than retention_days ago
+
+        Returns:
+            Number of removed runs
+        """
+        cutoff = _isoformat(datetime.now(timezone.utc) - timedelta(days=retention_days))
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM history WHERE completed_at < ?", (cutoff,))
+            self._conn.commit()
+            return cursor.rowcount
+
+    # ===== QUERIES =====
+
+    def query(
+        self,
+        kind: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        schedule: Optional[str] = None,
+        backup_name: Optional[str] = None,
+        phases: Optional[List[str]] = None,
+        limit: int = 100,
+        before: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Finished runs of one kind, newest completion first
+
+        Args:
+            kind: "backup" or "restore"
+            since, until: completionTimestamp range (RFC3339, until exclusive)
+            schedule: Schedule name
+            backup_name: Source backup (restores)
+            phases: Allowed phases
+            limit: Page size
+            before: Row id cursor from the previous page
+
+        Returns:
+            (runs, next cursor or None)
+        """
+        where = ["kind = ?"]
+        params: List[Any] = [kind]
+        if since:
+            where.append("completed_at >= ?")
+            params.append(since)
+        if until:
+            where.append("completed_at < ?")
+            params.append(until)
+        if schedule:
+            where.append("schedule = ?")
+            params.append(schedule)
+        if backup_name:
+            where.append("backup_name = ?")
+            params.append(backup_name)
+        if phases:
+            where.append(f"phase IN ({', '.join('?' for _ in phases)})")
+            params.extend(phases)
+        if before:
+            where.append("(completed_at, id) < (SELECT completed_at, id FROM history WHERE id = ?)")
+            params.append(before)
+
+        sql = (
+            "SELECT * FROM history WHERE " + " AND ".join(where)
+            + " ORDER BY completed_at DESC, id DESC LIMIT ?"
+        )
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        runs = [self._to_dict(row) for row in rows]
+        next_before = rows[-1]["id"] if len(rows) == limit else None
+        return runs, next_before
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        run = {
+            "name": row["name"],
+            "uid": row["uid"],
+            "phase": row["phase"],
+            "schedule": row["schedule"],
+            "startTimestamp": row["started_at"],
+            "completionTimestamp": row["completed_at"],
+            "durationSeconds": round(row["duration_seconds"]) if row["duration_seconds"] is not None else None,
+            "items": row["items"],
+            "totalItems": row["total_items"],
+            "warnings": row["warnings"],
+            "errors": row["errors"],
+            "failureReason": row["failure_reason"],
+            "deletedAt": row["deleted_at"],
+            **json.loads(row["details"] or "{}"),
+        }
+        if row["kind"] == "backup":
+            run["storageLocation"] = row["storage_location"]
+        else:
+            run["backupName"] = row["backup_name"]
+        return run
+
+    def stats(self) -> Dict[str, Any]:
+        """Run counts per kind and phase, oldest entry and database size"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, phase, COUNT(*) AS runs, MIN(completed_at) AS oldest "
+                "FROM history GROUP BY kind, phase"
+            ).fetchall()
+            deleted = self._conn.execute(
+                "SELECT COUNT(*) FROM history WHERE deleted_at IS NOT NULL"
+            ).fetchone()[0]
+            page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+            pages = self._conn.execute("PRAGMA page_count").fetchone()[0]
+
+        result: Dict[str, Any] = {
+            kind: {"runs": 0, "byPhase": {}, "oldest": None} for kind in HISTORY_KINDS.values()
+        }
+        for row in rows:
+            entry = result[row["kind"]]
+            entry["runs"] += row["runs"]
+            entry["byPhase"][row["phase"]] = row["runs"]
+            if entry["oldest"] is None or row["oldest"] < entry["oldest"]:
+                entry["oldest"] = row["oldest"]
+        result["deletedFromCluster"] = deleted
+        result["bytes"] = page_size * pages
+        return result
+
+
+class HistoryRecorder:
+    """
+    Appends finished backups/restores to the HistoryStore
+
+    Informer handlers only enqueue rows; a single writer thread stores them
+    in batches, so the initial sync of thousands of CRs is one transaction
+    per batch and watch threads never wait on disk.
+    """
+
+    def __init__(self, store: HistoryStore):
+        self.store = store
+        self._queue: "queue.Queue" = queue.Queue()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._informers: List[Any] = []
+        self._last_prune = 0.0
+
+    def attach(self, informers) -> None:
+        """Record terminal backups/restores from the informers"""
+        if not settings.history_enabled:
+            return
+        for plural, kind in HISTORY_KINDS.items():
+            informer = informers.informer(plural)
+            informer.add_event_handler(self._make_handler(kind))
+            self._informers.append(informer)
+
+    def start(self) -> None:
+        """Start the writer thread (history needs the watch even when reads bypass the cache)"""
+        if not self._informers or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self._thread.start()
+        for informer in self._informers:
+            informer.start()
+
+    def stop(self, timeout: float = STOP_TIMEOUT_SECONDS) -> None:
+        """Write what is still queued, then stop the writer thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logger.warning(f"History writer did not finish within {timeout}s, {self._queue.qsize()} events dropped")
+            self._thread = None
+
+    def _make_handler(self, kind: str):
+        def handler(event_type: str, obj: Dict[str, Any], old: Optional[Dict[str, Any]]) -> None:
+            metadata = obj.get("metadata", {})
+            if event_type == "DELETED":
+                self._queue.put(("deleted", kind, metadata.get("uid") or metadata.get("name", "")))
+                return
+            status = obj.get("status", {})
+            if status.get("phase") not in TERMINAL_PHASES:
+                return
+            old_status = (old or {}).get("status", {})
+            if (
+                old is not None
+                and old_status.get("phase") == status.get("phase")
+                and old_status.get("completionTimestamp") == status.get("completionTimestamp")
+            ):
+                return
+            self._queue.put(("finished", kind, history_row(kind, obj)))
+        return handler
+
+    def _run(self) -> None:
+        # After stop, keep going until the queue is drained
+        while not (self._stop.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=0.5)]
+            except queue.Empty:
+                continue
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._write(batch)
+                if settings.history_retention_days > 0 and time.time() - self._last_prune > PRUNE_INTERVAL_SECONDS:
+                    self._last_prune = time.time()
+                    pruned = self.store.prune(settings.history_retention_days)
+                    if pruned:
+                        logger.info(f"Pruned {pruned} runs from the history")
+            except Exception as e:
+                logger.warning(f"Cannot write backup/restore history: {e}")
+
+    def _write(self, batch: List[Tuple[str, str, Any]]) -> None:
+        # Keep event order: a run finished and deleted in one batch ends up deleted
+        rows: List[Dict[str, Any]] = []
+        now = _isoformat(datetime.now(timezone.utc))
+        for action, kind, payload in batch:
+            if action == "finished":
+                rows.append(payload)
+                continue
+            if rows:
+                self.store.record(rows)
+                rows = []
+            self.store.mark_deleted(kind, payload, now)
+        if rows:
+            self.store.record(rows)
+
+
+# Global history instances
+history_store = HistoryStore(os.path.join(settings.data_dir, "history.db"))
+history_recorder = HistoryRecorder(history_store)
@@ -0,0 +1,339 @@
+"""
+Velero Dashboard Backend - Cache Indexes
+
+Informer 캐시 위의 인덱스 (정렬 인덱스, 보조 인덱스, 커서 기반 페이지네이션)
+
+인덱스는 informer 이벤트마다 증분 갱신되므로, 조회 시 전체 목록을
+다시 정렬/스캔하지 않습니다.
+"""
+
+from typing import Optional, List, Dict, Any, Callable, Iterator, Tuple, Set, Iterable
+import base64
+import bisect
+import json
+
+IndexEntry = Tuple[Any, str]
+"""(sort key, object name) - name breaks ties so entries are unique"""
+
+
+def start_timestamp_key(obj: Dict[str, Any]) -> str:
+    """startTimestamp (creationTimestamp until Velero sets it)"""
+    return obj.get("status", {}).get(
+        "startTimestamp",
+        obj.get("metadata", {}).get("creationTimestamp", "")
+    ) or ""
+
+
+def completion_timestamp_key(obj: Dict[str, Any]) -> str:
+    """completionTimestamp ("" while running)"""
+    return obj.get("status", {}).get("completionTimestamp") or ""
+
+
+def name_key(obj: Dict[str, Any]) -> str:
+    """metadata.name"""
+    return obj.get("metadata", {}).get("name", "")
+
+
+def phase_index(obj: Dict[str, Any]) -> List[str]:
+    """status.phase ("New" until Velero sets it)"""
+    return [obj.get("status", {}).get("phase", "New")]
+
+
+def schedule_name_index(obj: Dict[str, Any]) -> List[str]:
+    """velero.io/schedule-name label (Backups created by a Schedule)"""
+    schedule = obj.get("metadata", {}).get("labels", {}).get("velero.io/schedule-name")
+    return [schedule] if schedule else []
+
+
+def storage_location_index(obj: Dict[str, Any]) -> List[str]:
+    """spec.storageLocation"""
+    return [obj.get("spec", {}).get("storageLocation", "default")]
+
+
+def repository_storage_location_index(obj: Dict[str, Any]) -> List[str]:
+    """spec.backupStorageLocation (BackupRepository -> BSL)"""
+    location = obj.get("spec", {}).get("backupStorageLocation")
+    return [location] if location else []
+
+
+def backup_name_index(obj: Dict[str, Any]) -> List[str]:
+    """spec.backupName (Restore -> Backup)"""
+    backup_name = obj.get("spec", {}).get("backupName")
+    return [backup_name] if backup_name else []
+
+
+def backup_name_label_index(obj: Dict[str, Any]) -> List[str]:
+    """velero.io/backup-name label (PodVolumeBackups of a Backup)"""
+    backup_name = obj.get("metadata", {}).get("labels", {}).get("velero.io/backup-name")
+    return [backup_name] if backup_name else []
+
+
+def restore_name_label_index(obj: Dict[str, Any]) -> List[str]:
+    """velero.io/restore-name label (PodVolumeRestores of a Restore)"""
+    restore_name = obj.get("metadata", {}).get("labels", {}).get("velero.io/restore-name")
+    return [restore_name] if restore_name else []
+
+
+def node_index(obj: Dict[str, Any]) -> List[str]:
+    """
+    Node of a volume transfer
+
+    spec.node for PodVolumeBackups, status.node once a restore or data mover
+    transfer runs, status.acceptedByNode while a data mover transfer is queued.
+    """
+    status = obj.get("status", {})
+    node = obj.get("spec", {}).get("node") or status.get("node") or status.get("acceptedByNode")
+    return [node] if node else []
+
+
+def pod_node_index(obj: Dict[str, Any]) -> List[str]:
+    """spec.nodeName (node-agent pod -> node)"""
+    node = obj.get("spec", {}).get("nodeName")
+    return [node] if node else []
+
+
+# Secondary indexes per plural (index name -> index function)
+INDEXERS: Dict[str, Dict[str, Callable[[Dict[str, Any]], List[str]]]] = {
+    "backups": {
+        "phase": phase_index,
+        "schedule": schedule_name_index,
+        "storageLocation": storage_location_index,
+    },
+    "restores": {
+        "phase": phase_index,
+        "backupName": backup_name_index,
+    },
+    "schedules": {
+        "phase": phase_index,
+    },
+    "backuprepositories": {
+        "phase": phase_index,
+        "storageLocation": repository_storage_location_index,
+    },
+    "podvolumebackups": {
+        "backupName": backup_name_label_index,
+        "node": node_index,
+    },
+    "podvolumerestores": {
+        "restoreName": restore_name_label_index,
+        "node": node_index,
+    },
+    "datauploads": {
+        "phase": phase_index,
+        "backupName": backup_name_label_index,
+        "node": node_index,
+    },
+    "datadownloads": {
+        "phase": phase_index,
+        "restoreName": restore_name_label_index,
+        "node": node_index,
+    },
+    "nodeagents": {
+        "node": pod_node_index,
+    },
+}
+
+
+# Sort keys supported by list endpoints (query value -> key function)
+SORT_KEYS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "startTimestamp": start_timestamp_key,
+    "completionTimestamp": completion_timestamp_key,
+    "name": name_key,
+}
+
+
+class SortedIndex:
+    """
+    Objects ordered by a sort key
+
+    Not thread-safe on its own: the owning Informer updates and scans it
+    while holding its store lock.
+    """
+
+    def __init__(self, key_func: Callable[[Dict[str, Any]], Any]):
+        self.key_func = key_func
+        self._entries: List[IndexEntry] = []
+        self._keys: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def update(self, name: str, obj: Optional[Dict[str, Any]]) -> None:
+        """Insert/move an object (obj=None removes it)"""
+        if name in self._keys:
+            old_key = self._keys.pop(name)
+            pos = bisect.bisect_left(self._entries, (old_key, name))
+            if pos < len(self._entries) and self._entries[pos] == (old_key, name):
+                del self._entries[pos]
+
+        if obj is not None:
+            key = self.key_func(obj)
+            self._keys[name] = key
+            bisect.insort(self._entries, (key, name))
+
+    def rebuild(self, objects: Dict[str, Dict[str, Any]]) -> None:
+        """Rebuild from a full store (after a relist)"""
+        self._keys = {name: self.key_func(obj) for name, obj in objects.items()}
+        self._entries = sorted((key, name) for name, key in self._keys.items())
+
+    def subset(self, names: Iterable[str]) -> "SortedIndex":
+        """Sorted index restricted to the given names (O(m log m))"""
+        sub = SortedIndex(self.key_func)
+        sub._keys = {name: self._keys[name] for name in names if name in self._keys}
+        sub._entries = sorted((key, name) for name, key in sub._keys.items())
+        return sub
+
+    def scan(
+        self,
+        after: Optional[IndexEntry] = None,
+        reverse: bool = False,
+        lower: Optional[Any] = None,
+        upper: Optional[Any] = None
+    ) -> Iterator[IndexEntry]:
+        """
+        Iterate entries in order, starting after a cursor
+
+        Args:
+            after: Resume after this entry (exclusive)
+            reverse: Descending order
+            lower: Inclusive lower bound on the sort key
+            upper: Exclusive upper bound on the sort key
+        """
+        entries = self._entries
+
+        start = 0 if lower is None else bisect.bisect_left(entries, (lower,))
+        end = len(entries) if upper is None else bisect.bisect_left(entries, (upper,))
+
+        if after is not None:
+            if reverse:
+                end = min(end, bisect.bisect_left(entries, tuple(after)))
+            else:
+                start = max(start, bisect.bisect_right(entries, tuple(after)))
+
+        positions = range(end - 1, start - 1, -1) if reverse else range(start, end)
+        for pos in positions:
+            yield entries[pos]
+
+
+class HashIndex:
+    """
+    Secondary index: index value -> object names
+
+    Like SortedIndex, updated and read under the owning Informer's lock.
+    """
+
+    def __init__(self, index_func: Callable[[Dict[str, Any]], List[str]]):
+        self.index_func = index_func
+        self._names: Dict[str, Set[str]] = {}
+        self._values: Dict[str, List[str]] = {}
+
+    def update(self, name: str, obj: Optional[Dict[str, Any]]) -> None:
+        """Re-index an object (obj=None removes it)"""
+        for value in self._values.pop(name, []):
+            names = self._names.get(value)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._names[value]
+
+        if obj is not None:
+            values = self.index_func(obj)
+            self._values[name] = values
+            for value in values:
+                self._names.setdefault(value, set()).add(name)
+
+    def rebuild(self, objects: Dict[str, Dict[str, Any]]) -> None:
+        """Rebuild from a full store (after a relist)"""
+        self._names = {}
+        self._values = {}
+        for name, obj in objects.items():
+            self.update(name, obj)
+
+    def get(self, value: str) -> Set[str]:
+        """Names of objects indexed under a value"""
+        return set(self._names.get(value, ()))
+
+    def count(self, values: Iterable[str]) -> int:
+        """Number of objects indexed under any of the values (upper bound when multi-valued)"""
+        return sum(len(self._names.get(value, ())) for value in values)
+
+    def contains(self, values: Iterable[str], name: str) -> bool:
+        """Whether an object is indexed under any of the values, in O(values)"""
+        return any(name in self._names.get(value, ()) for value in values)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of objects per index value"""
+        return {value: len(names) for value, names in self._names.items()}
+
+
+def match_index_values(
+    indexers: Dict[str, Callable[[Dict[str, Any]], List[str]]],
+    obj: Dict[str, Any],
+    selector: Dict[str, Set[str]]
+) -> bool:
+    """Whether an object matches every {index name: allowed values} entry"""
+    for index_name, values in selector.items():
+        if not values.intersection(indexers[index_name](obj)):
+            return False
+    return True
+
+
+def encode_cursor(sort: str, entry: IndexEntry) -> str:
+    """Opaque continue token for the entry after which the next page starts"""
+    raw = json.dumps({"sort": sort, "after": list(entry)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, sort: str) -> IndexEntry:
+    """
+    Decode a continue token
+
+    Raises:
+        ValueError: Malformed token, or token issued for a different sort
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key, name = data["after"]
+    except Exception:
+        raise ValueError("Invalid continue token")
+    # Every SORT_KEYS key is a string; anything else cannot be compared in the index
+    if not isinstance(key, str) or not isinstance(name, str):
+        raise ValueError("Invalid continue token")
+    if data.get("sort") != sort:
+        raise ValueError("Continue token was issued for a different sort order")
+    return (key, name)
+
+
+def paginate(
+    index: SortedIndex,
+    get_object: Callable[[str], Optional[Dict[str, Any]]],
+    predicate: Callable[[Dict[str, Any]], bool],
+    limit: Optional[int] = None,
+    after: Optional[IndexEntry] = None,
+    reverse: bool = False,
+    lower: Optional[Any] = None,
+    upper: Optional[Any] = None
+) -> Tuple[List[Dict[str, Any]], Optional[IndexEntry]]:
+    """
+    Collect one page of objects from a sorted index
+
+    The scan looks one matching entry past a full page, so last_entry is
+    only returned when another page really exists.
+
+    Returns:
+        (objects, last_entry) - last_entry is None when there are no more pages
+    """
+    items: List[Dict[str, Any]] = []
+    if limit is not None and limit <= 0:
+        return items, None
+    last: Optional[IndexEntry] = None
+    for entry in index.scan(after=after, reverse=reverse, lower=lower, upper=upper):
+        obj = get_object(entry[1])
+        if obj is None or not predicate(obj):
+            continue
+        if limit is not None and len(items) >= limit:
+            return items, last
+        items.append(obj)
+        last = entry
+    return items, None
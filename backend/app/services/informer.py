@@ -0,0 +1,601 @@
+"""
+Velero Dashboard Backend - Informer Cache
+
+list + watch 기반 in-memory 캐시 (client-go informer 방식)
+
+각 리소스(plural)마다 최초 1회 list 후 watch 스트림으로 변경 사항만 반영합니다.
+Router는 API 서버 대신 이 캐시에서 읽습니다.
+"""
+
+from kubernetes import watch
+from kubernetes.client import ApiClient
+from kubernetes.client.rest import ApiException
+from typing import Optional, List, Dict, Any, Callable, Awaitable, Tuple, Set
+import logging
+import math
+import threading
+import time
+
+from app.config import settings
+from app.services.indexes import (
+    SortedIndex,
+    HashIndex,
+    IndexEntry,
+    INDEXERS,
+    SORT_KEYS,
+    match_index_values,
+    paginate
+)
+from app.services.k8s_client import k8s_client
+from app.services.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+HTTP_STATUS_GONE = 410
+
+EventHandler = Callable[[str, Dict[str, Any], Optional[Dict[str, Any]]], None]
+"""(event_type, obj, old_obj) - event_type is ADDED, MODIFIED or DELETED"""
+
+
+def _object_key(obj: Dict[str, Any]) -> str:
+    """Store key of a Kubernetes object (metadata.name)"""
+    return obj.get("metadata", {}).get("name", "")
+
+
+class Informer:
+    """List + watch cache for a single resource type"""
+
+    def __init__(
+        self,
+        name: str,
+        list_func: Callable[..., Any],
+        **list_kwargs: Any
+    ):
+        """
+        Args:
+            name: Informer name (usually the resource plural)
+            list_func: Kubernetes API list function (also used for watch)
+            list_kwargs: Keyword arguments passed to list_func
+        """
+        self.name = name
+        self._list_func = list_func
+        self._list_kwargs = list_kwargs
+
+        self._store: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._handlers: List[EventHandler] = []
+        self._sorted_indexes: Dict[str, SortedIndex] = {}
+        self._hash_indexes: Dict[str, HashIndex] = {}
+        self._synced = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watch: Optional[watch.Watch] = None
+
+        self.resource_version: Optional[str] = None
+        self.last_list_time: Optional[float] = None
+        self.last_heartbeat_time: Optional[float] = None
+        self.relist_count = 0
+        self.last_error: Optional[str] = None
+
+    # ===== LIFECYCLE =====
+
+    def start(self) -> None:
+        """Start list + watch loop in a background thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"informer-{self.name}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watch loop"""
+        self._stop.set()
+        if self._watch:
+            self._watch.stop()
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """Block until the initial list has been loaded"""
+        return self._synced.wait(timeout)
+
+    def has_synced(self) -> bool:
+        """Whether the initial list has been loaded"""
+        return self._synced.is_set()
+
+    # ===== READ API =====
+
+    def list(self) -> List[Dict[str, Any]]:
+        """All cached objects"""
+        with self._lock:
+            return list(self._store.values())
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Cached object by name"""
+        with self._lock:
+            return self._store.get(name)
+
+    def add_sorted_index(
+        self,
+        name: str,
+        key_func: Callable[[Dict[str, Any]], Any]
+    ) -> None:
+        """Register a sorted index, kept up to date on every change"""
+        with self._lock:
+            index = SortedIndex(key_func)
+            index.rebuild(self._store)
+            self._sorted_indexes[name] = index
+
+    def add_indexer(
+        self,
+        name: str,
+        index_func: Callable[[Dict[str, Any]], List[str]]
+    ) -> None:
+        """Register a secondary (value -> names) index"""
+        with self._lock:
+            index = HashIndex(index_func)
+            index.rebuild(self._store)
+            self._hash_indexes[name] = index
+
+    def indexers(self) -> Dict[str, Callable[[Dict[str, Any]], List[str]]]:
+        """Registered secondary index functions"""
+        return {name: index.index_func for name, index in self._hash_indexes.items()}
+
+    def _select_names(self, selector: Dict[str, Set[str]]) -> Set[str]:
+        """
+        Names matching every {index name: allowed values} entry (lock held)
+
+        Raises:
+            ValueError: Empty selector (it would match the whole store)
+        """
+        if not selector:
+            raise ValueError("Empty index selector")
+        result: Optional[Set[str]] = None
+        for index_name, values in selector.items():
+            index = self._hash_indexes[index_name]
+            names: Set[str] = set()
+            for value in values:
+                names |= index.get(value)
+            result = names if result is None else result & names
+            if not result:
+                return set()
+        return result
+
+    def _selected_getter(self, selector: Dict[str, Set[str]]) -> Callable[[str], Optional[Dict[str, Any]]]:
+        """Store lookup returning None for objects outside a selector (lock held)"""
+        checks = [(self._hash_indexes[name], values) for name, values in selector.items()]
+
+        def get_object(name: str) -> Optional[Dict[str, Any]]:
+            if all(index.contains(values, name) for index, values in checks):
+                return self._store.get(name)
+            return None
+        return get_object
+
+    def by_index(self, selector: Dict[str, Set[str]]) -> List[Dict[str, Any]]:
+        """Objects matching a secondary index selector, in O(matches)"""
+        with self._lock:
+            return [self._store[name] for name in self._select_names(selector)]
+
+    def index_counts(self, index_name: str) -> Dict[str, int]:
+        """Number of cached objects per value of a secondary index"""
+        with self._lock:
+            return self._hash_indexes[index_name].counts()
+
+    def sorted_index(self, name: str) -> SortedIndex:
+        """Registered sorted index by name"""
+        return self._sorted_indexes[name]
+
+    def query(
+        self,
+        index_name: str,
+        predicate: Callable[[Dict[str, Any]], bool],
+        selector: Optional[Dict[str, Set[str]]] = None,
+        limit: Optional[int] = None,
+        after: Optional[IndexEntry] = None,
+        reverse: bool = False,
+        lower: Optional[Any] = None,
+        upper: Optional[Any] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[IndexEntry]]:
+        """
+        One page of objects in sorted-index order
+
+        With a selector, whichever is cheaper is scanned: the full sorted
+        index, skipping non-matches by hash-index membership (broad filters:
+        about limit * n / matches entries), or a sorted copy of just the
+        matches (narrow filters: O(m log m)).
+
+        Returns:
+            (objects, last_entry) - last_entry is None on the last page
+        """
+        with self._lock:
+            index = self._sorted_indexes[index_name]
+            get_object = self._store.get
+            if selector:
+                matches = min(
+                    self._hash_indexes[name].count(values) for name, values in selector.items()
+                )
+                if not matches:
+                    return [], None
+                scan_cost = len(index) if limit is None else min(len(index), limit * len(index) / matches)
+                if scan_cost > matches * math.log2(matches + 1):
+                    index = index.subset(self._select_names(selector))
+                else:
+                    get_object = self._selected_getter(selector)
+            return paginate(
+                index,
+                get_object,
+                predicate,
+                limit=limit,
+                after=after,
+                reverse=reverse,
+                lower=lower,
+                upper=upper
+            )
+
+    def add_event_handler(self, handler: EventHandler) -> None:
+        """
+        Register a handler called for every change
+
+        Objects already in the store are replayed as ADDED events so that
+        handlers registered after the initial sync see the full state.
+        """
+        with self._lock:
+            self._handlers.append(handler)
+            for obj in self._store.values():
+                self._call_handler(handler, "ADDED", obj, None)
+
+    def staleness_seconds(self) -> Optional[float]:
+        """Seconds since the cache was last confirmed up-to-date"""
+        if self.last_heartbeat_time is None:
+            return None
+        return time.time() - self.last_heartbeat_time
+
+    def status(self) -> Dict[str, Any]:
+        """Cache status (for /api/cache)"""
+        staleness = self.staleness_seconds()
+        return {
+            "name": self.name,
+            "synced": self.has_synced(),
+            "items": len(self._store),
+            "resourceVersion": self.resource_version,
+            "lastListTime": self.last_list_time,
+            "cacheAgeSeconds": (
+                time.time() - self.last_list_time if self.last_list_time else None
+            ),
+            "stalenessSeconds": staleness,
+            "stale": (
+                staleness is None
+                or staleness > settings.informer_max_staleness_seconds
+            ),
+            "relistCount": self.relist_count,
+            "lastError": self.last_error,
+        }
+
+    # ===== LIST / WATCH LOOP =====
+
+    def _run(self) -> None:
+        """Main loop: list, then watch until the resourceVersion expires"""
+        backoff = 1.0
+        need_list = True
+
+        while not self._stop.is_set():
+            try:
+                if need_list:
+                    self._list_and_replace()
+                    need_list = False
+                self._watch_once()
+                backoff = 1.0
+                continue
+            except ApiException as e:
+                if e.status == HTTP_STATUS_GONE:
+                    logger.info(f"[{self.name}] resourceVersion expired (410), relisting")
+                    need_list = True
+                    continue
+                self.last_error = str(e)
+                logger.error(f"[{self.name}] watch error: {e}")
+                need_list = True
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"[{self.name}] informer error: {e}")
+                need_list = True
+
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, 60.0)
+
+    def _list_and_replace(self) -> None:
+        """Full list; replace the store and emit the diff to handlers"""
+        response = self._list_func(**self._list_kwargs)
+        if not isinstance(response, dict):
+            response = ApiClient().sanitize_for_serialization(response)
+
+        items = response.get("items", [])
+        new_store = {_object_key(item): item for item in items}
+
+        with self._lock:
+            old_store = self._store
+            self._store = new_store
+
+            for index in self._sorted_indexes.values():
+                index.rebuild(new_store)
+            for hash_index in self._hash_indexes.values():
+                hash_index.rebuild(new_store)
+
+            for key, obj in new_store.items():
+                old = old_store.get(key)
+                if old is None:
+                    self._dispatch("ADDED", obj, None)
+                elif _resource_version(old) != _resource_version(obj):
+                    self._dispatch("MODIFIED", obj, old)
+            for key, old in old_store.items():
+                if key not in new_store:
+                    self._dispatch("DELETED", old, old)
+
+            self.resource_version = response.get("metadata", {}).get("resourceVersion")
+            self.last_list_time = time.time()
+            self.last_heartbeat_time = self.last_list_time
+            if self._synced.is_set():
+                self.relist_count += 1
+
+        self.last_error = None
+        self._synced.set()
+        logger.info(
+            f"[{self.name}] listed {len(new_store)} items "
+            f"(resourceVersion={self.resource_version})"
+        )
+
+    def _watch_once(self) -> None:
+        """Watch from the current resourceVersion until the server closes the stream"""
+        self._watch = watch.Watch()
+        stream = self._watch.stream(
+            self._list_func,
+            resource_version=self.resource_version,
+            timeout_seconds=settings.informer_watch_timeout_seconds,
+            allow_watch_bookmarks=True,
+            **self._list_kwargs
+        )
+        self.last_heartbeat_time = time.time()
+
+        for event in stream:
+            if self._stop.is_set():
+                break
+
+            event_type = event.get("type")
+            obj = event.get("raw_object") or {}
+            rv = _resource_version(obj)
+
+            if event_type == "BOOKMARK":
+                self.resource_version = rv or self.resource_version
+                self.last_heartbeat_time = time.time()
+                continue
+
+            self._apply_event(event_type, obj)
+            if rv:
+                self.resource_version = rv
+            self.last_heartbeat_time = time.time()
+
+        # Normal end of the watch window also proves the cache was current
+        self.last_heartbeat_time = time.time()
+
+    def _apply_event(self, event_type: str, obj: Dict[str, Any]) -> None:
+        """Apply a single watch event to the store"""
+        key = _object_key(obj)
+        with self._lock:
+            old = self._store.get(key)
+            if event_type == "DELETED":
+                self._store.pop(key, None)
+                self._update_indexes(key, None)
+                self._dispatch("DELETED", obj, old)
+            elif event_type in ("ADDED", "MODIFIED"):
+                self._store[key] = obj
+                self._update_indexes(key, obj)
+                self._dispatch("ADDED" if old is None else "MODIFIED", obj, old)
+
+    def _update_indexes(self, key: str, obj: Optional[Dict[str, Any]]) -> None:
+        for index in self._sorted_indexes.values():
+            index.update(key, obj)
+        for hash_index in self._hash_indexes.values():
+            hash_index.update(key, obj)
+
+    def _dispatch(
+        self,
+        event_type: str,
+        obj: Dict[str, Any],
+        old: Optional[Dict[str, Any]]
+    ) -> None:
+        for handler in self._handlers:
+            self._call_handler(handler, event_type, obj, old)
+
+    def _call_handler(
+        self,
+        handler: EventHandler,
+        event_type: str,
+        obj: Dict[str, Any],
+        old: Optional[Dict[str, Any]]
+    ) -> None:
+        try:
+            handler(event_type, obj, old)
+        except Exception as e:
+            logger.error(f"[{self.name}] event handler error: {e}")
+
+
+def _resource_version(obj: Dict[str, Any]) -> Optional[str]:
+    return obj.get("metadata", {}).get("resourceVersion")
+
+
+class InformerManager:
+    """Informers for the Velero CRs (and node-agent pods) served by the dashboard"""
+
+    VELERO_PLURALS = [
+        "backups",
+        "restores",
+        "schedules",
+        "backupstoragelocations",
+        "backuprepositories",
+        "podvolumebackups",
+        "podvolumerestores",
+        "deletebackuprequests",
+        "datauploads",
+        "datadownloads",
+    ]
+
+    # Data mover CRs are served under velero.io/v2alpha1
+    DATA_MOVER_PLURALS = ("datauploads", "datadownloads")
+
+    def __init__(self, kube_client):
+        """
+        Args:
+            kube_client: KubernetesClient instance
+        """
+        self.kube_client = kube_client
+        self.informers: Dict[str, Informer] = {}
+
+        for plural in self.VELERO_PLURALS:
+            self.informers[plural] = Informer(
+                plural,
+                kube_client.custom_api.list_namespaced_custom_object,
+                group=kube_client.velero_group,
+                version=(
+                    kube_client.velero_data_mover_version
+                    if plural in self.DATA_MOVER_PLURALS
+                    else kube_client.velero_version
+                ),
+                namespace=kube_client.namespace,
+                plural=plural
+            )
+
+        # node-agent DaemonSet pods (core API, label-selected)
+        self.informers["nodeagents"] = Informer(
+            "nodeagents",
+            kube_client.core_api.list_namespaced_pod,
+            namespace=kube_client.namespace,
+            label_selector=kube_client.NODE_AGENT_LABEL_SELECTOR
+        )
+
+        # Secondary indexes (phase, schedule, BSL, restore -> backup)
+        for plural, indexers in INDEXERS.items():
+            for index_name, index_func in indexers.items():
+                self.informers[plural].add_indexer(index_name, index_func)
+
+        # Sort orders for paginated list endpoints / recent items
+        for plural in ("backups", "restores"):
+            for sort_name, key_func in SORT_KEYS.items():
+                self.informers[plural].add_sorted_index(sort_name, key_func)
+
+    def start(self) -> None:
+        """Start all informers"""
+        if not settings.informer_enabled:
+            logger.info("Informer cache disabled, reads go to the API server")
+            return
+        for informer in self.informers.values():
+            informer.start()
+
+    def stop(self) -> None:
+        """Stop all informers"""
+        for informer in self.informers.values():
+            informer.stop()
+
+    def informer(self, plural: str) -> Informer:
+        """Informer for a plural"""
+        return self.informers[plural]
+
+    async def list(
+        self,
+        plural: str,
+        fallback: Callable[[], Awaitable[List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        List objects from the cache
+
+        Falls back to a direct API call until the informer has synced
+        (or when the informer cache is disabled).
+        """
+        informer = self.informers.get(plural)
+        hit = bool(informer and informer.has_synced())
+        record_cache("informer", plural, hit)
+        if hit:
+            return informer.list()
+        return await fallback()
+
+    async def get(
+        self,
+        plural: str,
+        name: str,
+        fallback: Callable[[str], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Get an object from the cache
+
+        Falls back to a direct API call on a cache miss, so objects created
+        moments ago (not yet seen by the watch) are still found.
+        """
+        informer = self.informers.get(plural)
+        if informer and informer.has_synced():
+            obj = informer.get(name)
+            if obj is not None:
+                record_cache("informer", plural, True)
+                return obj
+        record_cache("informer", plural, False)
+        return await fallback(name)
+
+    async def query(
+        self,
+        plural: str,
+        index_name: str,
+        fallback: Callable[[], Awaitable[List[Dict[str, Any]]]],
+        predicate: Callable[[Dict[str, Any]], bool],
+        selector: Optional[Dict[str, Set[str]]] = None,
+        **page_kwargs: Any
+    ) -> Tuple[List[Dict[str, Any]], Optional[IndexEntry]]:
+        """
+        One page of objects in sorted-index order
+
+        Served from the informer's indexes once synced; before that the
+        fallback list is filtered and sorted on the fly with the same
+        index functions. page_kwargs are passed to paginate()
+        (limit, after, reverse, lower, upper).
+        """
+        informer = self.informers[plural]
+        record_cache("informer", plural, informer.has_synced())
+        if informer.has_synced():
+            return informer.query(index_name, predicate, selector, **page_kwargs)
+
+        objects = await fallback()
+        if selector:
+            indexers = informer.indexers()
+            objects = [o for o in objects if match_index_values(indexers, o, selector)]
+        store = {_object_key(obj): obj for obj in objects}
+        index = SortedIndex(informer.sorted_index(index_name).key_func)
+        index.rebuild(store)
+        return paginate(index, store.get, predicate, **page_kwargs)
+
+    async def select(
+        self,
+        plural: str,
+        selector: Dict[str, Set[str]],
+        fallback: Callable[[], Awaitable[List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Objects matching a secondary index selector (every object when empty)
+
+        Example:
+            await informers.select("restores", {"backupName": {name}}, ...)
+        """
+        if not selector:
+            return await self.list(plural, fallback)
+        informer = self.informers[plural]
+        record_cache("informer", plural, informer.has_synced())
+        if informer.has_synced():
+            return informer.by_index(selector)
+
+        indexers = informer.indexers()
+        return [o for o in await fallback() if match_index_values(indexers, o, selector)]
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Status of every informer"""
+        return [informer.status() for informer in self.informers.values()]
+
+
+# Global informer manager instance
+informers = InformerManager(k8s_client)
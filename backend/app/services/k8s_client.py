@@ -4,33 +4,63 @@ Velero Dashboard Backend - Kubernetes Client Wrapper
 Velero Custom Resources와 통신하는 클라이언트
 """
 
-from kubernetes import client, config as k8s_config
+from kubernetes import client, config as k8s_config, watch
 from kubernetes.client.rest import ApiException
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Callable
+import asyncio
+import functools
 import logging
 
 from app.config import settings
+from app.services.metrics import InstrumentedApi, K8S_CLIENT_CALL_DURATION
 
 logger = logging.getLogger(__name__)
 
+FIELD_MANAGER = "velero-dashboard"
+
 
 class KubernetesClient:
     """Kubernetes API client wrapper for Velero CRs"""
     
-    def __init__(self):
-        """Initialize Kubernetes client"""
-        self._load_kube_config()
-        self.custom_api = client.CustomObjectsApi()
-        self.core_api = client.CoreV1Api()
+    def __init__(self, context: Optional[str] = None):
+        """
+        Initialize Kubernetes client
+        
+        Args:
+            context: kubeconfig context to use (None = current context,
+                or in-cluster config when no kubeconfig is set)
+        """
+        self.context = context
+        api_client = self._load_kube_config()
+        self.api_client = api_client
+        cluster = context or settings.cluster_name
+        self.custom_api = InstrumentedApi(client.CustomObjectsApi(api_client), cluster)
+        self.core_api = InstrumentedApi(client.CoreV1Api(api_client), cluster)
         
         # Velero API group and version
         self.velero_group = "velero.io"
         self.velero_version = "v1"
+        self.velero_data_mover_version = "v2alpha1"  # DataUpload/DataDownload
         self.namespace = settings.velero_namespace
     
-    def _load_kube_config(self):
-        """Load Kubernetes configuration"""
+    def _load_kube_config(self) -> Optional[client.ApiClient]:
+        """
+        Load Kubernetes configuration
+        
+        Returns:
+            Dedicated ApiClient for a named context, or None to use the
+            process-wide default configuration
+        """
         try:
+            if self.context:
+                # Named context: separate ApiClient so clusters don't share config
+                api_client = k8s_config.new_client_from_config(
+                    config_file=settings.kubeconfig_path,
+                    context=self.context
+                )
+                logger.info(f"Loaded kubeconfig context: {self.context}")
+                return api_client
             if settings.kubeconfig_path:
                 # Load from kubeconfig file
                 k8s_config.load_kube_config(config_file=settings.kubeconfig_path)
@@ -39,6 +69,7 @@ class KubernetesClient:
                 # Load in-cluster config (for Pod deployment)
                 k8s_config.load_incluster_config()
                 logger.info("Loaded in-cluster Kubernetes config")
+            return None
         except Exception as e:
             logger.error(f"Failed to load Kubernetes config: {e}")
             raise
@@ -87,6 +118,39 @@ class KubernetesClient:
             logger.error(f"Error creating backup: {e}")
             raise
     
+    def create_delete_backup_request(
+        self,
+        backup_name: str,
+        labels: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Request deletion of a Backup (and its data) via a DeleteBackupRequest
+        
+        Deleting the Backup CR directly would leave the data in object
+        storage and the backup would be synced back; Velero's deletion
+        controller removes the data, snapshots and finally the Backup CR.
+        """
+        body = {
+            "apiVersion": f"{self.velero_group}/{self.velero_version}",
+            "kind": "DeleteBackupRequest",
+            "metadata": {
+                "generateName": f"{backup_name}-",
+                "labels": {**(labels or {}), "velero.io/backup-name": backup_name},
+            },
+            "spec": {"backupName": backup_name},
+        }
+        try:
+            return self.custom_api.create_namespaced_custom_object(
+                group=self.velero_group,
+                version=self.velero_version,
+                namespace=self.namespace,
+                plural="deletebackuprequests",
+                body=body
+            )
+        except ApiException as e:
+            logger.error(f"Error creating delete request for backup {backup_name}: {e}")
+            raise
+    
     # ===== RESTORE OPERATIONS =====
     
     def list_restores(self) -> List[Dict[str, Any]]:
@@ -189,6 +253,61 @@ class KubernetesClient:
             logger.error(f"Error deleting schedule {name}: {e}")
             raise
     
+    def apply_schedule(self, name: str, spec: Dict[str, Any], field_manager: str = FIELD_MANAGER) -> Dict[str, Any]:
+        """
+        Server-side apply of Schedule spec fields
+        
+        The field manager owns exactly the fields sent, so every apply of a
+        manager must carry all of its fields (one manager per operation);
+        ownership is forced from other managers (e.g. kubectl, the creator).
+        """
+        body = {
+            "apiVersion": f"{self.velero_group}/{self.velero_version}",
+            "kind": "Schedule",
+            "metadata": {"name": name, "namespace": self.namespace},
+            "spec": spec
+        }
+        try:
+            # CustomObjectsApi only sends merge patches
+            return self.custom_api.api_client.call_api(
+                "/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}",
+                "PATCH",
+                path_params={
+                    "group": self.velero_group,
+                    "version": self.velero_version,
+                    "namespace": self.namespace,
+                    "plural": "schedules",
+                    "name": name
+                },
+                query_params=[("fieldManager", field_manager), ("force", "true")],
+                header_params={
+                    "Accept": "application/json",
+                    "Content-Type": "application/apply-patch+yaml"
+                },
+                body=body,
+                response_type="object",
+                auth_settings=["BearerToken"],
+                _return_http_data_only=True
+            )
+        except ApiException as e:
+            logger.error(f"Error applying schedule {name}: {e}")
+            raise
+    
+    def patch_schedule(self, name: str, patch: Dict[str, Any]) -> Dict[str, Any]:
+        """Patch a Schedule (JSON merge patch: null removes a field)"""
+        try:
+            return self.custom_api.patch_namespaced_custom_object(
+                group=self.velero_group,
+                version=self.velero_version,
+                namespace=self.namespace,
+                plural="schedules",
+                name=name,
+                body=patch
+            )
+        except ApiException as e:
+            logger.error(f"Error patching schedule {name}: {e}")
+            raise
+    
     # ===== BACKUP STORAGE LOCATION OPERATIONS =====
     
     def list_backup_storage_locations(self) -> List[Dict[str, Any]]:
@@ -238,6 +357,171 @@ class KubernetesClient:
             logger.error(f"Error patching BSL {name}: {e}")
             raise
     
+    # ===== BACKUP REPOSITORY OPERATIONS =====
+    
+    def list_backup_repositories(self) -> List[Dict[str, Any]]:
+        """List BackupRepositories (Kopia/Restic repositories per namespace and BSL)"""
+        try:
+            response = self.custom_api.list_namespaced_custom_object(
+                group=self.velero_group,
+                version=self.velero_version,
+                namespace=self.namespace,
+                plural="backuprepositories"
+            )
+            return response.get("items", [])
+        except ApiException as e:
+            logger.error(f"Error listing backup repositories: {e}")
+            raise
+    
+    # ===== POD VOLUME OPERATIONS =====
+    
+    def list_pod_volume_backups(self, backup_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List PodVolumeBackups (optionally of one Backup)"""
+        try:
+            response = self.custom_api.list_namespaced_custom_object(
+                group=self.velero_group,
+                version=self.velero_version,
+                namespace=self.namespace,
+                plural="podvolumebackups",
+                label_selector=f"velero.io/backup-name={backup_name}" if backup_name else None
+            )
+            return response.get("items", [])
+        except ApiException as e:
+            logger.error(f"Error listing pod volume backups: {e}")
+            raise
+    
+    def list_pod_volume_restores(self, restore_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List PodVolumeRestores (optionally of one Restore)"""
+        try:
+            response = self.custom_api.list_namespaced_custom_object(
+                group=self.velero_group,
+                version=self.velero_version,
+                namespace=self.namespace,
+                plural="podvolumerestores",
+                label_selector=f"velero.io/restore-name={restore_name}" if restore_name else None
+            )
+            return response.get("items", [])
+        except ApiException as e:
+            logger.error(f"Error listing pod volume restores: {e}")
+            raise
+    
+    # ===== DATA MOVER OPERATIONS =====
+    
+    def list_data_uploads(self, backup_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List DataUploads (optionally of one Backup)"""
+        try:
+            response = self.custom_api.list_namespaced_custom_object(
+                group=self.velero_group,
+                version=self.velero_data_mover_version,
+                namespace=self.namespace,
+                plural="datauploads",
+                label_selector=f"velero.io/backup-name={backup_name}" if backup_name else None
+            )
+            return response.get("items", [])
+        except ApiException as e:
+            logger.error(f"Error listing data uploads: {e}")
+            raise
+    
+    def list_data_downloads(self, restore_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List DataDownloads (optionally of one Restore)"""
+        try:
+            response = self.custom_api.list_namespaced_custom_object(
+                group=self.velero_group,
+                version=self.velero_data_mover_version,
+                namespace=self.namespace,
+                plural="datadownloads",
+                label_selector=f"velero.io/restore-name={restore_name}" if restore_name else None
+            )
+            return response.get("items", [])
+        except ApiException as e:
+            logger.error(f"Error listing data downloads: {e}")
+            raise
+    
+    # ===== DOWNLOAD REQUEST OPERATIONS =====
+    
+    def create_download_request(self, kind: str, target_name: str) -> Dict[str, Any]:
+        """
+        Create a DownloadRequest (signed URL for a file in object storage)
+        
+        Args:
+            kind: Target kind, e.g. "BackupLog" or "RestoreLog"
+            target_name: Backup/Restore name
+        """
+        body = {
+            "apiVersion": f"{self.velero_group}/{self.velero_version}",
+            "kind": "DownloadRequest",
+            "metadata": {"generateName": f"{target_name}-"},
+            "spec": {"target": {"kind": kind, "name": target_name}},
+        }
+        try:
+            return self.custom_api.create_namespaced_custom_object(
+                group=self.velero_group,
+                version=self.velero_version,
+                namespace=self.namespace,
+                plural="downloadrequests",
+                body=body
+            )
+        except ApiException as e:
+            logger.error(f"Error creating download request for {kind} {target_name}: {e}")
+            raise
+    
+    def wait_for_download_request(self, name: str, timeout_seconds: int) -> Dict[str, Any]:
+        """
+        Watch a DownloadRequest until Velero has processed it
+        
+        Raises:
+            TimeoutError: Not processed within timeout_seconds
+        """
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                self.custom_api.list_namespaced_custom_object,
+                group=self.velero_group,
+                version=self.velero_version,
+                namespace=self.namespace,
+                plural="downloadrequests",
+                field_selector=f"metadata.name={name}",
+                timeout_seconds=timeout_seconds
+            ):
+                obj = event["object"]
+                if event["type"] == "DELETED":
+                    raise RuntimeError(f"DownloadRequest {name} was deleted")
+                if obj.get("status", {}).get("phase") == "Processed":
+                    return obj
+        finally:
+            w.stop()
+        raise TimeoutError(f"DownloadRequest {name} not processed within {timeout_seconds}s")
+    
+    def delete_download_request(self, name: str) -> None:
+        """Delete a DownloadRequest"""
+        try:
+            self.custom_api.delete_namespaced_custom_object(
+                group=self.velero_group,
+                version=self.velero_version,
+                namespace=self.namespace,
+                plural="downloadrequests",
+                name=name
+            )
+        except ApiException as e:
+            logger.error(f"Error deleting download request {name}: {e}")
+            raise
+    
+    # ===== NODE AGENT OPERATIONS =====
+    
+    NODE_AGENT_LABEL_SELECTOR = "name=node-agent"
+    
+    def list_node_agent_pods(self) -> List[Dict[str, Any]]:
+        """List Velero node-agent (DaemonSet) pods"""
+        try:
+            response = self.core_api.list_namespaced_pod(
+                namespace=self.namespace,
+                label_selector=self.NODE_AGENT_LABEL_SELECTOR
+            )
+            return self.core_api.api_client.sanitize_for_serialization(response).get("items", [])
+        except ApiException as e:
+            logger.error(f"Error listing node agent pods: {e}")
+            raise
+    
     # ===== CONFIGMAP OPERATIONS =====
     
     def create_config_map(
@@ -285,5 +569,54 @@ class KubernetesClient:
                 raise
 
 
-# Global Kubernetes client instance
+class AsyncKubernetesClient:
+    """
+    asyncio interface for KubernetesClient
+    
+    Every public KubernetesClient method is exposed as a coroutine that runs
+    on a bounded thread pool, so a slow API server call never blocks the
+    event loop (and other requests) of the uvicorn worker.
+    
+    Example:
+        backups = await async_k8s_client.list_backups()
+    """
+    
+    def __init__(self, sync_client: KubernetesClient, max_workers: int):
+        """
+        Args:
+            sync_client: Wrapped synchronous client
+            max_workers: Maximum number of concurrent API server calls
+        """
+        self.sync_client = sync_client
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="k8s-client"
+        )
+    
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking function on the client thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            functools.partial(func, *args, **kwargs)
+        )
+    
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.sync_client, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        
+        @functools.wraps(attr)
+        async def async_method(*args: Any, **kwargs: Any) -> Any:
+            with K8S_CLIENT_CALL_DURATION.labels(name).time():
+                return await self.run(attr, *args, **kwargs)
+        
+        return async_method
+
+
+# Global Kubernetes client instances
 k8s_client = KubernetesClient()
+async_k8s_client = AsyncKubernetesClient(
+    k8s_client,
+    max_workers=settings.k8s_client_max_workers
+)
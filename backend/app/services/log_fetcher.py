@@ -0,0 +1,302 @@
+"""
+Velero Dashboard Backend - Log Fetcher
+
+DownloadRequest로 백업/복원 로그를 받아 압축을 풀어 스트리밍
+
+Velero가 발급한 signed URL의 gzip 로그를 chunk 단위로 읽으며 바로 압축을
+해제하므로 수백 MB 로그도 메모리에 전부 올리지 않습니다. 작은 로그는
+LRU 캐시에 보관해 반복 조회 시 DownloadRequest를 다시 만들지 않습니다.
+"""
+
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Optional, List, Dict, Tuple, Iterator, AsyncIterator, Callable, Any
+import asyncio
+import functools
+import itertools
+import logging
+import threading
+import time
+import urllib3
+import zlib
+
+from app.config import settings
+from app.services.k8s_client import KubernetesClient, k8s_client
+from app.services.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+# Signed URLs are reused until shortly before they expire
+URL_EXPIRY_MARGIN_SECONDS = 30
+
+LogKey = Tuple[str, str]
+"""(DownloadRequest target kind, resource name)"""
+
+
+class LogsNotAvailableError(Exception):
+    """Velero has no log file for the resource (yet)"""
+
+
+class LogCache:
+    """LRU cache of decompressed logs, bounded by total bytes"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[LogKey, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: LogKey) -> Optional[bytes]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    def put(self, key: LogKey, data: bytes) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = data
+            self._size += len(data)
+            while self._size > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+
+def iter_lines(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Split a chunk stream into lines (without the newline)"""
+    remainder = b""
+    for chunk in chunks:
+        lines = (remainder + chunk).split(b"\n")
+        remainder = lines.pop()
+        yield from lines
+    if remainder:
+        yield remainder
+
+
+def gunzip(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Decompress a gzip stream chunk by chunk"""
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        yield decompressor.decompress(chunk)
+    yield decompressor.flush()
+
+
+def _batched_lines(lines: Iterator[bytes]) -> Iterator[bytes]:
+    """Join lines back into ~CHUNK_SIZE chunks (one thread hop per chunk)"""
+    batch: List[bytes] = []
+    size = 0
+    for line in lines:
+        batch.append(line)
+        size += len(line) + 1
+        if size >= CHUNK_SIZE:
+            yield b"\n".join(batch) + b"\n"
+            batch, size = [], 0
+    if batch:
+        yield b"\n".join(batch) + b"\n"
+
+
+def select_lines(
+    chunks: Iterator[bytes],
+    tail: Optional[int] = None,
+    start: Optional[int] = None,
+    end: Optional[int] = None
+) -> Iterator[bytes]:
+    """
+    Restrict a log stream to a line range
+
+    Args:
+        chunks: Decompressed log chunks
+        tail: Last N lines (only N lines are kept in memory)
+        start: First line (1-based)
+        end: Last line (inclusive); reading stops there
+
+    Returns:
+        Chunks of the selected lines
+    """
+    try:
+        if tail:
+            yield from _batched_lines(iter(deque(iter_lines(chunks), maxlen=tail)))
+        elif start or end:
+            first = (start or 1) - 1
+            yield from _batched_lines(itertools.islice(iter_lines(chunks), first, end))
+        else:
+            yield from chunks
+    finally:
+        close = getattr(chunks, "close", None)
+        if close:
+            close()
+
+
+def _close_after(pending: Optional[Future], close: Callable[[], Any]) -> None:
+    """Close a chunk iterator after its in-flight next() call has returned"""
+    if pending is not None:
+        wait([pending])
+    close()
+
+
+class LogFetcher:
+    """Fetches Velero logs through DownloadRequests"""
+
+    def __init__(self, kube_client: KubernetesClient):
+        self.kube_client = kube_client
+        self.cache = LogCache(settings.log_cache_max_bytes)
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.log_fetch_max_workers,
+            thread_name_prefix="log-fetcher"
+        )
+        self.http = urllib3.PoolManager(
+            timeout=urllib3.Timeout(
+                connect=settings.s3_connect_timeout_seconds,
+                read=settings.s3_read_timeout_seconds
+            ),
+            retries=False
+        )
+        self._urls: Dict[LogKey, Tuple[str, float]] = {}
+        self._urls_lock = threading.Lock()
+
+    # ===== ASYNC HELPERS =====
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking function on the fetcher thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            functools.partial(func, *args, **kwargs)
+        )
+
+    async def stream(self, chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+        """Consume a blocking chunk iterator without blocking the event loop"""
+        sentinel = object()
+        pending: Optional[Future] = None
+        try:
+            while True:
+                pending = self.executor.submit(next, chunks, sentinel)
+                chunk = await asyncio.wrap_future(pending)
+                pending = None
+                if chunk is sentinel:
+                    break
+                yield chunk
+        finally:
+            close = getattr(chunks, "close", None)
+            if close:
+                # Client went away: stop the download once the worker thread
+                # is done with the generator (closing it mid-next() raises)
+                await asyncio.shield(
+                    asyncio.wrap_future(self.executor.submit(_close_after, pending, close))
+                )
+
+    # ===== FETCHING =====
+
+    def open(
+        self,
+        kind: str,
+        name: str,
+        tail: Optional[int] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """
+        Open a log as a stream of decompressed chunks (blocking)
+
+        The DownloadRequest and the HTTP request are made here, so errors
+        surface before any content is streamed; the body is read lazily.
+
+        Args:
+            kind: "BackupLog" or "RestoreLog"
+            name: Backup/Restore name
+            tail, start, end: Line selection (see select_lines)
+
+        Raises:
+            LogsNotAvailableError: No log file in object storage
+        """
+        key = (kind, name)
+        cached = self.cache.get(key)
+        record_cache("logs", kind, cached is not None)
+        if cached is not None:
+            return select_lines(iter([cached]), tail, start, end)
+
+        url = self._download_url(key)
+        response = self.http.request("GET", url, preload_content=False)
+        if response.status != 200:
+            response.release_conn()
+            self._forget_url(key)
+            if response.status == 404:
+                raise LogsNotAvailableError(f"No {kind} for {name}")
+            raise RuntimeError(f"Log download failed: HTTP {response.status}")
+
+        return select_lines(self._decompress(key, response), tail, start, end)
+
+    def _download_url(self, key: LogKey) -> str:
+        """Signed URL of a log (reused until it expires)"""
+        with self._urls_lock:
+            cached = self._urls.get(key)
+        if cached and cached[1] - URL_EXPIRY_MARGIN_SECONDS > time.time():
+            return cached[0]
+
+        kind, name = key
+        request = self.kube_client.create_download_request(kind, name)
+        request_name = request.get("metadata", {}).get("name", "")
+        try:
+            processed = self.kube_client.wait_for_download_request(
+                request_name,
+                settings.download_request_timeout_seconds
+            )
+        finally:
+            try:
+                self.kube_client.delete_download_request(request_name)
+            except Exception:
+                pass  # Velero garbage-collects expired requests
+
+        status = processed.get("status", {})
+        url = status.get("downloadURL")
+        if not url:
+            raise LogsNotAvailableError(f"No {kind} for {name}")
+
+        expiration = status.get("expiration")
+        expires = (
+            datetime.fromisoformat(expiration.replace("Z", "+00:00")).timestamp()
+            if expiration else time.time()
+        )
+        with self._urls_lock:
+            self._urls[key] = (url, expires)
+        return url
+
+    def _forget_url(self, key: LogKey) -> None:
+        with self._urls_lock:
+            self._urls.pop(key, None)
+
+    def _decompress(self, key: LogKey, response: urllib3.BaseHTTPResponse) -> Iterator[bytes]:
+        """Gunzip the response body chunk by chunk; small logs are cached"""
+        kept: Optional[List[bytes]] = []
+        size = 0
+        finished = False
+        try:
+            for data in gunzip(response.stream(CHUNK_SIZE, decode_content=False)):
+                if not data:
+                    continue
+                if kept is not None:
+                    size += len(data)
+                    if size > settings.log_cache_max_entry_bytes:
+                        kept = None
+                    else:
+                        kept.append(data)
+                yield data
+            finished = True
+        finally:
+            if finished:
+                response.release_conn()
+                if kept is not None:
+                    self.cache.put(key, b"".join(kept))
+            else:
+                # Stopped early: drop the connection instead of draining it
+                response.close()
+
+
+# Global log fetcher instance
+log_fetcher = LogFetcher(k8s_client)
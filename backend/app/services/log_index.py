@@ -0,0 +1,457 @@
+"""
+Velero Dashboard Backend - Log Search Index
+
+완료된 백업/복원 로그의 전문 검색 인덱스 (SQLite FTS5)
+
+Backup/Restore가 종료 phase가 되면 DownloadRequest로 로그를 받아 logrus
+라인을 구조화(level, resource, namespace, error)해 저장합니다. 검색은
+FTS5 역색인으로 처리하며, 오래된 실행부터 기간/용량 기준으로 삭제합니다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Tuple, Iterator, Callable
+import asyncio
+import functools
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from app.config import settings
+from app.services.log_fetcher import log_fetcher, iter_lines, LogsNotAvailableError
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_PHASES = {"Completed", "PartiallyFailed", "Failed", "FailedValidation"}
+
+LOG_KINDS = {"backups": "BackupLog", "restores": "RestoreLog"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    phase TEXT,
+    completed_at TEXT,
+    ingested_at REAL NOT NULL,
+    lines INTEGER NOT NULL DEFAULT 0,
+    complete INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (kind, name)
+);
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL,
+    line INTEGER NOT NULL,
+    time TEXT,
+    level TEXT,
+    resource TEXT,
+    namespace TEXT,
+    item TEXT,
+    msg TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS records_run ON records (run_id);
+CREATE INDEX IF NOT EXISTS records_level ON records (level, id);
+CREATE VIRTUAL TABLE IF NOT EXISTS records_fts USING fts5(
+    msg, error, resource, namespace, item,
+    content='records', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS records_ai AFTER INSERT ON records BEGIN
+    INSERT INTO records_fts (rowid, msg, error, resource, namespace, item)
+    VALUES (new.id, new.msg, new.error, new.resource, new.namespace, new.item);
+END;
+CREATE TRIGGER IF NOT EXISTS records_ad AFTER DELETE ON records BEGIN
+    INSERT INTO records_fts (records_fts, rowid, msg, error, resource, namespace, item)
+    VALUES ('delete', old.id, old.msg, old.error, old.resource, old.namespace, old.item);
+END;
+"""
+
+# key=value and key="quoted \"value\"" pairs of a logrus text line
+LOGRUS_FIELD = re.compile(r'([\w.]+)=("(?:[^"\\]|\\.)*"|\S*)')
+
+ERROR_FIELDS = ("error", "error.message", "err")
+
+BATCH_SIZE = 1000
+
+
+def parse_logrus_line(line: str) -> Dict[str, Optional[str]]:
+    """
+    Parse a logrus text line
+
+    Example:
+        time="2024-01-01T00:00:00Z" level=info msg="Backing up item"
+        backup=velero/b1 resource=pods namespace=app name=web-0
+    """
+    fields: Dict[str, str] = {}
+    for key, value in LOGRUS_FIELD.findall(line):
+        if value.startswith('"'):
+            value = value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+        fields[key] = value
+
+    if "msg" not in fields and "level" not in fields:
+        # Not a logrus line (e.g. plugin stderr): keep it as the message
+        return {"time": None, "level": None, "resource": None, "namespace": None,
+                "item": None, "msg": line, "error": None}
+
+    return {
+        "time": fields.get("time"),
+        "level": fields.get("level"),
+        "resource": fields.get("resource") or fields.get("groupResource"),
+        "namespace": fields.get("namespace"),
+        "item": fields.get("name"),
+        "msg": fields.get("msg"),
+        "error": next((fields[k] for k in ERROR_FIELDS if fields.get(k)), None),
+    }
+
+
+def _quote_fts(q: str) -> str:
+    """Turn every word of a query into a literal FTS5 phrase"""
+    return " ".join('"' + token.replace('"', '""') + '"' for token in q.split())
+
+
+class LogIndex:
+    """On-disk full-text index of Velero backup/restore logs"""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            # Must precede table creation; lets eviction shrink the file
+            self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+            # Runs left half-ingested by a previous process
+            for row in self._conn.execute("SELECT kind, name FROM runs WHERE complete = 0").fetchall():
+                self._delete_run(row["kind"], row["name"])
+            self._conn.commit()
+
+    # ===== INGESTION =====
+
+    def has_run(self, kind: str, name: str) -> bool:
+        """Whether the log of a run is fully indexed"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM runs WHERE kind = ? AND name = ? AND complete = 1", (kind, name)
+            ).fetchone() is not None
+
+    def ingest(self, kind: str, name: str, phase: Optional[str], completed_at: Optional[str], lines: Iterator[bytes]) -> int:
+        """
+        Replace the indexed log of a run (blocking)
+
+        The run is marked complete only after the last line and searches
+        only see complete runs; a failed ingestion is removed again.
+
+        Returns:
+            Number of indexed lines
+        """
+        with self._lock:
+            self._delete_run(kind, name)
+            cursor = self._conn.execute(
+                "INSERT INTO runs (kind, name, phase, completed_at, ingested_at) VALUES (?, ?, ?, ?, ?)",
+                (kind, name, phase, completed_at, time.time())
+            )
+            run_id = cursor.lastrowid
+            self._conn.commit()
+
+        count = 0
+        batch: List[Tuple] = []
+        try:
+            for count, raw in enumerate(lines, start=1):
+                record = parse_logrus_line(raw.decode("utf-8", errors="replace"))
+                batch.append((
+                    run_id, count, record["time"], record["level"], record["resource"],
+                    record["namespace"], record["item"], record["msg"], record["error"]
+                ))
+                if len(batch) >= BATCH_SIZE:
+                    self._insert(batch)
+                    batch = []
+            if batch:
+                self._insert(batch)
+        except BaseException:
+            with self._lock:
+                self._delete_run(kind, name)
+                self._conn.commit()
+            raise
+
+        with self._lock:
+            self._conn.execute("UPDATE runs SET lines = ?, complete = 1 WHERE id = ?", (count, run_id))
+            self._conn.commit()
+        return count
+
+    def _insert(self, batch: List[Tuple]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO records (run_id, line, time, level, resource, namespace, item, msg, error) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                batch
+            )
+            self._conn.commit()
+
+    def _delete_run(self, kind: str, name: str) -> None:
+        """Remove a run and its records (lock held)"""
+        row = self._conn.execute(
+            "SELECT id FROM runs WHERE kind = ? AND name = ?", (kind, name)
+        ).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM records WHERE run_id = ?", (row["id"],))
+            self._conn.execute("DELETE FROM runs WHERE id = ?", (row["id"],))
+
+    # ===== EVICTION =====
+
+    def _used_bytes(self) -> int:
+        page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+        pages = self._conn.execute("PRAGMA page_count").fetchone()[0]
+        free = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return (pages - free) * page_size
+
+    def evict(self, max_age_days: int, max_bytes: int) -> int:
+        """
+        Drop runs older than max_age_days (by completion, or by ingestion
+        when the completion time is unknown), then the oldest runs until
+        the index fits in max_bytes
+
+        Returns:
+            Number of evicted runs
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+        evicted = 0
+        with self._lock:
+            for row in self._conn.execute(
+                "SELECT kind, name FROM runs WHERE completed_at < ? "
+                "OR (COALESCE(completed_at, '') = '' AND ingested_at < ?)",
+                (cutoff.strftime("%Y-%m-%dT%H:%M:%SZ"), cutoff.timestamp())
+            ).fetchall():
+                self._delete_run(row["kind"], row["name"])
+                evicted += 1
+            self._conn.commit()
+
+            while self._used_bytes() > max_bytes:
+                row = self._conn.execute(
+                    "SELECT kind, name FROM runs ORDER BY completed_at, id LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    break
+                self._delete_run(row["kind"], row["name"])
+                self._conn.commit()
+                evicted += 1
+
+            if evicted:
+                self._conn.execute("PRAGMA incremental_vacuum")
+                self._conn.commit()
+        return evicted
+
+    # ===== SEARCH =====
+
+    def search(
+        self,
+        q: Optional[str] = None,
+        levels: Optional[List[str]] = None,
+        kind: Optional[str] = None,
+        name: Optional[str] = None,
+        namespace: Optional[str] = None,
+        resource: Optional[str] = None,
+        limit: int = 100,
+        before: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Search indexed log records of complete runs, newest first
+
+        Args:
+            q: FTS5 query over msg/error/resource/namespace/name
+               (plain words when it is not a valid FTS5 expression)
+            levels: Allowed log levels
+            kind, name: Restrict to one backup or restore log
+            namespace, resource: Exact field filters
+            limit: Page size
+            before: Record id cursor from the previous page
+
+        Returns:
+            (records, next cursor or None)
+        """
+        # Runs still being ingested would return partial results
+        where: List[str] = ["runs.complete = 1"]
+        params: List[Any] = []
+        source = "records r"
+        # With a query, FTS5 walks its matches newest first and stops at the
+        # page limit instead of materializing every matching rowid
+        id_column = "r.id"
+        if q:
+            source = "records_fts JOIN records r ON r.id = records_fts.rowid"
+            id_column = "records_fts.rowid"
+            where.append("records_fts MATCH ?")
+            params.append(q)
+        if levels:
+            where.append(f"r.level IN ({', '.join('?' for _ in levels)})")
+            params.extend(levels)
+        if kind:
+            where.append("runs.kind = ?")
+            params.append(kind)
+        if name:
+            where.append("runs.name = ?")
+            params.append(name)
+        if namespace:
+            where.append("r.namespace = ?")
+            params.append(namespace)
+        if resource:
+            where.append("r.resource = ?")
+            params.append(resource)
+        if before:
+            where.append(f"{id_column} < ?")
+            params.append(before)
+
+        sql = (
+            "SELECT r.id, runs.kind, runs.name, r.line, r.time, r.level, r.resource, "
+            "r.namespace, r.item, r.msg, r.error "
+            f"FROM {source} JOIN runs ON runs.id = r.run_id "
+            + "WHERE " + " AND ".join(where) + " "
+            + f"ORDER BY {id_column} DESC LIMIT ?"
+        )
+        params.append(limit)
+
+        with self._lock:
+            try:
+                rows = self._conn.execute(sql, params).fetchall()
+            except sqlite3.OperationalError:
+                if not q:
+                    raise
+                params[0] = _quote_fts(q)
+                rows = self._conn.execute(sql, params).fetchall()
+
+        records = [
+            {
+                "id": row["id"],
+                "kind": row["kind"],
+                "name": row["name"],
+                "line": row["line"],
+                "time": row["time"],
+                "level": row["level"],
+                "resource": row["resource"],
+                "namespace": row["namespace"],
+                "item": row["item"],
+                "msg": row["msg"],
+                "error": row["error"],
+            }
+            for row in rows
+        ]
+        next_before = records[-1]["id"] if len(records) == limit else None
+        return records, next_before
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) AS runs, COALESCE(SUM(lines), 0) AS lines FROM runs WHERE complete = 1"
+            ).fetchone()
+            return {"runs": row["runs"], "lines": row["lines"], "bytes": self._used_bytes()}
+
+
+class LogIndexer:
+    """Ingests logs of finished backups/restores into the LogIndex"""
+
+    def __init__(self, index: LogIndex):
+        self.index = index
+        # Single writer thread: ingestion is sequential and never starves API threads
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-indexer")
+        self.query_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="log-search")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._pending: set = set()
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking index query off the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.query_executor,
+            functools.partial(func, *args, **kwargs)
+        )
+
+    def attach(self, informers) -> None:
+        """Ingest logs when backups/restores reach a terminal phase (on the running loop)"""
+        if not settings.log_index_enabled:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        for plural, kind in LOG_KINDS.items():
+            informers.informer(plural).add_event_handler(self._make_handler(kind))
+
+    def start(self) -> None:
+        """Start ingesting (runs queued before start are kept)"""
+        if self._queue is not None and self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+    def _make_handler(self, kind: str):
+        def handler(event_type: str, obj: Dict[str, Any], old: Optional[Dict[str, Any]]) -> None:
+            if event_type == "DELETED" or self._loop is None:
+                return
+            status = obj.get("status", {})
+            phase = status.get("phase")
+            if phase not in TERMINAL_PHASES:
+                return
+            if old is not None and old.get("status", {}).get("phase") in TERMINAL_PHASES:
+                return
+            self._loop.call_soon_threadsafe(
+                self._enqueue,
+                kind,
+                obj.get("metadata", {}).get("name", ""),
+                phase,
+                status.get("completionTimestamp")
+            )
+        return handler
+
+    def _enqueue(self, kind: str, name: str, phase: str, completed_at: Optional[str]) -> None:
+        if (kind, name) in self._pending:
+            return
+        self._pending.add((kind, name))
+        self._queue.put_nowait((kind, name, phase, completed_at))
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            kind, name, phase, completed_at = await self._queue.get()
+            try:
+                await loop.run_in_executor(self.executor, self._ingest, kind, name, phase, completed_at)
+            except Exception as e:
+                logger.warning(f"Cannot index {kind} of {name}: {e}")
+            finally:
+                self._pending.discard((kind, name))
+
+    def _ingest(self, kind: str, name: str, phase: str, completed_at: Optional[str]) -> None:
+        """Fetch and index one log (log-indexer thread)"""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=settings.log_index_max_age_days)
+        if completed_at and completed_at < cutoff.strftime("%Y-%m-%dT%H:%M:%SZ"):
+            return
+        if self.index.has_run(kind, name):
+            return
+
+        try:
+            chunks = log_fetcher.open(kind, name)
+        except LogsNotAvailableError:
+            logger.info(f"No {kind} for {name}, not indexed")
+            return
+
+        try:
+            lines = self.index.ingest(kind, name, phase, completed_at, iter_lines(chunks))
+        finally:
+            chunks.close()
+        logger.info(f"Indexed {lines} lines of {kind} {name}")
+
+        self.index.evict(settings.log_index_max_age_days, settings.log_index_max_bytes)
+
+
+# Global log index instances
+log_index = LogIndex(os.path.join(settings.data_dir, "log_index.db"))
+log_indexer = LogIndexer(log_index)
@@ -0,0 +1,244 @@
+"""
+Velero Dashboard Backend - Metrics
+
+Prometheus 지표 정의와 계측 도구 (HTTP, API server, S3, 캐시, event loop 지연)
+
+지표는 prometheus_client 기본 registry에 등록되며 /metrics에서 노출됩니다.
+이 모듈은 config 외의 app 모듈을 import하지 않으므로 어디서든 계측에 사용할 수 있습니다.
+"""
+
+from typing import Optional, Any, Callable, Dict
+from prometheus_client import Counter, Gauge, Histogram
+import asyncio
+import functools
+import logging
+import time
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+NAMESPACE = "velero_dashboard"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time until response headers, per route",
+    ["router", "method", "route", "status"],
+    namespace=NAMESPACE,
+    buckets=LATENCY_BUCKETS
+)
+
+APISERVER_REQUEST_DURATION = Histogram(
+    "apiserver_request_duration_seconds",
+    "Kubernetes API server request latency (watch: until the stream opens)",
+    ["cluster", "verb", "resource"],
+    namespace=NAMESPACE,
+    buckets=LATENCY_BUCKETS
+)
+
+APISERVER_REQUEST_ERRORS = Counter(
+    "apiserver_request_errors_total",
+    "Failed Kubernetes API server requests",
+    ["cluster", "verb", "resource", "code"],
+    namespace=NAMESPACE
+)
+
+K8S_CLIENT_CALL_DURATION = Histogram(
+    "k8s_client_call_duration_seconds",
+    "KubernetesClient method latency from the event loop (includes thread pool wait)",
+    ["method"],
+    namespace=NAMESPACE,
+    buckets=LATENCY_BUCKETS
+)
+
+S3_REQUEST_DURATION = Histogram(
+    "s3_request_duration_seconds",
+    "S3 request latency per operation",
+    ["operation"],
+    namespace=NAMESPACE,
+    buckets=LATENCY_BUCKETS
+)
+
+S3_REQUEST_ERRORS = Counter(
+    "s3_request_errors_total",
+    "Failed S3 requests (HTTP status, or the exception for connection errors)",
+    ["operation", "code"],
+    namespace=NAMESPACE
+)
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups (result: hit or miss)",
+    ["cache", "resource", "result"],
+    namespace=NAMESPACE
+)
+
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "Delay of event loop timer callbacks beyond their schedule",
+    namespace=NAMESPACE,
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+)
+
+EVENT_LOOP_LAG_LAST = Gauge(
+    "event_loop_lag_last_seconds",
+    "Most recent event loop lag sample",
+    namespace=NAMESPACE
+)
+
+
+def record_cache(cache: str, resource: str, hit: bool) -> None:
+    CACHE_REQUESTS.labels(cache, resource, "hit" if hit else "miss").inc()
+
+
+# ===== KUBERNETES API =====
+
+def _resource(method_name: str, kwargs: Dict[str, Any]) -> str:
+    """Resource of an API call: the CR plural, or the core type from the method name"""
+    if "plural" in kwargs:
+        return kwargs["plural"]
+    # e.g. list_namespaced_pod -> pod, delete_namespaced_config_map -> config_map
+    _, _, resource = method_name.partition("_namespaced_")
+    return resource or method_name.split("_", 1)[-1]
+
+
+class InstrumentedApi:
+    """
+    Proxy of a kubernetes API object (CustomObjectsApi, CoreV1Api) recording
+    latency and errors of every call
+
+    functools.wraps keeps the docstrings that kubernetes.watch inspects, so
+    the wrapped list functions still work with Watch.stream.
+    """
+
+    def __init__(self, api: Any, cluster: str):
+        self._api = api
+        self._cluster = cluster
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._api, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            verb = "watch" if kwargs.get("watch") else name.split("_", 1)[0]
+            resource = _resource(name, kwargs)
+            start = time.perf_counter()
+            try:
+                return attr(*args, **kwargs)
+            except Exception as e:
+                code = str(getattr(e, "status", None) or type(e).__name__)
+                APISERVER_REQUEST_ERRORS.labels(self._cluster, verb, resource, code).inc()
+                raise
+            finally:
+                APISERVER_REQUEST_DURATION.labels(self._cluster, verb, resource).observe(
+                    time.perf_counter() - start
+                )
+
+        return call
+
+
+# ===== S3 =====
+
+def instrument_s3_client(s3_client: Any) -> None:
+    """Record latency and errors of every call through botocore events"""
+    events = s3_client.meta.events
+
+    def before_call(model: Any, context: Dict[str, Any], **kwargs: Any) -> None:
+        context["metrics_call"] = (model.name, time.perf_counter())
+
+    def after_call(http_response: Any, context: Dict[str, Any], **kwargs: Any) -> None:
+        operation = _observe_s3(context)
+        if operation and http_response.status_code >= 400:
+            S3_REQUEST_ERRORS.labels(operation, str(http_response.status_code)).inc()
+
+    def after_call_error(exception: Exception, context: Dict[str, Any], **kwargs: Any) -> None:
+        # Connection errors: botocore passes no operation model here
+        operation = _observe_s3(context)
+        if operation:
+            S3_REQUEST_ERRORS.labels(operation, type(exception).__name__).inc()
+
+    events.register("before-call.s3", before_call)
+    events.register("after-call.s3", after_call)
+    events.register("after-call-error.s3", after_call_error)
+
+
+def _observe_s3(context: Dict[str, Any]) -> Optional[str]:
+    """Observe the latency of the call started in context; returns its operation"""
+    call = context.pop("metrics_call", None)
+    if call is None:
+        return None
+    operation, start = call
+    S3_REQUEST_DURATION.labels(operation).observe(time.perf_counter() - start)
+    return operation
+
+
+# ===== HTTP =====
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request latency per router and route template
+
+    Latency is measured until the response headers are sent, so streaming
+    responses (logs, SSE) are not timed to completion.
+    """
+
+    def __init__(self, app: Callable):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+
+        async def send_with_metrics(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                route = scope.get("route")
+                tags = getattr(route, "tags", None)
+                HTTP_REQUEST_DURATION.labels(
+                    tags[0] if tags else "root",
+                    scope["method"],
+                    getattr(route, "path", "<unmatched>"),
+                    str(message["status"])
+                ).observe(time.perf_counter() - start)
+            await send(message)
+
+        await self.app(scope, receive, send_with_metrics)
+
+
+# ===== EVENT LOOP =====
+
+class EventLoopLagMonitor:
+    """Measures how late a periodic timer fires on the event loop"""
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self.interval_seconds > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            lag = max(loop.time() - scheduled, 0.0)
+            EVENT_LOOP_LAG.observe(lag)
+            EVENT_LOOP_LAG_LAST.set(lag)
+
+
+# Global event loop lag monitor instance
+event_loop_lag_monitor = EventLoopLagMonitor(settings.event_loop_lag_interval_seconds)
@@ -0,0 +1,218 @@
+"""
+Velero Dashboard Backend - Backup Deletion Operations
+
+DeleteBackupRequest 기반 백업 삭제 큐 및 진행 상태 추적
+
+삭제 요청은 큐에 쌓이고 설정된 병렬도만큼만 동시에 Velero에 제출됩니다.
+진행 상태는 DeleteBackupRequest informer(watch) 이벤트로 갱신되며,
+API 요청은 작업 ID를 받아 즉시 반환합니다 (202).
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any
+from kubernetes.client.rest import ApiException
+import asyncio
+import logging
+import uuid
+
+from app.config import settings
+from app.services.k8s_client import async_k8s_client
+from app.services.batch import call_with_retry, batch_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+OPERATION_LABEL = "velero-dashboard/operation-id"
+"""DeleteBackupRequest label linking watch events to an operation"""
+
+QUEUED = "Queued"
+IN_PROGRESS = "InProgress"
+COMPLETED = "Completed"
+FAILED = "Failed"
+FINISHED_STATES = (COMPLETED, FAILED)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class Operation:
+    """Deletion of one backup"""
+
+    def __init__(self, backup_name: str):
+        self.id = uuid.uuid4().hex
+        self.kind = "DeleteBackup"
+        self.target = backup_name
+        self.state = QUEUED
+        self.phase: Optional[str] = None  # DeleteBackupRequest status.phase
+        self.request_name: Optional[str] = None
+        self.errors: List[str] = []
+        self.created_at = _now()
+        self.updated_at = self.created_at
+        self.done = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED_STATES
+
+    def update(self, state: Optional[str] = None, phase: Optional[str] = None) -> None:
+        if state:
+            self.state = state
+        if phase:
+            self.phase = phase
+        self.updated_at = _now()
+
+    def finish(self, state: str, errors: Optional[List[str]] = None) -> None:
+        if errors:
+            self.errors = errors
+        self.update(state)
+        self.done.set()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "target": self.target,
+            "state": self.state,
+            "phase": self.phase,
+            "requestName": self.request_name,
+            "errors": self.errors,
+            "createdAt": self.created_at,
+            "updatedAt": self.updated_at,
+        }
+
+
+class DeletionQueue:
+    """
+    Queue of backup deletions with bounded parallelism
+
+    A worker creates the DeleteBackupRequest and holds its slot until the
+    watch reports the request as processed (or DELETE_TIMEOUT_SECONDS), so
+    at most DELETE_PARALLELISM deletions are running in Velero at a time.
+    """
+
+    def __init__(self):
+        self._operations: "OrderedDict[str, Operation]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._informer = None
+
+    # ===== LIFECYCLE =====
+
+    def attach(self, informers) -> None:
+        """Follow DeleteBackupRequests through the informer (watch events)"""
+        self._informer = informers.informer("deletebackuprequests")
+        self._informer.add_event_handler(self._on_request_event)
+
+    def start(self) -> None:
+        """Start the workers (on the running event loop)"""
+        self._loop = asyncio.get_running_loop()
+        if self._informer is not None:
+            # Tracking needs the watch even when reads bypass the cache
+            self._informer.start()
+        self._queue = asyncio.Queue()
+        self._workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(settings.delete_parallelism)
+        ]
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    # ===== SUBMISSION =====
+
+    def submit(self, backup_name: str) -> Operation:
+        """Queue the deletion of a backup"""
+        if self._queue is None:
+            raise RuntimeError("Deletion queue is not running")
+        operation = Operation(backup_name)
+        self._operations[operation.id] = operation
+        self._evict()
+        self._queue.put_nowait(operation)
+        return operation
+
+    def _evict(self) -> None:
+        """Drop the oldest finished operations beyond the history size"""
+        excess = len(self._operations) - settings.operation_history_size
+        for operation_id in [k for k, op in self._operations.items() if op.finished][:max(excess, 0)]:
+            del self._operations[operation_id]
+
+    async def _worker(self) -> None:
+        while True:
+            operation = await self._queue.get()
+            try:
+                await self._process(operation)
+            except Exception as e:
+                logger.error(f"Deletion of backup {operation.target} failed: {e}")
+                operation.finish(FAILED, [str(e)])
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, operation: Operation) -> None:
+        operation.update(IN_PROGRESS)
+        try:
+            request = await call_with_retry(
+                lambda: async_k8s_client.create_delete_backup_request(
+                    operation.target,
+                    labels={OPERATION_LABEL: operation.id}
+                ),
+                batch_rate_limiter
+            )
+        except ApiException as e:
+            operation.finish(FAILED, [f"{e.status} {e.reason}"])
+            return
+
+        operation.request_name = request.get("metadata", {}).get("name")
+        logger.info(f"Deletion of backup {operation.target} submitted: {operation.request_name}")
+
+        try:
+            await asyncio.wait_for(operation.done.wait(), settings.delete_timeout_seconds)
+        except asyncio.TimeoutError:
+            # Keep tracking through the watch, but free the slot
+            logger.warning(f"Deletion of backup {operation.target} still running after {settings.delete_timeout_seconds}s")
+
+    # ===== WATCH EVENTS =====
+
+    def _on_request_event(self, event_type: str, obj: Dict[str, Any], old: Optional[Dict[str, Any]]) -> None:
+        """Informer event handler (informer thread)"""
+        operation_id = obj.get("metadata", {}).get("labels", {}).get(OPERATION_LABEL)
+        if operation_id and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._apply_request, operation_id, event_type, obj)
+
+    def _apply_request(self, operation_id: str, event_type: str, obj: Dict[str, Any]) -> None:
+        operation = self._operations.get(operation_id)
+        if operation is None or operation.finished:
+            return
+
+        operation.request_name = obj.get("metadata", {}).get("name")
+        status = obj.get("status", {})
+        errors = status.get("errors") or []
+
+        if event_type == "DELETED":
+            # Velero removes the requests of a backup once it is deleted
+            operation.finish(FAILED if errors else COMPLETED, errors)
+        elif status.get("phase") == "Processed":
+            operation.update(phase="Processed")
+            operation.finish(FAILED if errors else COMPLETED, errors)
+        else:
+            operation.update(phase=status.get("phase", "New"))
+
+    # ===== READ API =====
+
+    def get(self, operation_id: str) -> Optional[Operation]:
+        return self._operations.get(operation_id)
+
+    def list(self, state: Optional[str] = None) -> List[Operation]:
+        """Tracked operations, newest first"""
+        return [
+            op for op in reversed(self._operations.values())
+            if state is None or op.state == state
+        ]
+
+
+# Global deletion queue instance
+deletion_queue = DeletionQueue()
@@ -0,0 +1,239 @@
+"""
+Velero Dashboard Backend - Backup Repository Health
+
+BackupRepository 유지보수(Kopia/Restic maintenance) 이력, 지연 감지, 지연 지표
+
+Informer 이벤트마다 저장소별 lastMaintenanceTime/phase 변화를 이력으로
+남기고, maintenanceFrequency 대비 유지보수가 밀린 저장소를 찾아냅니다.
+"""
+
+from collections import OrderedDict, deque, defaultdict
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any
+import logging
+import re
+import threading
+import time
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+GO_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ns|us|µs|ms|s|m|h)")
+
+GO_DURATION_UNITS = {
+    "ns": 1e-9,
+    "us": 1e-6,
+    "µs": 1e-6,
+    "ms": 1e-3,
+    "s": 1,
+    "m": 60,
+    "h": 3600,
+}
+
+
+def parse_go_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Seconds of a Go duration string (e.g. "1h0m0s", "168h", "1.5h")
+
+    Returns:
+        None for empty or invalid values
+    """
+    if not value:
+        return None
+    parts = GO_DURATION_PART.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value.lstrip("+"):
+        return None
+    return sum(float(number) * GO_DURATION_UNITS[unit] for number, unit in parts)
+
+
+def _timestamp(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def _isoformat(value: float) -> str:
+    return datetime.fromtimestamp(value, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def repository_health(repo: Dict[str, Any], now: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Maintenance health of a BackupRepository
+
+    A repository is overdue when its last maintenance (or its creation, if
+    never maintained) is older than maintenanceFrequency plus
+    REPOSITORY_MAINTENANCE_GRACE_SECONDS.
+    """
+    now = now or time.time()
+    metadata = repo.get("metadata", {})
+    spec = repo.get("spec", {})
+    status = repo.get("status", {})
+
+    frequency = parse_go_duration(spec.get("maintenanceFrequency"))
+    last = _timestamp(status.get("lastMaintenanceTime"))
+    since = last if last is not None else _timestamp(metadata.get("creationTimestamp"))
+    lag = now - since if since is not None else None
+
+    overdue_seconds = None
+    if frequency is not None and lag is not None:
+        overdue_seconds = max(lag - frequency, 0.0)
+
+    recent = status.get("recentMaintenance") or []
+    last_run = recent[-1] if recent else {}
+
+    return {
+        "name": metadata.get("name", ""),
+        "phase": status.get("phase", "Unknown"),
+        "volumeNamespace": spec.get("volumeNamespace", ""),
+        "storageLocation": spec.get("backupStorageLocation", ""),
+        "repositoryType": spec.get("repositoryType", ""),
+        "maintenanceFrequency": spec.get("maintenanceFrequency"),
+        "maintenanceFrequencySeconds": frequency,
+        "lastMaintenanceTime": status.get("lastMaintenanceTime"),
+        "nextMaintenanceDue": _isoformat(since + frequency) if since is not None and frequency else None,
+        "lagSeconds": round(lag) if lag is not None else None,
+        "overdueSeconds": round(overdue_seconds) if overdue_seconds is not None else None,
+        "overdue": bool(
+            overdue_seconds is not None
+            and overdue_seconds > settings.repository_maintenance_grace_seconds
+        ),
+        "lastMaintenanceResult": last_run.get("result"),
+        "failedMaintenances": sum(1 for run in recent if run.get("result") == "Failed"),
+        "message": status.get("message", "")
+    }
+
+
+class RepositoryMonitor:
+    """Rolling maintenance/phase history per BackupRepository"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._history: "OrderedDict[str, deque]" = OrderedDict()
+
+    def attach(self, informers) -> None:
+        """Record changes from the backuprepositories informer"""
+        informers.informer("backuprepositories").add_event_handler(self._on_repository)
+
+    # ===== WATCH EVENTS =====
+
+    def _on_repository(self, event_type: str, obj: Dict[str, Any], old: Optional[Dict[str, Any]]) -> None:
+        """Informer event handler: append an entry when maintenance time or phase changes"""
+        name = obj.get("metadata", {}).get("name", "")
+        if event_type == "DELETED":
+            with self._lock:
+                self._history.pop(name, None)
+            return
+
+        status = obj.get("status", {})
+        old_status = (old or {}).get("status", {})
+        last = status.get("lastMaintenanceTime")
+        phase = status.get("phase", "New")
+
+        with self._lock:
+            history = self._history.get(name)
+            if history is None:
+                history = deque(maxlen=settings.repository_history_size)
+                self._history[name] = history
+                self._seed(history, status)
+            elif last == old_status.get("lastMaintenanceTime") and phase == old_status.get("phase"):
+                return
+
+            if history and history[-1]["lastMaintenanceTime"] == last and history[-1]["phase"] == phase:
+                return
+            previous = next((e for e in reversed(history) if e["lastMaintenanceTime"]), None)
+            history.append(self._entry(
+                _isoformat(time.time()),
+                phase,
+                last,
+                previous["lastMaintenanceTime"] if previous else None,
+                status.get("message", "")
+            ))
+
+    def _seed(self, history: deque, status: Dict[str, Any]) -> None:
+        """Start the history from status.recentMaintenance (Velero 1.15+)"""
+        previous: Optional[str] = None
+        for run in status.get("recentMaintenance") or []:
+            completed = run.get("completeTimestamp")
+            if not completed:
+                continue
+            entry = self._entry(completed, status.get("phase", "New"), completed, previous, run.get("message", ""))
+            entry["result"] = run.get("result")
+            started = _timestamp(run.get("startTimestamp"))
+            if started is not None:
+                entry["durationSeconds"] = round(_timestamp(completed) - started)
+            history.append(entry)
+            previous = completed
+
+    @staticmethod
+    def _entry(
+        observed: str,
+        phase: str,
+        last: Optional[str],
+        previous_last: Optional[str],
+        message: str
+    ) -> Dict[str, Any]:
+        interval = None
+        if last and previous_last and last != previous_last:
+            interval = round(_timestamp(last) - _timestamp(previous_last))
+        return {
+            "observedAt": observed,
+            "phase": phase,
+            "lastMaintenanceTime": last,
+            "intervalSeconds": interval,
+            "message": message,
+        }
+
+    # ===== READ API =====
+
+    def history(self, name: str) -> Optional[List[Dict[str, Any]]]:
+        """Maintenance/phase history of a repository, oldest first"""
+        with self._lock:
+            history = self._history.get(name)
+            return list(history) if history is not None else None
+
+    def metrics(self, healths: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Maintenance-lag metrics over repository health reports
+
+        Returns:
+            Counts per phase, overdue count, lag max/mean/p95, mean observed
+            maintenance interval and a per-BSL breakdown
+        """
+        lags = sorted(h["lagSeconds"] for h in healths if h["lagSeconds"] is not None)
+        by_phase: Dict[str, int] = defaultdict(int)
+        by_location: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"repositories": 0, "overdue": 0, "maxLagSeconds": None}
+        )
+        for health in healths:
+            by_phase[health["phase"]] += 1
+            location = by_location[health["storageLocation"]]
+            location["repositories"] += 1
+            location["overdue"] += int(health["overdue"])
+            if health["lagSeconds"] is not None:
+                location["maxLagSeconds"] = max(location["maxLagSeconds"] or 0, health["lagSeconds"])
+
+        with self._lock:
+            intervals = [
+                entry["intervalSeconds"]
+                for history in self._history.values()
+                for entry in history
+                if entry["intervalSeconds"]
+            ]
+
+        return {
+            "repositories": len(healths),
+            "byPhase": dict(by_phase),
+            "overdue": sum(1 for h in healths if h["overdue"]),
+            "neverMaintained": sum(1 for h in healths if not h["lastMaintenanceTime"]),
+            "lastMaintenanceFailed": sum(1 for h in healths if h["lastMaintenanceResult"] == "Failed"),
+            "maxLagSeconds": lags[-1] if lags else None,
+            "meanLagSeconds": round(sum(lags) / len(lags)) if lags else None,
+            "p95LagSeconds": lags[min(int(len(lags) * 0.95), len(lags) - 1)] if lags else None,
+            "meanMaintenanceIntervalSeconds": round(sum(intervals) / len(intervals)) if intervals else None,
+            "byStorageLocation": dict(by_location),
+        }
+
+
+# Global repository monitor instance
+repository_monitor = RepositoryMonitor()
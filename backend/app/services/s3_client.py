@@ -2,48 +2,217 @@
 Velero Dashboard Backend - S3 Storage Validation Service
 
 S3 스토리지 연결 테스트 및 검증
+
+boto3 client는 (endpoint, region, credentials) 별로 pool에 보관해 재사용하므로
+반복 검증 시 세션 생성/엔드포인트 해석/TLS handshake 비용이 들지 않습니다.
 """
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, BotoCoreError
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import hashlib
 import logging
-from typing import Tuple, Optional
+import threading
+import time
+from typing import Tuple, Optional, Dict, Any, Callable, Iterator, AsyncIterator
+
+from app.config import settings
+from app.services.metrics import instrument_s3_client
 
 logger = logging.getLogger(__name__)
 
+ClientKey = Tuple[Optional[str], Optional[str], str, Optional[float]]
+"""(endpoint, region, credentials hash, call timeout)"""
+
+
+class S3ClientPool:
+    """boto3 S3 clients keyed by endpoint, region and credentials, with TTL eviction"""
+    
+    def __init__(self, ttl_seconds: int, max_clients: int, max_pool_connections: int):
+        """
+        Args:
+            ttl_seconds: Idle time after which a client is dropped
+            max_clients: Maximum number of cached clients (LRU eviction)
+            max_pool_connections: HTTP connections kept per client
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_clients = max_clients
+        self.client_config = Config(
+            max_pool_connections=max_pool_connections,
+            connect_timeout=settings.s3_connect_timeout_seconds,
+            read_timeout=settings.s3_read_timeout_seconds,
+            retries={"max_attempts": 2, "mode": "standard"}
+        )
+        # key -> (client, last used)
+        self._clients: Dict[ClientKey, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(
+        endpoint: Optional[str],
+        region: Optional[str],
+        access_key: Optional[str],
+        secret_key: Optional[str],
+        timeout: Optional[float] = None
+    ) -> ClientKey:
+        credentials = f"{access_key or ''}:{secret_key or ''}".encode()
+        return (endpoint, region, hashlib.sha256(credentials).hexdigest(), timeout)
+    
+    def _config(self, timeout: Optional[float]) -> Config:
+        """Client config; a timeout caps connect/read time and disables retries"""
+        if timeout is None:
+            return self.client_config
+        return self.client_config.merge(Config(
+            connect_timeout=min(settings.s3_connect_timeout_seconds, timeout),
+            read_timeout=min(settings.s3_read_timeout_seconds, timeout),
+            retries={"total_max_attempts": 1, "mode": "standard"}
+        ))
+    
+    def get(
+        self,
+        endpoint: Optional[str],
+        region: Optional[str] = None,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        timeout: Optional[float] = None
+    ):
+        """
+        Get a pooled client (created on first use)
+        
+        Args:
+            timeout: Upper bound of each connect/read (no retries); clients
+                     with different timeouts are pooled separately
+        """
+        key = self._key(endpoint, region, access_key, secret_key, timeout)
+        now = time.monotonic()
+        
+        with self._lock:
+            self._evict_expired(now)
+            entry = self._clients.get(key)
+            if entry is not None:
+                self._clients[key] = (entry[0], now)
+                return entry[0]
+        
+        s3_config: Dict[str, Any] = {"endpoint_url": endpoint, "config": self._config(timeout)}
+        if region:
+            s3_config["region_name"] = region
+        if access_key and secret_key:
+            s3_config["aws_access_key_id"] = access_key
+            s3_config["aws_secret_access_key"] = secret_key
+        
+        # Own session per client: boto3 sessions are not thread-safe, clients are
+        s3_client = boto3.session.Session().client("s3", **s3_config)
+        instrument_s3_client(s3_client)
+        
+        with self._lock:
+            existing = self._clients.get(key)
+            if existing is not None:
+                return existing[0]
+            if len(self._clients) >= self.max_clients:
+                oldest = min(self._clients, key=lambda k: self._clients[k][1])
+                del self._clients[oldest]
+            self._clients[key] = (s3_client, now)
+        
+        logger.info(f"Created S3 client for {endpoint} ({len(self._clients)} pooled)")
+        return s3_client
+    
+    def invalidate(
+        self,
+        endpoint: Optional[str],
+        region: Optional[str] = None,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> None:
+        """Drop a client (e.g. after a connection-level error)"""
+        with self._lock:
+            self._clients.pop(self._key(endpoint, region, access_key, secret_key, timeout), None)
+    
+    def _evict_expired(self, now: float) -> None:
+        expired = [
+            key for key, (_, last_used) in self._clients.items()
+            if now - last_used > self.ttl_seconds
+        ]
+        for key in expired:
+            del self._clients[key]
+
 
 class S3ValidationService:
     """S3 storage validation service"""
     
+    def __init__(self):
+        self.client_pool = S3ClientPool(
+            ttl_seconds=settings.s3_client_ttl_seconds,
+            max_clients=settings.s3_client_pool_size,
+            max_pool_connections=settings.s3_max_pool_connections
+        )
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.s3_max_workers,
+            thread_name_prefix="s3-client"
+        )
+    
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking S3 call on the S3 thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            functools.partial(func, *args, **kwargs)
+        )
+    
+    async def stream(self, iterator: Iterator[Any]) -> AsyncIterator[Any]:
+        """Consume a blocking iterator on the S3 thread pool, item by item"""
+        done = object()
+        while True:
+            item = await self.run(next, iterator, done)
+            if item is done:
+                break
+            yield item
+    
     @staticmethod
+    def bsl_target(bsl_cr: Dict[str, Any]) -> Dict[str, Any]:
+        """S3 connection arguments of a BackupStorageLocation CR (backend credentials)"""
+        spec = bsl_cr.get("spec", {})
+        config = spec.get("config", {})
+        object_storage = spec.get("objectStorage", {})
+        return {
+            "s3_url": config.get("s3Url"),
+            "bucket": object_storage.get("bucket", ""),
+            "region": config.get("region"),
+            "access_key": settings.s3_access_key,
+            "secret_key": settings.s3_secret_key,
+            "prefix": object_storage.get("prefix"),
+        }
+    
+    async def validate_storage_async(self, **kwargs: Any) -> Tuple[bool, str, Optional[int], Optional[str]]:
+        """validate_storage() without blocking the event loop"""
+        return await self.run(self.validate_storage, **kwargs)
+    
     def validate_storage(
+        self,
         s3_url: str,
         bucket: str,
         region: Optional[str] = None,
         access_key: Optional[str] = None,
         secret_key: Optional[str] = None,
-        prefix: Optional[str] = None
+        prefix: Optional[str] = None,
+        timeout: Optional[float] = None
     ) -> Tuple[bool, str, Optional[int], Optional[str]]:
         """
         Validate S3 storage connection
         
+        Args:
+            timeout: Per-call connect/read timeout without retries
+                     (default: the pooled client settings)
+        
         Returns:
             (success, message, object_count, latest_backup)
         """
         try:
-            # Create S3 client
-            s3_config = {
-                "endpoint_url": s3_url,
-            }
-            
-            if region:
-                s3_config["region_name"] = region
-            
-            if access_key and secret_key:
-                s3_config["aws_access_key_id"] = access_key
-                s3_config["aws_secret_access_key"] = secret_key
-            
-            s3_client = boto3.client("s3", **s3_config)
+            # Reuse pooled S3 client (keeps connections alive between calls)
+            s3_client = self.client_pool.get(s3_url, region, access_key, secret_key, timeout)
             
             # Test 1: Check if bucket exists and is accessible
             try:
@@ -104,11 +273,123 @@ class S3ValidationService:
         
         except BotoCoreError as e:
             logger.error(f"Boto3 error during S3 validation: {e}")
+            self.client_pool.invalidate(s3_url, region, access_key, secret_key, timeout)
             return False, f"Connection error: {str(e)}", None, None
         
         except Exception as e:
             logger.error(f"Unexpected error during S3 validation: {e}")
             return False, f"Validation failed: {str(e)}", None, None
+    
+    # ===== BUCKET INVENTORY =====
+    
+    @staticmethod
+    def backups_root(prefix: Optional[str]) -> str:
+        """Key prefix of Velero backup directories (<prefix>/backups/)"""
+        base = (prefix or "").strip("/")
+        return f"{base}/backups/" if base else "backups/"
+    
+    @staticmethod
+    def repository_root(prefix: Optional[str], repository_type: str) -> str:
+        """Key prefix of the kopia/restic repositories (<prefix>/<type>/)"""
+        base = (prefix or "").strip("/")
+        return f"{base}/{repository_type}/" if base else f"{repository_type}/"
+    
+    @staticmethod
+    def iter_backup_prefixes(s3_client, bucket: str, root: str) -> Iterator[str]:
+        """Backup directory prefixes under root, page by page (Delimiter "/")"""
+        paginator = s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=root, Delimiter="/"):
+            for common_prefix in page.get("CommonPrefixes", []):
+                yield common_prefix["Prefix"]
+    
+    @staticmethod
+    def iter_objects(
+        s3_client,
+        bucket: str,
+        prefix: str,
+        start_after: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """All objects under a prefix, streamed with continuation tokens"""
+        paginator = s3_client.get_paginator("list_objects_v2")
+        params: Dict[str, Any] = {"Bucket": bucket, "Prefix": prefix}
+        if start_after:
+            params["StartAfter"] = start_after
+        for page in paginator.paginate(**params):
+            yield from page.get("Contents", [])
+    
+    def summarize_prefix(self, s3_client, bucket: str, prefix: str) -> Dict[str, Any]:
+        """Object count, total bytes and newest modification of one backup"""
+        object_count = 0
+        total_bytes = 0
+        last_modified = None
+        for obj in self.iter_objects(s3_client, bucket, prefix):
+            object_count += 1
+            total_bytes += obj.get("Size", 0)
+            modified = obj.get("LastModified")
+            if modified and (last_modified is None or modified > last_modified):
+                last_modified = modified
+        
+        return {
+            "name": prefix.rstrip("/").rsplit("/", 1)[-1],
+            "prefix": prefix,
+            "objectCount": object_count,
+            "totalBytes": total_bytes,
+            "lastModified": last_modified.isoformat() if last_modified else None,
+        }
+    
+    def iter_inventory(
+        self,
+        s3_url: str,
+        bucket: str,
+        region: Optional[str] = None,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        prefix: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Inventory of Velero backups in a bucket
+        
+        Yields one {"type": "backup", ...} record per backup directory and a
+        final {"type": "summary", ...} record. Only one listing page is held
+        in memory at a time. Errors end the stream with {"type": "error"}.
+        """
+        root = self.backups_root(prefix)
+        backups = objects = total_bytes = 0
+        
+        try:
+            s3_client = self.client_pool.get(s3_url, region, access_key, secret_key)
+            for backup_prefix in self.iter_backup_prefixes(s3_client, bucket, root):
+                record = self.summarize_prefix(s3_client, bucket, backup_prefix)
+                backups += 1
+                objects += record["objectCount"]
+                total_bytes += record["totalBytes"]
+                yield {"type": "backup", **record}
+        
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            yield {"type": "error", "message": f"Failed to list objects: {error_code}"}
+            return
+        
+        except BotoCoreError as e:
+            logger.error(f"Boto3 error during inventory scan: {e}")
+            self.client_pool.invalidate(s3_url, region, access_key, secret_key)
+            yield {"type": "error", "message": f"Connection error: {str(e)}"}
+            return
+        
+        except Exception as e:
+            # The 200 response has already started: end the stream with a record
+            logger.error(f"Inventory scan of {bucket} failed: {e}")
+            yield {"type": "error", "message": f"Inventory failed: {str(e)}"}
+            return
+        
+        yield {
+            "type": "summary",
+            "bucket": bucket,
+            "prefix": root,
+            "backups": backups,
+            "objects": objects,
+            "totalBytes": total_bytes,
+        }
 
 
 # Global service instance
@@ -0,0 +1,248 @@
+"""
+Velero Dashboard Backend - Storage Usage Analyzer
+
+BSL별 사용량, 스케줄별 증가량, orphan 백업 디렉터리 분석 (백그라운드 작업)
+
+버킷 쪽은 bucket index(SQLite)를 스트리밍으로 읽고, Backup CR 이름으로 만든
+해시 테이블에 probe 합니다 (hash join). 메모리 사용량은 Backup CR 개수에만
+비례하며 버킷 object 수와 무관합니다.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Tuple
+import asyncio
+import logging
+import time
+
+from app.config import settings
+from app.services.k8s_client import async_k8s_client
+from app.services.informer import informers
+from app.services.indexes import schedule_name_index, storage_location_index
+from app.services.s3_client import s3_validation_service
+from app.services.bucket_index import bucket_index
+
+logger = logging.getLogger(__name__)
+
+NO_SCHEDULE = ""
+
+
+def _backup_day(backup_cr: Dict[str, Any]) -> str:
+    """Start date (YYYY-MM-DD) of a Backup CR"""
+    metadata = backup_cr.get("metadata", {})
+    started = backup_cr.get("status", {}).get("startTimestamp") or metadata.get("creationTimestamp") or ""
+    return started[:10]
+
+
+def analyze_bsl(
+    bsl: str,
+    backups_cr: List[Dict[str, Any]],
+    growth_days: int,
+    max_orphans: int
+) -> Dict[str, Any]:
+    """
+    Join the indexed bucket directories of a BSL against its Backup CRs
+
+    Build side: Backup CR name -> (schedule, start day).
+    Probe side: backup directories streamed from the bucket index.
+
+    Volume data written by file system backups and the data mover lives in
+    the kopia/restic repositories, not in the backup directories; it is
+    reported per repository and included in totalBytes.
+
+    Args:
+        bsl: BSL name
+        backups_cr: Backup CRs stored in this BSL
+        growth_days: Number of days in the per-schedule growth series
+        max_orphans: Maximum orphaned prefixes listed (all are counted)
+
+    Returns:
+        Usage report of the BSL
+    """
+    build: Dict[str, Tuple[str, str]] = {}
+    for backup_cr in backups_cr:
+        name = backup_cr.get("metadata", {}).get("name", "")
+        schedule = next(iter(schedule_name_index(backup_cr)), NO_SCHEDULE)
+        build[name] = (schedule, _backup_day(backup_cr))
+
+    first_day = (datetime.now(timezone.utc) - timedelta(days=growth_days - 1)).strftime("%Y-%m-%d")
+    schedules: Dict[str, Dict[str, Any]] = defaultdict(
+        lambda: {"backups": 0, "totalBytes": 0, "dailyBytes": defaultdict(int)}
+    )
+    matched = set()
+    total_bytes = objects = orphan_count = orphan_bytes = 0
+    orphans: List[Dict[str, Any]] = []
+
+    for entry in bucket_index.iter_backups(bsl):
+        total_bytes += entry["totalBytes"]
+        objects += entry["objectCount"]
+
+        hit = build.get(entry["name"])
+        if hit is None:
+            orphan_count += 1
+            orphan_bytes += entry["totalBytes"]
+            if len(orphans) < max_orphans:
+                orphans.append(entry)
+            continue
+
+        matched.add(entry["name"])
+        schedule, day = hit
+        stats = schedules[schedule]
+        stats["backups"] += 1
+        stats["totalBytes"] += entry["totalBytes"]
+        if day >= first_day:
+            stats["dailyBytes"][day] += entry["totalBytes"]
+
+    # Completed backups whose data is not in the bucket
+    missing = sorted(
+        backup_cr.get("metadata", {}).get("name", "")
+        for backup_cr in backups_cr
+        if backup_cr.get("metadata", {}).get("name", "") not in matched
+        and backup_cr.get("status", {}).get("phase") == "Completed"
+    )
+
+    repositories = bucket_index.repositories(bsl)
+    repository_bytes = sum(repository["totalBytes"] for repository in repositories)
+    repository_objects = sum(repository["objectCount"] for repository in repositories)
+
+    return {
+        "bsl": bsl,
+        "totalBytes": total_bytes + repository_bytes,
+        "objects": objects + repository_objects,
+        "backupBytes": total_bytes,
+        "repositoryBytes": repository_bytes,
+        "repositoryObjects": repository_objects,
+        "repositories": repositories,
+        "backups": len(matched),
+        "schedules": [
+            {
+                "schedule": schedule,
+                "backups": stats["backups"],
+                "totalBytes": stats["totalBytes"],
+                "dailyBytes": dict(sorted(stats["dailyBytes"].items())),
+            }
+            for schedule, stats in sorted(schedules.items())
+        ],
+        "orphanedPrefixes": orphans,
+        "orphanedCount": orphan_count,
+        "orphanedBytes": orphan_bytes,
+        "missingInBucket": missing,
+    }
+
+
+class StorageUsageAnalyzer:
+    """Periodically refreshes the bucket index and computes usage reports"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._run_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self.report: Optional[Dict[str, Any]] = None
+        # Run in progress: {startedAt, totalLocations, locations done so far}
+        self._progress: Optional[Dict[str, Any]] = None
+
+    def start(self) -> None:
+        """Start the periodic analysis (no-op when the interval is 0)"""
+        if settings.storage_usage_interval_seconds <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        for task in (self._task, self._run_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = self._run_task = None
+
+    def running(self) -> bool:
+        return self._lock.locked() or (self._run_task is not None and not self._run_task.done())
+
+    def trigger(self) -> None:
+        """Start a run in the background unless one is already running"""
+        if not self.running():
+            self._run_task = asyncio.create_task(self._run_once())
+
+    async def _run_once(self) -> None:
+        try:
+            await self.run()
+        except Exception as e:
+            logger.error(f"Storage usage analysis failed: {e}")
+
+    def progress(self) -> Dict[str, Any]:
+        """State of the current run with the BSLs analyzed so far"""
+        progress = self._progress or {}
+        return {
+            "running": self.running(),
+            "startedAt": progress.get("startedAt"),
+            "totalLocations": progress.get("totalLocations"),
+            "locations": list(progress.get("locations", [])),
+            "lastGeneratedAt": self.report["generatedAt"] if self.report else None,
+        }
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run()
+            except Exception as e:
+                logger.error(f"Storage usage analysis failed: {e}")
+            await asyncio.sleep(settings.storage_usage_interval_seconds)
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Refresh the bucket index of every BSL and rebuild the report
+
+        BSLs are processed one at a time to bound the S3 request rate; the
+        hash table holds only the Backup CR names of the BSL being joined.
+        The BSLs analyzed so far are visible through progress() meanwhile.
+        """
+        async with self._lock:
+            started = time.monotonic()
+            locations: List[Dict[str, Any]] = []
+            self._progress = {
+                "startedAt": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "totalLocations": None,
+                "locations": locations,
+            }
+            try:
+                bsls_cr = await informers.list(
+                    "backupstoragelocations",
+                    async_k8s_client.list_backup_storage_locations
+                )
+                backups_cr = await informers.list("backups", async_k8s_client.list_backups)
+
+                by_bsl: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+                for backup_cr in backups_cr:
+                    for bsl in storage_location_index(backup_cr):
+                        by_bsl[bsl].append(backup_cr)
+
+                self._progress["totalLocations"] = len(bsls_cr)
+                for bsl_cr in bsls_cr:
+                    name = bsl_cr.get("metadata", {}).get("name", "")
+                    try:
+                        await s3_validation_service.run(bucket_index.refresh_bsl, bsl_cr)
+                        locations.append(await s3_validation_service.run(
+                            analyze_bsl,
+                            name,
+                            by_bsl.get(name, []),
+                            settings.storage_usage_growth_days,
+                            settings.storage_usage_max_orphans
+                        ))
+                    except Exception as e:
+                        logger.warning(f"Storage usage of BSL {name} failed: {e}")
+                        locations.append({"bsl": name, "error": str(e)})
+
+                self.report = {
+                    "generatedAt": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "durationSeconds": round(time.monotonic() - started, 3),
+                    "locations": locations,
+                }
+                return self.report
+            finally:
+                self._progress = None
+
+
+# Global storage usage analyzer instance
+storage_usage_analyzer = StorageUsageAnalyzer()
@@ -0,0 +1,149 @@
+"""
+Velero Dashboard Backend - Dashboard Summary
+
+대시보드 KPI 증분 집계 (phase별 개수, warning/error 합계, 스케줄별 마지막 성공 백업)
+
+Informer 이벤트마다 집계를 갱신하므로 /api/summary는 목록을 다시
+조회하거나 전체 스캔하지 않습니다.
+"""
+
+from collections import Counter
+from typing import Optional, List, Dict, Any, Tuple
+import threading
+
+from app.services.indexes import schedule_name_index
+
+SUCCESS_PHASE = "Completed"
+
+
+class ResourceStats:
+    """Phase counts and warning/error totals for one resource type"""
+
+    def __init__(self):
+        self.by_phase: Counter = Counter()
+        self.warnings = 0
+        self.errors = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.by_phase.values())
+
+    def handle(self, event_type: str, obj: Dict[str, Any], old: Optional[Dict[str, Any]]) -> None:
+        """Informer event handler"""
+        if old is not None:
+            self._apply(old, -1)
+        if event_type != "DELETED":
+            self._apply(obj, 1)
+
+    def _apply(self, obj: Dict[str, Any], sign: int) -> None:
+        status = obj.get("status", {})
+        phase = status.get("phase", "New")
+        self.by_phase[phase] += sign
+        if self.by_phase[phase] <= 0:
+            del self.by_phase[phase]
+        self.warnings += sign * (status.get("warnings") or 0)
+        self.errors += sign * (status.get("errors") or 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "byPhase": dict(self.by_phase),
+            "warnings": self.warnings,
+            "errors": self.errors,
+        }
+
+
+class SummaryAggregator:
+    """Incrementally maintained dashboard KPIs"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.backups = ResourceStats()
+        self.restores = ResourceStats()
+        self._schedules_paused: Dict[str, bool] = {}
+        # schedule name -> (completionTimestamp, backup name)
+        self._last_success: Dict[str, Tuple[str, str]] = {}
+        self._backup_informer = None
+
+    def attach(self, informers) -> None:
+        """Register handlers on the backups/restores/schedules informers"""
+        self._backup_informer = informers.informer("backups")
+        self._backup_informer.add_event_handler(self._on_backup)
+        informers.informer("restores").add_event_handler(self._on_restore)
+        informers.informer("schedules").add_event_handler(self._on_schedule)
+
+    def load(self, backups: List[Dict[str, Any]], restores: List[Dict[str, Any]], schedules: List[Dict[str, Any]]) -> None:
+        """Aggregate from plain lists (used before the informers have synced)"""
+        for backup in backups:
+            self._on_backup("ADDED", backup, None)
+        for restore in restores:
+            self._on_restore("ADDED", restore, None)
+        for schedule in schedules:
+            self._on_schedule("ADDED", schedule, None)
+
+    # ===== EVENT HANDLERS =====
+
+    def _on_backup(self, event_type: str, obj: Dict[str, Any], old: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            self.backups.handle(event_type, obj, old)
+
+            name = obj.get("metadata", {}).get("name", "")
+            for schedule in schedule_name_index(obj):
+                current = self._last_success.get(schedule)
+                still_success = (
+                    event_type != "DELETED"
+                    and obj.get("status", {}).get("phase") == SUCCESS_PHASE
+                )
+                if still_success:
+                    completed = obj.get("status", {}).get("completionTimestamp") or ""
+                    if current is None or (completed, name) > current:
+                        self._last_success[schedule] = (completed, name)
+                elif current is not None and current[1] == name:
+                    self._recompute_last_success(schedule)
+
+    def _recompute_last_success(self, schedule: str) -> None:
+        """Find the newest Completed backup of a schedule via the secondary index"""
+        self._last_success.pop(schedule, None)
+        if self._backup_informer is None or not self._backup_informer.has_synced():
+            return
+        for backup in self._backup_informer.by_index(
+            {"schedule": {schedule}, "phase": {SUCCESS_PHASE}}
+        ):
+            completed = backup.get("status", {}).get("completionTimestamp") or ""
+            candidate = (completed, backup.get("metadata", {}).get("name", ""))
+            if candidate > self._last_success.get(schedule, ("", "")):
+                self._last_success[schedule] = candidate
+
+    def _on_restore(self, event_type: str, obj: Dict[str, Any], old: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            self.restores.handle(event_type, obj, old)
+
+    def _on_schedule(self, event_type: str, obj: Dict[str, Any], old: Optional[Dict[str, Any]]) -> None:
+        name = obj.get("metadata", {}).get("name", "")
+        with self._lock:
+            if event_type == "DELETED":
+                self._schedules_paused.pop(name, None)
+            else:
+                self._schedules_paused[name] = bool(obj.get("spec", {}).get("paused", False))
+
+    # ===== READ API =====
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current KPIs (without the recent items)"""
+        with self._lock:
+            return {
+                "backups": self.backups.to_dict(),
+                "restores": self.restores.to_dict(),
+                "schedulesTotal": len(self._schedules_paused),
+                "schedulesActive": sum(
+                    1 for paused in self._schedules_paused.values() if not paused
+                ),
+                "lastSuccessfulBackups": {
+                    schedule: {"name": name, "completionTimestamp": completed}
+                    for schedule, (completed, name) in self._last_success.items()
+                },
+            }
+
+
+# Global summary aggregator instance
+summary_aggregator = SummaryAggregator()
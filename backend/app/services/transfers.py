@@ -0,0 +1,390 @@
+"""
+Velero Dashboard Backend - Transfer Progress
+
+볼륨 전송 진행률 집계 (백업/복원별, 노드별 처리량과 ETA, 대기열, 정체 감지)
+
+PodVolumeBackup/PodVolumeRestore와 CSI data mover의 DataUpload/DataDownload를
+같은 방식으로 추적합니다.
+
+Informer watch 이벤트마다 볼륨별 bytesDone 변화로 처리량(이동 평균)을
+갱신하므로, 진행률 조회와 SSE는 PVB/PVR 목록을 다시 조회하지 않습니다.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Callable, Tuple, Set
+import asyncio
+import logging
+import threading
+import time
+
+from app.config import settings
+from app.services.indexes import backup_name_label_index, restore_name_label_index, node_index
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_PHASES = ("Completed", "Failed", "Canceled")
+
+# Waiting for a node (data mover, and pod volume transfers since Velero 1.17)
+QUEUED_PHASES = ("New", "Accepted", "Prepared")
+
+OwnerKey = Tuple[str, str]
+"""(kind, owner name) - kind is "backup" or "restore" """
+
+# plural -> (owner kind, owner index function)
+TRANSFER_SOURCES: Dict[str, Tuple[str, Callable[[Dict[str, Any]], List[str]]]] = {
+    "podvolumebackups": ("backup", backup_name_label_index),
+    "podvolumerestores": ("restore", restore_name_label_index),
+    "datauploads": ("backup", backup_name_label_index),
+    "datadownloads": ("restore", restore_name_label_index),
+}
+
+
+def _timestamp(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+class TransferItem:
+    """Progress of one volume transfer"""
+
+    __slots__ = (
+        "plural", "name", "owner", "node", "phase", "bytes_done", "total_bytes",
+        "queued_since", "started", "completed", "rate", "sampled_at"
+    )
+
+    def __init__(self, plural: str, obj: Dict[str, Any], now: float, owner: str = ""):
+        metadata = obj.get("metadata", {})
+        status = obj.get("status", {})
+        progress = status.get("progress") or {}
+        nodes = node_index(obj)
+
+        self.plural = plural
+        self.name = metadata.get("name", "")
+        self.owner = owner
+        self.node = nodes[0] if nodes else ""
+        self.phase = status.get("phase") or "New"
+        self.bytes_done = int(progress.get("bytesDone") or 0)
+        self.total_bytes = int(progress.get("totalBytes") or 0)
+        self.queued_since = _timestamp(
+            status.get("acceptedTimestamp") or metadata.get("creationTimestamp")
+        )
+        self.started = _timestamp(status.get("startTimestamp"))
+        self.completed = _timestamp(status.get("completionTimestamp"))
+        self.sampled_at = now  # last time bytesDone changed
+        self.rate = 0.0
+        if self.active and self.started and now > self.started:
+            # First sample: average since the transfer started
+            self.rate = self.bytes_done / (now - self.started)
+
+    @property
+    def active(self) -> bool:
+        return self.phase not in TERMINAL_PHASES
+
+    @property
+    def queued(self) -> bool:
+        return self.phase in QUEUED_PHASES
+
+    def stall_reason(self, now: float) -> Optional[str]:
+        """Why the transfer looks stuck (None while it is moving)"""
+        if not self.active:
+            return None
+        limit = settings.transfer_stall_seconds
+        if self.queued:
+            if self.queued_since is not None and now - self.queued_since > limit:
+                return f"{self.phase} for {int(now - self.queued_since)}s"
+            return None
+        if now - self.sampled_at > limit:
+            return f"no progress for {int(now - self.sampled_at)}s"
+        return None
+
+    def to_dict(self, now: float) -> Dict[str, Any]:
+        remaining = max(self.total_bytes - self.bytes_done, 0)
+        return {
+            "kind": self.plural,
+            "name": self.name,
+            "owner": self.owner,
+            "node": self.node,
+            "phase": self.phase,
+            "bytesDone": self.bytes_done,
+            "totalBytes": self.total_bytes,
+            "bytesPerSecond": round(self.rate),
+            "etaSeconds": round(remaining / self.rate) if self.active and self.rate > 0 else None,
+            "stalled": self.stall_reason(now),
+        }
+
+    def follow(self, previous: "TransferItem") -> None:
+        """Update the throughput from the previous sample of the same volume"""
+        if not self.active:
+            self.rate = 0.0
+            return
+        elapsed = self.sampled_at - previous.sampled_at
+        if self.bytes_done == previous.bytes_done or elapsed <= 0:
+            # Status changed without new progress (or a relist replay)
+            self.rate = previous.rate
+            self.sampled_at = previous.sampled_at
+            return
+        sample = max(self.bytes_done - previous.bytes_done, 0) / elapsed
+        alpha = settings.transfer_rate_smoothing
+        self.rate = alpha * sample + (1 - alpha) * previous.rate if previous.rate else sample
+
+
+def summarize(items: List[TransferItem], now: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Aggregate progress of a set of volume transfers
+
+    Returns:
+        Counts per phase, bytesDone/totalBytes, current throughput (sum of
+        the running volumes), average throughput since the first start and
+        the ETA of the remaining known bytes
+    """
+    now = now or time.time()
+    by_phase: Dict[str, int] = defaultdict(int)
+    bytes_done = total_bytes = remaining = 0
+    throughput = 0.0
+    started: Optional[float] = None
+    finished: Optional[float] = None
+
+    for item in items:
+        by_phase[item.phase] += 1
+        bytes_done += item.bytes_done
+        total_bytes += item.total_bytes
+        if item.started is not None:
+            started = item.started if started is None else min(started, item.started)
+        if item.active:
+            throughput += item.rate
+            remaining += max(item.total_bytes - item.bytes_done, 0)
+        elif item.completed is not None:
+            finished = item.completed if finished is None else max(finished, item.completed)
+
+    in_progress = sum(1 for item in items if item.active and not item.queued)
+    queued = sum(1 for item in items if item.queued)
+    end = now if in_progress or queued or finished is None else finished
+    elapsed = end - started if started is not None else 0
+
+    return {
+        "volumes": len(items),
+        "inProgress": in_progress,
+        "queued": queued,
+        "byPhase": dict(by_phase),
+        "bytesDone": bytes_done,
+        "totalBytes": total_bytes,
+        "percent": round(bytes_done * 100 / total_bytes, 1) if total_bytes else None,
+        "bytesPerSecond": round(throughput),
+        "averageBytesPerSecond": round(bytes_done / elapsed) if elapsed > 0 else None,
+        "etaSeconds": round(remaining / throughput) if throughput > 0 else None,
+    }
+
+
+def progress_report(kind: str, name: str, items: List[TransferItem]) -> Dict[str, Any]:
+    """Progress of one backup/restore with a per-node breakdown"""
+    now = time.time()
+    by_node: Dict[str, List[TransferItem]] = defaultdict(list)
+    for item in items:
+        by_node[item.node].append(item)
+
+    return {
+        "kind": kind,
+        "name": name,
+        **summarize(items, now),
+        "nodes": [
+            {"node": node, **summarize(node_items, now)}
+            for node, node_items in sorted(by_node.items())
+        ],
+    }
+
+
+def node_load(node: str, items: List[TransferItem], now: float) -> Dict[str, Any]:
+    """
+    Load of one node: progress summary, running transfers per kind, stalled
+    count and saturation (all transfer slots busy with more waiting)
+    """
+    summary = summarize(items, now)
+    running: Dict[str, int] = defaultdict(int)
+    for item in items:
+        if not item.queued:
+            running[item.plural] += 1
+    return {
+        "node": node,
+        **summary,
+        "runningByKind": dict(running),
+        "stalled": sum(1 for item in items if item.stall_reason(now)),
+        "saturated": bool(node) and (
+            summary["inProgress"] >= settings.node_agent_concurrency and summary["queued"] > 0
+        ),
+    }
+
+
+class TransferTracker:
+    """
+    Live progress of volume transfers, grouped by backup/restore
+
+    Items are kept per owner so a progress query only touches the volumes of
+    that backup/restore. Waiters (SSE streams) are woken on every change of
+    the owner they follow.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items: Dict[OwnerKey, Dict[Tuple[str, str], TransferItem]] = defaultdict(dict)
+        # node -> running/queued transfers (node "" = not accepted by a node yet)
+        self._active: Dict[str, Dict[Tuple[str, str], TransferItem]] = defaultdict(dict)
+        self._waiters: Dict[OwnerKey, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = defaultdict(set)
+        self._informers: List[Any] = []
+
+    # ===== LIFECYCLE =====
+
+    def attach(self, informers) -> None:
+        """Follow the transfer CRs through their informers (watch events)"""
+        for plural, (kind, owner_func) in TRANSFER_SOURCES.items():
+            informer = informers.informer(plural)
+            informer.add_event_handler(self._make_handler(plural, kind, owner_func))
+            self._informers.append(informer)
+
+    def start(self) -> None:
+        # Progress needs the watch even when reads bypass the cache
+        for informer in self._informers:
+            informer.start()
+
+    def synced(self) -> bool:
+        return bool(self._informers) and all(i.has_synced() for i in self._informers)
+
+    # ===== WATCH EVENTS =====
+
+    def _make_handler(self, plural: str, kind: str, owner_func: Callable[[Dict[str, Any]], List[str]]):
+        def handler(event_type: str, obj: Dict[str, Any], old: Optional[Dict[str, Any]]) -> None:
+            owners = owner_func(obj)
+            if not owners:
+                return
+            self._apply((kind, owners[0]), plural, event_type, obj)
+        return handler
+
+    def _apply(self, owner: OwnerKey, plural: str, event_type: str, obj: Dict[str, Any]) -> None:
+        key = (plural, obj.get("metadata", {}).get("name", ""))
+        with self._lock:
+            items = self._items[owner]
+            previous = items.get(key)
+            if previous is not None and previous.active:
+                self._unindex_active(key, previous)
+            if event_type == "DELETED":
+                items.pop(key, None)
+                if not items:
+                    del self._items[owner]
+            else:
+                item = TransferItem(plural, obj, time.time(), owner[1])
+                if previous is not None:
+                    item.follow(previous)
+                items[key] = item
+                if item.active:
+                    self._active[item.node][key] = item
+            waiters = list(self._waiters.get(owner, ()))
+
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # Event loop already closed
+
+    def _unindex_active(self, key: Tuple[str, str], item: TransferItem) -> None:
+        active = self._active.get(item.node)
+        if active is not None:
+            active.pop(key, None)
+            if not active:
+                del self._active[item.node]
+
+    # ===== READ API =====
+
+    def items(self, kind: str, name: str) -> List[TransferItem]:
+        with self._lock:
+            return list(self._items.get((kind, name), {}).values())
+
+    def progress(self, kind: str, name: str) -> Dict[str, Any]:
+        """Aggregated progress of one backup/restore"""
+        return progress_report(kind, name, self.items(kind, name))
+
+    def active(self) -> List[Dict[str, Any]]:
+        """Progress of every backup/restore with running transfers"""
+        with self._lock:
+            owners = [
+                (owner, list(items.values()))
+                for owner, items in self._items.items()
+                if any(item.active for item in items.values())
+            ]
+        return [progress_report(kind, name, items) for (kind, name), items in sorted(owners)]
+
+    def transfers(self, plurals: Optional[Set[str]] = None) -> List[TransferItem]:
+        """All tracked transfers (optionally of some plurals)"""
+        with self._lock:
+            return [
+                item
+                for items in self._items.values()
+                for item in items.values()
+                if plurals is None or item.plural in plurals
+            ]
+
+    def lookup(self, plural: str, objects: List[Dict[str, Any]]) -> Dict[str, TransferItem]:
+        """Tracked items of the given transfer CRs by name, in O(objects)"""
+        kind, owner_func = TRANSFER_SOURCES[plural]
+        found: Dict[str, TransferItem] = {}
+        with self._lock:
+            for obj in objects:
+                owners = owner_func(obj)
+                name = obj.get("metadata", {}).get("name", "")
+                item = self._items.get((kind, owners[0]), {}).get((plural, name)) if owners else None
+                if item is not None:
+                    found[name] = item
+        return found
+
+    def active_by_node(self, plurals: Optional[Set[str]] = None) -> Dict[str, List[TransferItem]]:
+        """Running and queued transfers per node, from the active index (O(active))"""
+        with self._lock:
+            by_node = {
+                node: [i for i in items.values() if plurals is None or i.plural in plurals]
+                for node, items in self._active.items()
+            }
+        return {node: items for node, items in by_node.items() if items}
+
+    def node_queues(self, plurals: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Running and queued transfers per node
+
+        Transfers not yet accepted by a node are reported under node "".
+        """
+        now = time.time()
+        return [
+            node_load(node, items, now)
+            for node, items in sorted(self.active_by_node(plurals).items())
+        ]
+
+    def stalled(self, plurals: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+        """Transfers queued or without progress for longer than TRANSFER_STALL_SECONDS"""
+        now = time.time()
+        return [
+            item.to_dict(now)
+            for items in self.active_by_node(plurals).values()
+            for item in items
+            if item.stall_reason(now)
+        ]
+
+    # ===== CHANGE NOTIFICATION =====
+
+    def watch(self, kind: str, name: str) -> asyncio.Event:
+        """Event set on every change of a backup/restore's transfers (call unwatch when done)"""
+        event = asyncio.Event()
+        with self._lock:
+            self._waiters[(kind, name)].add((asyncio.get_running_loop(), event))
+        return event
+
+    def unwatch(self, kind: str, name: str, event: asyncio.Event) -> None:
+        with self._lock:
+            waiters = self._waiters.get((kind, name))
+            if waiters is None:
+                return
+            waiters.difference_update({w for w in waiters if w[1] is event})
+            if not waiters:
+                del self._waiters[(kind, name)]
+
+
+# Global transfer tracker instance
+transfer_tracker = TransferTracker()
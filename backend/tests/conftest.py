@@ -0,0 +1,34 @@
+"""
+Test configuration
+
+The app is imported against an unreachable fake cluster with the informer
+cache and background workers disabled, so tests never need a real API server.
+"""
+
+import os
+import tempfile
+
+KUBECONFIG = """\
+apiVersion: v1
+kind: Config
+clusters:
+- cluster: {server: "http://127.0.0.1:1"}
+  name: fake
+contexts:
+- context: {cluster: fake, user: fake}
+  name: fake
+current-context: fake
+users:
+- name: fake
+  user: {token: test}
+"""
+
+_workdir = tempfile.mkdtemp(prefix="velero-dashboard-tests-")
+_kubeconfig = os.path.join(_workdir, "kubeconfig")
+with open(_kubeconfig, "w") as f:
+    f.write(KUBECONFIG)
+
+os.environ["KUBECONFIG_PATH"] = _kubeconfig
+os.environ["DATA_DIR"] = os.path.join(_workdir, "data")
+os.environ["INFORMER_ENABLED"] = "false"
+os.environ["STORAGE_USAGE_INTERVAL_SECONDS"] = "0"
@@ -0,0 +1,66 @@
+"""
+Load test of AsyncKubernetesClient
+
+Concurrent list requests against a slow fake API server must overlap on the
+client thread pool instead of queueing behind the event loop.
+"""
+
+import asyncio
+import time
+from unittest import mock
+
+import httpx
+
+from app.config import settings
+from app.main import app
+from app.services.k8s_client import KubernetesClient
+
+API_LATENCY = 0.5
+REQUESTS = 8
+
+
+def slow_list_backups(self):
+    time.sleep(API_LATENCY)  # blocking, like the real kubernetes client
+    return [{
+        "metadata": {"name": "nightly-1"},
+        "spec": {},
+        "status": {"phase": "Completed", "startTimestamp": "2026-01-01T00:00:00Z"},
+    }]
+
+
+async def fire(count: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(client.get("/api/backups") for _ in range(count)))
+        elapsed = time.perf_counter() - start
+    assert all(r.status_code == 200 for r in responses)
+    assert all(r.json()[0]["name"] == "nightly-1" for r in responses)
+    return elapsed
+
+
+def test_concurrent_lists_overlap():
+    assert not settings.informer_enabled
+    assert REQUESTS <= settings.k8s_client_max_workers
+
+    with mock.patch.object(KubernetesClient, "list_backups", slow_list_backups):
+        elapsed = asyncio.run(fire(REQUESTS))
+
+    # Serialized calls would take REQUESTS * API_LATENCY (4s)
+    assert elapsed < 3 * API_LATENCY
+
+
+def test_event_loop_stays_responsive():
+    async def scenario() -> float:
+        requests = asyncio.ensure_future(fire(REQUESTS))
+        await asyncio.sleep(0.05)
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lag = time.perf_counter() - start
+        await requests
+        return lag
+
+    with mock.patch.object(KubernetesClient, "list_backups", slow_list_backups):
+        lag = asyncio.run(scenario())
+
+    assert lag < API_LATENCY / 2
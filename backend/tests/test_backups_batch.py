@@ -0,0 +1,60 @@
+"""Batch backup deletion: selectors must narrow the targets"""
+
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.k8s_client import KubernetesClient
+from app.services.operations import deletion_queue
+
+BACKUPS = [
+    {
+        "metadata": {"name": name, "labels": {"velero.io/schedule-name": "nightly"}},
+        "spec": {"storageLocation": "default"},
+        "status": {"phase": phase, "startTimestamp": started},
+    }
+    for name, phase, started in (
+        ("nightly-1", "Completed", "2026-01-01T00:00:00Z"),
+        ("nightly-2", "Failed", "2026-01-02T00:00:00Z"),
+        ("nightly-3", "Failed", "2026-01-03T00:00:00Z"),
+    )
+]
+
+
+@pytest.fixture
+def client():
+    with mock.patch.object(KubernetesClient, "list_backups", lambda self: BACKUPS), \
+            mock.patch.object(deletion_queue, "submit") as submit:
+        yield TestClient(app)
+        submit.assert_not_called()
+
+
+@pytest.mark.parametrize("body", [
+    {},
+    {"selector": {}},
+    {"selector": {"phase": None, "schedule": None, "namePrefix": None}},
+    {"selector": {"phase": [], "namePrefix": ""}},
+    {"names": ["nightly-1"], "selector": {}},
+])
+def test_empty_selector_is_rejected(client, body):
+    assert client.post("/api/backups/batch-delete", json=body).status_code == 400
+
+
+def test_selector_dry_run(client):
+    response = client.post("/api/backups/batch-delete", json={
+        "names": ["nightly-1"],
+        "selector": {"phase": ["Failed"], "until": "2026-01-03T00:00:00Z"},
+        "dryRun": True,
+    })
+    assert response.status_code == 202
+    assert [i["name"] for i in response.json()["items"]] == ["nightly-1", "nightly-2"]
+
+
+def test_name_prefix_alone_is_a_selector(client):
+    response = client.post("/api/backups/batch-delete", json={
+        "selector": {"namePrefix": "nightly-3"},
+        "dryRun": True,
+    })
+    assert [i["name"] for i in response.json()["items"]] == ["nightly-3"]
@@ -0,0 +1,137 @@
+"""Cron engine (Velero/robfig syntax) and schedule staggering"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services.cron import CronSchedule, CronError, stagger
+
+UTC = timezone.utc
+
+
+def at(*args) -> datetime:
+    return datetime(*args, tzinfo=UTC)
+
+
+def next_runs(expression: str, after: datetime, count: int):
+    schedule = CronSchedule.parse(expression)
+    runs = []
+    for _ in range(count):
+        after = schedule.next(after)
+        runs.append(after)
+    return runs
+
+
+@pytest.mark.parametrize("expression, after, expected", [
+    ("0 2 * * *", at(2026, 1, 1, 1, 59), at(2026, 1, 1, 2, 0)),
+    ("0 2 * * *", at(2026, 1, 1, 2, 0), at(2026, 1, 2, 2, 0)),  # strictly after
+    ("*/15 * * * *", at(2026, 1, 1, 0, 7, 30), at(2026, 1, 1, 0, 15)),
+    ("5/20 * * * *", at(2026, 1, 1, 0, 26), at(2026, 1, 1, 0, 45)),
+    ("0 0 * * mon-fri", at(2026, 1, 2, 12, 0), at(2026, 1, 5, 0, 0)),  # Fri -> Mon
+    ("0 0 1 jan,jul *", at(2026, 2, 1), at(2026, 7, 1)),
+    ("0 0 31 * *", at(2026, 2, 1), at(2026, 3, 31)),
+    ("0 0 29 2 *", at(2026, 3, 1), at(2028, 2, 29)),
+    ("@daily", at(2026, 1, 1, 12), at(2026, 1, 2)),
+    ("@weekly", at(2026, 1, 1), at(2026, 1, 4)),  # Sunday
+    ("@hourly", at(2026, 1, 1, 0, 30), at(2026, 1, 1, 1)),
+    ("CRON_TZ=Asia/Seoul 0 2 * * *", at(2026, 1, 1, 0, 0), at(2026, 1, 1, 17, 0)),
+    ("TZ=Asia/Seoul 0 2 * * *", at(2026, 1, 1, 18, 0), at(2026, 1, 2, 17, 0)),
+])
+def test_next(expression, after, expected):
+    assert CronSchedule.parse(expression).next(after) == expected
+
+
+def test_day_fields_are_ored_when_both_restricted():
+    # 13th of the month OR any Friday
+    runs = next_runs("0 0 13 * 5", at(2026, 3, 1), 4)
+    assert runs == [at(2026, 3, 6), at(2026, 3, 13), at(2026, 3, 20), at(2026, 3, 27)]
+
+
+def test_day_step_restricts_like_robfig():
+    # */2 is not a star: every odd day OR every Monday
+    runs = next_runs("0 0 */2 * 1", at(2026, 6, 1), 5)
+    assert runs == [at(2026, 6, 3), at(2026, 6, 5), at(2026, 6, 7), at(2026, 6, 8), at(2026, 6, 9)]
+    # *, ? and */1 stay unrestricted: only Mondays
+    for day in ("*", "?", "*/1"):
+        assert next_runs(f"0 0 {day} * 1", at(2026, 6, 2), 2) == [at(2026, 6, 8), at(2026, 6, 15)]
+
+
+def test_day_fields_are_anded_with_a_star():
+    runs = next_runs("0 0 */10 * *", at(2026, 1, 1), 3)
+    assert runs == [at(2026, 1, 11), at(2026, 1, 21), at(2026, 1, 31)]
+
+
+def test_every():
+    schedule = CronSchedule.parse("@every 1h30m")
+    assert schedule.next(at(2026, 1, 1, 0, 0, 0)) == at(2026, 1, 1, 1, 30)
+
+
+def test_dst_gap_and_overlap():
+    # 2026-03-08 02:30 does not exist in New York: runs at 03:30 EDT like Go
+    spring = CronSchedule.parse("CRON_TZ=America/New_York 30 2 * * *")
+    assert spring.next(at(2026, 3, 8, 5)) == at(2026, 3, 8, 7, 30)
+    assert spring.next(at(2026, 3, 8, 7, 30)) == at(2026, 3, 9, 6, 30)
+    # 2026-11-01 01:30 happens twice: runs once, at the first one (EDT)
+    fall = CronSchedule.parse("CRON_TZ=America/New_York 30 1 * * *")
+    first = fall.next(at(2026, 11, 1, 4))
+    assert first == at(2026, 11, 1, 5, 30)
+    assert fall.next(first) == at(2026, 11, 2, 6, 30)
+
+
+def test_never_matching_expression():
+    assert CronSchedule.parse("0 0 30 2 *").next(at(2026, 1, 1)) is None
+
+
+def test_runs_in_range():
+    runs = list(CronSchedule.parse("0 */6 * * *").runs(at(2026, 1, 1), at(2026, 1, 2)))
+    assert runs == [at(2026, 1, 1, h) for h in (6, 12, 18)] + [at(2026, 1, 2)]
+
+
+def test_many_next_calls_are_fast():
+    schedule = CronSchedule.parse("*/5 9-17 * * 1-5")
+    t = at(2026, 1, 1)
+    start = datetime.now()
+    for _ in range(10000):
+        t = schedule.next(t)
+    assert datetime.now() - start < timedelta(seconds=2)
+
+
+@pytest.mark.parametrize("expression", [
+    "", "0 2 * *", "60 * * * *", "0 24 * * *", "0 0 0 * *", "0 0 * 13 *",
+    "*/0 * * * *", "5-1 * * * *", "x * * * *", "@every", "@every 0s",
+    "CRON_TZ=Nowhere/City 0 2 * * *",
+])
+def test_invalid_expressions(expression):
+    with pytest.raises(CronError):
+        CronSchedule.parse(expression)
+
+
+def test_stagger_spreads_identical_schedules():
+    changes, skipped = stagger({"a": "0 2 * * *", "b": "0 2 * * *", "c": "5 2 * * *"}, 30)
+    assert changes == {"b": "10 2 * * *", "c": "20 2 * * *"}
+    assert skipped == {}
+
+
+def test_stagger_keeps_window_inside_the_hour():
+    changes, _ = stagger({"a": "58 3 * * *", "b": "59 3 * * *"}, 60)
+    assert changes == {"a": "0 3 * * *", "b": "30 3 * * *"}
+
+
+def test_stagger_leaves_schedules_on_different_days():
+    changes, _ = stagger({"mon": "0 2 * * 1", "wed": "0 2 * * 3", "jan": "0 2 1 1 *", "feb": "0 2 1 2 *"}, 30)
+    assert changes == {}
+
+
+def test_stagger_groups_by_time_zone_and_expands_descriptors():
+    changes, _ = stagger({
+        "a": "@daily",
+        "b": "0 0 * * *",
+        "seoul": "CRON_TZ=Asia/Seoul 0 0 * * *",
+    }, 60)
+    assert changes == {"b": "30 0 * * *"}
+
+
+def test_stagger_skips_unsupported_expressions():
+    changes, skipped = stagger({"every": "@every 1h", "step": "*/5 * * * *", "bad": "nope"}, 30)
+    assert changes == {}
+    assert set(skipped) == {"every", "step", "bad"}
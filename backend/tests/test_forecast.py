@@ -0,0 +1,42 @@
+"""Schedule forecast: runs in the horizon and collisions"""
+
+from datetime import datetime, timezone
+
+from app.services.forecast import ScheduleForecaster, MAX_CACHED_RUNS
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def schedule(name: str, expression: str) -> dict:
+    return {
+        "metadata": {"name": name, "resourceVersion": "1", "creationTimestamp": "2025-12-31T23:59:30Z"},
+        "spec": {"schedule": expression},
+        "status": {},
+    }
+
+
+def forecast(schedules, hours=24):
+    return ScheduleForecaster().forecast(
+        schedules, hours=hours, slot_minutes=60, runs=3, duration="p50", threshold=2, now=NOW
+    )
+
+
+def test_identical_schedules_collide():
+    result = forecast([schedule("a", "0 2 * * *"), schedule("b", "0 2 * * *"), schedule("c", "0 9 * * *")])
+    assert [r["runsInHorizon"] for r in result["schedules"]] == [1, 1, 1]
+    assert result["peak"]["concurrency"] == 2
+    assert [c["schedules"] for c in result["collisions"]] == [["a", "b"]]
+    assert result["truncatedSchedules"] == []
+
+
+def test_runs_beyond_the_cache_bound_are_flagged():
+    result = forecast([schedule("often", "@every 1m"), schedule("daily", "0 2 * * *")], hours=168)
+    often, daily = sorted(result["schedules"], key=lambda r: r["name"] != "often")
+    assert often["runsTruncated"] and often["runsInHorizon"] == MAX_CACHED_RUNS
+    assert not daily["runsTruncated"]
+    assert result["truncatedSchedules"] == ["often"]
+
+
+def test_bound_reached_exactly_at_the_horizon_is_not_truncated():
+    result = forecast([schedule("often", "@every 1m")], hours=MAX_CACHED_RUNS / 60)
+    assert result["truncatedSchedules"] == []
@@ -0,0 +1,68 @@
+"""Backup/restore history: completion range filters and shutdown"""
+
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.api.history as history_api
+from app.main import app
+from app.services.history import HistoryStore, HistoryRecorder, history_row
+
+
+def backup(name: str, completed: str) -> dict:
+    return {
+        "metadata": {"name": name, "uid": f"uid-{name}"},
+        "spec": {},
+        "status": {"phase": "Completed", "startTimestamp": "2026-01-01T00:00:00Z", "completionTimestamp": completed},
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.db"))
+    store.record([
+        history_row("backup", backup("b0900", "2026-01-01T09:00:00Z")),
+        history_row("backup", backup("b1000", "2026-01-01T10:00:00Z")),
+        history_row("backup", backup("b1001", "2026-01-01T10:00:01Z")),
+        history_row("backup", backup("b1100", "2026-01-01T11:00:00Z")),
+    ])
+    return store
+
+
+@pytest.fixture
+def client(store):
+    with mock.patch.object(history_api, "history_store", store):
+        yield TestClient(app)
+
+
+@pytest.mark.parametrize("params, expected", [
+    ({"since": "2026-01-01T10:00:00Z"}, ["b1100", "b1001", "b1000"]),
+    ({"since": "2026-01-01T19:00:00+09:00"}, ["b1100", "b1001", "b1000"]),
+    ({"until": "2026-01-01T19:00:00+09:00"}, ["b0900"]),
+    ({"since": "2026-01-01T10:00:00.500Z"}, ["b1100", "b1001"]),
+    ({"until": "2026-01-01T10:00:00.500Z"}, ["b1000", "b0900"]),
+    ({"since": "2026-01-01T10:00:00", "until": "2026-01-01T11:00:00Z"}, ["b1001", "b1000"]),
+])
+def test_completion_range(client, params, expected):
+    response = client.get("/api/history/backups", params=params)
+    assert response.status_code == 200
+    assert [run["name"] for run in response.json()] == expected
+
+
+@pytest.mark.parametrize("params", [{"since": "yesterday"}, {"until": "2026-13-01T00:00:00Z"}])
+def test_invalid_range_is_rejected(client, params):
+    assert client.get("/api/history/restores", params=params).status_code == 400
+
+
+def test_stop_writes_queued_rows(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.db"))
+    recorder = HistoryRecorder(store)
+    recorder._informers = [mock.Mock()]
+    handler = recorder._make_handler("backup")
+    recorder.start()
+    for i in range(2000):
+        handler("ADDED", backup(f"b{i}", "2026-01-01T10:00:00Z"), None)
+    recorder.stop()
+    assert store.stats()["backup"]["runs"] == 2000
+    assert recorder._thread is None
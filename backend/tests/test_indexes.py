@@ -0,0 +1,137 @@
+"""Sorted index pagination and continue tokens"""
+
+import base64
+import json
+
+import pytest
+
+from app.services.indexes import (
+    SortedIndex, start_timestamp_key, name_key, paginate, encode_cursor, decode_cursor
+)
+
+
+def backup(name: str, started: str, phase: str = "Completed") -> dict:
+    return {"metadata": {"name": name}, "status": {"phase": phase, "startTimestamp": started}}
+
+
+@pytest.fixture
+def store():
+    return {
+        b["metadata"]["name"]: b
+        for b in (
+            backup("a", "2026-01-01T00:00:00Z"),
+            backup("b", "2026-01-02T00:00:00Z", "Failed"),
+            backup("c", "2026-01-03T00:00:00Z"),
+            backup("d", "2026-01-03T00:00:00Z"),  # same key as c: name breaks the tie
+            backup("e", "2026-01-05T00:00:00Z", "Failed"),
+        )
+    }
+
+
+@pytest.fixture
+def index(store):
+    index = SortedIndex(start_timestamp_key)
+    index.rebuild(store)
+    return index
+
+
+def names(objects):
+    return [o["metadata"]["name"] for o in objects]
+
+
+def collect_pages(index, store, limit, **kwargs):
+    pages = []
+    after = None
+    while True:
+        items, after = paginate(index, store.get, match_all, limit=limit, after=after, **kwargs)
+        pages.append(names(items))
+        if after is None:
+            return pages
+
+
+def match_all(_):
+    return True
+
+
+def test_without_limit_returns_everything(index, store):
+    items, last = paginate(index, store.get, match_all)
+    assert names(items) == ["a", "b", "c", "d", "e"]
+    assert last is None
+
+
+def test_zero_limit_returns_nothing(index, store):
+    assert paginate(index, store.get, match_all, limit=0) == ([], None)
+
+
+def test_pages_cover_every_object_once(index, store):
+    assert collect_pages(index, store, 2) == [["a", "b"], ["c", "d"], ["e"]]
+    assert collect_pages(index, store, 2, reverse=True) == [["e", "d"], ["c", "b"], ["a"]]
+
+
+def test_full_last_page_has_no_cursor(index, store):
+    assert collect_pages(index, store, 5) == [["a", "b", "c", "d", "e"]]
+    assert collect_pages(index, store, 1, lower="2026-01-05T00:00:00Z") == [["e"]]
+
+
+def test_predicate_filters_within_page(index, store):
+    failed = lambda o: o["status"]["phase"] == "Failed"
+    items, last = paginate(index, store.get, failed, limit=1)
+    assert names(items) == ["b"]
+    items, last = paginate(index, store.get, failed, limit=1, after=last)
+    assert names(items) == ["e"]
+    assert last is None  # only non-matching entries would follow
+
+
+def test_range_bounds(index, store):
+    items, _ = paginate(
+        index, store.get, match_all,
+        lower="2026-01-02T00:00:00Z", upper="2026-01-05T00:00:00Z"
+    )
+    assert names(items) == ["b", "c", "d"]
+
+
+def test_updates_move_and_remove_entries(index, store):
+    store["a"] = backup("a", "2026-01-09T00:00:00Z")
+    index.update("a", store["a"])
+    index.update("c", None)
+    items, _ = paginate(index, store.get, match_all)
+    assert names(items) == ["b", "d", "e", "a"]
+
+
+def test_cursor_resumes_after_deleted_entry(index, store):
+    _, last = paginate(index, store.get, match_all, limit=3)
+    assert last == ("2026-01-03T00:00:00Z", "c")
+    index.update("c", None)
+    items, _ = paginate(index, store.get, match_all, after=last)
+    assert names(items) == ["d", "e"]
+
+
+def test_name_prefix_bounds():
+    store = {n: backup(n, "") for n in ("app-1", "app-2", "apq", "db-1")}
+    index = SortedIndex(name_key)
+    index.rebuild(store)
+    items, _ = paginate(index, store.get, match_all, lower="app", upper="app\U0010ffff")
+    assert names(items) == ["app-1", "app-2"]
+
+
+def test_cursor_round_trip():
+    entry = ("2026-01-03T00:00:00Z", "c")
+    token = encode_cursor("-startTimestamp", entry)
+    assert "=" not in token
+    assert decode_cursor(token, "-startTimestamp") == entry
+
+
+def test_cursor_rejects_other_sort_and_garbage():
+    token = encode_cursor("name", ("c", "c"))
+    with pytest.raises(ValueError, match="different sort"):
+        decode_cursor(token, "-name")
+    with pytest.raises(ValueError, match="Invalid continue token"):
+        decode_cursor("not-a-token", "name")
+
+
+@pytest.mark.parametrize("after", [[1, "c"], [None, "c"], [["x"], "c"], ["c", 2]])
+def test_cursor_rejects_keys_of_another_type(after):
+    raw = json.dumps({"sort": "name", "after": after}).encode()
+    token = base64.urlsafe_b64encode(raw).decode().rstrip("=")
+    with pytest.raises(ValueError, match="Invalid continue token"):
+        decode_cursor(token, "name")
@@ -0,0 +1,84 @@
+"""Informer store indexes: secondary index selectors and sorted queries"""
+
+import pytest
+
+from app.services.indexes import INDEXERS, start_timestamp_key
+from app.services.informer import Informer
+
+
+def backup(name: str, phase: str, started: str, location: str = "default") -> dict:
+    return {
+        "metadata": {"name": name},
+        "spec": {"storageLocation": location},
+        "status": {"phase": phase, "startTimestamp": started},
+    }
+
+
+@pytest.fixture
+def informer():
+    informer = Informer("backups", lambda **kwargs: None)
+    for name, index_func in INDEXERS["backups"].items():
+        informer.add_indexer(name, index_func)
+    informer.add_sorted_index("startTimestamp", start_timestamp_key)
+    for i in range(20):
+        phase = "Failed" if i % 4 == 0 else "Completed"
+        location = "secondary" if i % 5 == 0 else "default"
+        informer._apply_event("ADDED", backup(f"b{i:02d}", phase, f"2026-01-{i + 1:02d}T00:00:00Z", location))
+    return informer
+
+
+def names(objects):
+    return [o["metadata"]["name"] for o in objects]
+
+
+def test_empty_selector_is_refused(informer):
+    with pytest.raises(ValueError):
+        informer.by_index({})
+
+
+def test_selector_intersects_indexes(informer):
+    matched = informer.by_index({"phase": {"Failed"}, "storageLocation": {"secondary"}})
+    assert sorted(names(matched)) == ["b00"]
+    assert informer.by_index({"phase": {"Missing"}}) == []
+
+
+def expected(informer, selector, reverse):
+    objects = [
+        o for o in informer.list()
+        if all(
+            values.intersection(informer.indexers()[name](o)) for name, values in selector.items()
+        )
+    ]
+    return sorted(names(objects), key=lambda n: (informer.get(n)["status"]["startTimestamp"], n), reverse=reverse)
+
+
+@pytest.mark.parametrize("selector", [
+    {"phase": {"Completed"}},  # broad: scans the main index
+    {"phase": {"Failed"}},
+    {"phase": {"Failed"}, "storageLocation": {"secondary"}},  # narrow: sorts the matches
+    {"phase": {"Completed", "Failed"}},
+    {"storageLocation": {"secondary"}},
+])
+@pytest.mark.parametrize("limit", [None, 1, 3, 50])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_query_pages_match_brute_force(informer, selector, limit, reverse):
+    collected = []
+    after = None
+    while True:
+        page, after = informer.query("startTimestamp", lambda o: True, selector, limit=limit, after=after, reverse=reverse)
+        assert limit is None or len(page) <= limit
+        collected.extend(names(page))
+        if after is None:
+            break
+    assert collected == expected(informer, selector, reverse)
+
+
+def test_query_without_matches(informer):
+    assert informer.query("startTimestamp", lambda o: True, {"phase": {"Missing"}}, limit=5) == ([], None)
+
+
+def test_query_follows_index_updates(informer):
+    informer._apply_event("MODIFIED", backup("b01", "Failed", "2026-01-02T00:00:00Z"))
+    informer._apply_event("DELETED", backup("b04", "Failed", "2026-01-05T00:00:00Z"))
+    page, _ = informer.query("startTimestamp", lambda o: True, {"phase": {"Failed"}}, limit=3)
+    assert names(page) == ["b00", "b01", "b08"]
@@ -0,0 +1,41 @@
+"""Log streaming: a client disconnect mid-read closes the download cleanly"""
+
+import asyncio
+import threading
+
+from app.services.k8s_client import k8s_client
+from app.services.log_fetcher import LogFetcher
+
+
+def test_disconnect_during_pending_read_closes_after_it_returns():
+    fetcher = LogFetcher(k8s_client)
+    reading = threading.Event()
+    release = threading.Event()
+    closed = []
+
+    def chunks():
+        try:
+            yield b"first"
+            reading.set()
+            release.wait(5)
+            yield b"second"
+        finally:
+            closed.append(True)
+
+    async def main():
+        stream = fetcher.stream(chunks())
+        assert await stream.__anext__() == b"first"
+        task = asyncio.ensure_future(stream.__anext__())
+        await asyncio.get_running_loop().run_in_executor(None, reading.wait, 5)
+        task.cancel()
+        await asyncio.sleep(0.05)
+        release.set()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        await stream.aclose()
+
+    asyncio.run(main())
+    fetcher.executor.shutdown()
+    assert closed == [True]
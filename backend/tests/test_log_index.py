@@ -0,0 +1,111 @@
+"""Log search index: only complete runs are searchable, stale runs are evicted"""
+
+import time
+
+import pytest
+
+from app.services.log_index import LogIndex, parse_logrus_line, BATCH_SIZE
+
+
+def log_lines(count: int, msg: str = "Backing up item"):
+    for i in range(count):
+        yield f'time="2026-01-01T00:00:00Z" level=info msg="{msg} {i}" resource=pods namespace=app name=web-{i}'.encode()
+
+
+@pytest.fixture
+def index(tmp_path):
+    return LogIndex(str(tmp_path / "log_index.db"))
+
+
+def test_parse_logrus_line():
+    record = parse_logrus_line('time="t" level=error msg="Error backing up" resource=pods error="a \\"b\\""')
+    assert record["level"] == "error"
+    assert record["msg"] == "Error backing up"
+    assert record["error"] == 'a "b"'
+    assert parse_logrus_line("plain stderr")["msg"] == "plain stderr"
+
+
+def test_search_complete_run(index):
+    assert index.ingest("BackupLog", "b1", "Completed", "2026-01-01T00:00:00Z", log_lines(3)) == 3
+    records, cursor = index.search(q="Backing", limit=2)
+    assert [r["item"] for r in records] == ["web-2", "web-1"]
+    records, cursor = index.search(q="Backing", limit=2, before=cursor)
+    assert [r["item"] for r in records] == ["web-0"]
+    assert cursor is None
+
+
+def test_run_being_ingested_is_not_searchable(index):
+    seen = []
+
+    def lines():
+        for i, line in enumerate(log_lines(BATCH_SIZE + 10)):
+            if i == BATCH_SIZE + 5:  # first batch already written
+                seen.append(index.search(name="b1", limit=5000)[0])
+            yield line
+
+    index.ingest("BackupLog", "b1", "Completed", None, lines())
+    assert seen == [[]]
+    assert len(index.search(name="b1", limit=5000)[0]) == BATCH_SIZE + 10
+
+
+def test_failed_ingestion_is_removed(index):
+    def lines():
+        yield from log_lines(BATCH_SIZE + 1)
+        raise ConnectionError("stream reset")
+
+    with pytest.raises(ConnectionError):
+        index.ingest("BackupLog", "b1", "Completed", None, lines())
+    assert not index.has_run("BackupLog", "b1")
+    assert index._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0] == 0
+
+
+def test_incomplete_runs_of_previous_process_are_dropped(tmp_path):
+    path = str(tmp_path / "log_index.db")
+    index = LogIndex(path)
+    index._conn.execute(
+        "INSERT INTO runs (kind, name, completed_at, ingested_at) VALUES ('BackupLog', 'b1', NULL, ?)",
+        (time.time(),)
+    )
+    index._conn.commit()
+    assert LogIndex(path)._conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 0
+
+
+def test_evict_by_age(index):
+    index.ingest("BackupLog", "old", "Completed", "2000-01-01T00:00:00Z", log_lines(1))
+    index.ingest("BackupLog", "unknown-old", "Failed", None, log_lines(1))
+    index.ingest("BackupLog", "unknown-new", "Failed", None, log_lines(1))
+    index.ingest("BackupLog", "new", "Completed", "2999-01-01T00:00:00Z", log_lines(1))
+    index._conn.execute("UPDATE runs SET ingested_at = 0 WHERE name = 'unknown-old'")
+    index._conn.commit()
+
+    assert index.evict(max_age_days=30, max_bytes=1 << 30) == 2
+    assert sorted(r["name"] for r in index.search(limit=10)[0]) == ["new", "unknown-new"]
+
+
+def test_search_combines_match_with_filters(index):
+    index.ingest("BackupLog", "b1", "Completed", None, log_lines(5))
+    index.ingest("BackupLog", "b2", "Completed", None, log_lines(5, msg="Skipping item"))
+    records, cursor = index.search(q="item", name="b2", limit=3)
+    assert [r["item"] for r in records] == ["web-4", "web-3", "web-2"]
+    records, cursor = index.search(q="item", name="b2", limit=3, before=cursor)
+    assert [r["item"] for r in records] == ["web-1", "web-0"]
+    assert index.search(q="item", levels=["error"])[0] == []
+    # Not a valid FTS5 expression: falls back to quoted words
+    assert len(index.search(q='Skipping "item')[0]) == 5
+
+
+def test_search_walks_fts_matches_in_rowid_order(index):
+    index.ingest("BackupLog", "b1", "Completed", None, log_lines(3))
+    plan = " ".join(
+        row[-1] for row in index._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT r.id FROM records_fts JOIN records r ON r.id = records_fts.rowid "
+            "WHERE records_fts MATCH 'Backing' ORDER BY records_fts.rowid DESC LIMIT 10"
+        )
+    )
+    assert "USE TEMP B-TREE" not in plan
+    plan = " ".join(
+        row[-1] for row in index._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM records WHERE level = 'error' ORDER BY id DESC LIMIT 10"
+        )
+    )
+    assert "records_level" in plan and "USE TEMP B-TREE" not in plan
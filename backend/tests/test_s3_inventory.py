@@ -0,0 +1,23 @@
+"""Bucket inventory stream: every failure ends with an error record"""
+
+from unittest import mock
+
+from app.services.s3_client import S3ValidationService
+
+
+def test_invalid_endpoint_ends_with_error_record():
+    records = list(S3ValidationService().iter_inventory("not a url", "velero"))
+    assert records[-1]["type"] == "error"
+
+
+def test_unexpected_error_mid_stream_ends_with_error_record():
+    service = S3ValidationService()
+    with mock.patch.object(service.client_pool, "get"), \
+            mock.patch.object(service, "iter_backup_prefixes", return_value=iter(["backups/b1/", "backups/b2/"])), \
+            mock.patch.object(service, "summarize_prefix", side_effect=[
+                {"name": "b1", "prefix": "backups/b1/", "objectCount": 1, "totalBytes": 10, "lastModified": None},
+                KeyError("Size"),
+            ]):
+        records = list(service.iter_inventory("http://s3", "velero"))
+    assert [r["type"] for r in records] == ["backup", "error"]
+    assert "Size" in records[-1]["message"]
@@ -0,0 +1,93 @@
+"""Batch schedule updates and stagger: schedule selection and dry runs"""
+
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.k8s_client import KubernetesClient
+
+SCHEDULES = [
+    {"metadata": {"name": name}, "spec": {"schedule": expression, "template": {"ttl": "720h"}}}
+    for name, expression in (
+        ("nightly-apps", "0 2 * * *"),
+        ("nightly-db", "0 2 * * *"),
+        ("weekly", "0 3 * * 0"),
+    )
+]
+
+
+@pytest.fixture
+def k8s():
+    with mock.patch.object(KubernetesClient, "list_schedules", lambda self: SCHEDULES), \
+            mock.patch.object(KubernetesClient, "apply_schedule") as apply, \
+            mock.patch.object(KubernetesClient, "patch_schedule") as patch:
+        yield apply, patch
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("body", [
+    {"paused": True},
+    {"namePrefix": "", "paused": True},
+    {"namePrefix": "  ", "paused": True},
+    {"names": [], "paused": True},
+])
+def test_update_requires_a_selection(client, k8s, body):
+    assert client.patch("/api/schedules/batch", json=body).status_code in (400, 422)
+    apply, patch = k8s
+    apply.assert_not_called()
+    patch.assert_not_called()
+
+
+@pytest.mark.parametrize("body", [{"windowMinutes": 30}, {"namePrefix": "", "windowMinutes": 30}])
+def test_stagger_requires_a_selection(client, k8s, body):
+    assert client.post("/api/schedules/stagger", json=body).status_code in (400, 422)
+    k8s[0].assert_not_called()
+
+
+def test_update_requires_a_change(client, k8s):
+    assert client.patch("/api/schedules/batch", json={"names": ["weekly"]}).status_code == 400
+
+
+def test_update_selects_names_and_prefix(client, k8s):
+    apply, patch = k8s
+    response = client.patch("/api/schedules/batch", json={
+        "names": ["weekly", "missing"],
+        "namePrefix": "nightly-",
+        "paused": True,
+        "template": {"ttl": None},
+    })
+    assert response.status_code == 200
+    result = response.json()
+    assert [(i["name"], i["ok"], i["status"]) for i in result["items"]] == [
+        ("weekly", True, None),
+        ("nightly-apps", True, None),
+        ("nightly-db", True, None),
+        ("missing", False, 404),
+    ]
+    assert (result["total"], result["succeeded"], result["failed"]) == (4, 3, 1)
+    assert sorted(c.args[0] for c in apply.call_args_list) == ["nightly-apps", "nightly-db", "weekly"]
+    assert apply.call_args.args[1] == {"paused": True}
+    # null removes the field through the merge patch
+    assert patch.call_args.args[1] == {"spec": {"template": {"ttl": None}}}
+
+
+def test_update_dry_run_changes_nothing(client, k8s):
+    response = client.patch("/api/schedules/batch", json={"namePrefix": "nightly-", "paused": False, "dryRun": True})
+    assert [i["name"] for i in response.json()["items"]] == ["nightly-apps", "nightly-db"]
+    k8s[0].assert_not_called()
+
+
+def test_stagger_rewrites_colliding_schedules(client, k8s):
+    apply, _ = k8s
+    response = client.post("/api/schedules/stagger", json={"names": ["nightly-apps", "nightly-db", "weekly"], "windowMinutes": 30})
+    result = response.json()
+    assert result["changes"] == [{"name": "nightly-db", "previous": "0 2 * * *", "schedule": "15 2 * * *"}]
+    assert [i["name"] for i in result["items"]] == ["nightly-db"]
+    apply.assert_called_once()
+    assert apply.call_args.args[:2] == ("nightly-db", {"schedule": "15 2 * * *"})
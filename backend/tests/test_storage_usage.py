@@ -0,0 +1,94 @@
+"""Storage usage: requests never run the bucket scan inline, repository data is counted"""
+
+import asyncio
+import threading
+from unittest import mock
+
+import httpx
+
+from app.main import app
+from app.services import storage_usage
+from app.services.bucket_index import BucketIndex, bucket_index
+from app.services.k8s_client import KubernetesClient
+from app.services.s3_client import s3_validation_service
+from app.services.storage_usage import analyze_bsl, storage_usage_analyzer
+
+BSLS = [{"metadata": {"name": "default"}, "spec": {"objectStorage": {"bucket": "velero"}}}]
+
+
+def test_usage_is_computed_in_the_background():
+    release = threading.Event()
+
+    def slow_refresh(bsl_cr):
+        assert release.wait(5)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await asyncio.wait_for(client.get("/api/storage/usage"), 1)
+            again = await client.get("/api/storage/usage")
+            release.set()
+            await storage_usage_analyzer._run_task
+            done = await client.get("/api/storage/usage")
+            await storage_usage_analyzer.stop()
+        return first, again, done
+
+    with mock.patch.object(KubernetesClient, "list_backup_storage_locations", lambda self: BSLS), \
+            mock.patch.object(KubernetesClient, "list_backups", lambda self: []), \
+            mock.patch.object(bucket_index, "refresh_bsl", slow_refresh), \
+            mock.patch.object(storage_usage_analyzer, "report", None):
+        first, again, done = asyncio.run(scenario())
+
+    assert first.status_code == 202
+    assert first.json()["running"] and first.json()["lastGeneratedAt"] is None
+    assert again.status_code == 202  # second request joins the running analysis
+    assert done.status_code == 200
+    assert [location["bsl"] for location in done.json()["locations"]] == ["default"]
+
+
+class FakeS3:
+    """list_objects_v2 paginator over an in-memory bucket"""
+
+    def __init__(self, sizes):
+        self.sizes = sizes
+
+    def get_paginator(self, operation):
+        return self
+
+    def paginate(self, Bucket, Prefix, Delimiter=None, StartAfter=None):
+        keys = sorted(k for k in self.sizes if k.startswith(Prefix) and k > (StartAfter or ""))
+        if Delimiter:
+            prefixes = sorted({Prefix + k[len(Prefix):].split("/")[0] + "/" for k in keys if "/" in k[len(Prefix):]})
+            yield {"CommonPrefixes": [{"Prefix": p} for p in prefixes]}
+        else:
+            yield {"Contents": [{"Key": k, "Size": self.sizes[k]} for k in keys]}
+
+
+def test_repository_data_is_counted_per_bsl(tmp_path):
+    index = BucketIndex(str(tmp_path / "bucket_index.db"))
+    bucket = FakeS3({
+        "velero/backups/b1/velero-backup.json": 10,
+        "velero/kopia/app/p0001": 1000,
+        "velero/kopia/app/p0002": 500,
+        "velero/restic/db/data/00/abc": 200,
+    })
+    with mock.patch.object(s3_validation_service.client_pool, "get", return_value=bucket):
+        stats = index.refresh("default", "http://s3", "velero", prefix="velero")
+    assert stats["repositories"] == 2 and stats["repositoriesScanned"] == 2
+
+    [usage] = index.usage("default")
+    assert usage["backupBytes"] == 10 and usage["repositoryBytes"] == 1700
+    assert usage["totalBytes"] == 1710 and usage["objects"] == 4
+
+    backups = [{"metadata": {"name": "b1"}, "status": {"phase": "Completed"}}]
+    with mock.patch.object(storage_usage, "bucket_index", index):
+        report = analyze_bsl("default", backups, growth_days=7, max_orphans=10)
+    assert report["totalBytes"] == 1710
+    assert report["backupBytes"] == 10
+    assert [(r["type"], r["name"], r["totalBytes"]) for r in report["repositories"]] == [
+        ("kopia", "app", 1500), ("restic", "db", 200)
+    ]
+
+    # Recently counted repositories are not listed again on the next refresh
+    with mock.patch.object(s3_validation_service.client_pool, "get", return_value=bucket):
+        assert index.refresh("default", "http://s3", "velero", prefix="velero")["repositoriesScanned"] == 0
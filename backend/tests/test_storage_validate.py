@@ -0,0 +1,49 @@
+"""validate-all: each BSL gets its full timeout once a worker picks it up"""
+
+import json
+import threading
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.k8s_client import KubernetesClient
+from app.services.s3_client import S3ValidationService, s3_validation_service
+
+BSLS = [
+    {"metadata": {"name": name}, "spec": {"config": {"s3Url": f"http://{name}"}, "objectStorage": {"bucket": "velero"}}}
+    for name in ("hung", "healthy")
+]
+
+
+def test_queued_check_is_not_charged_for_a_hung_one():
+    release = threading.Event()
+    timeouts = []
+
+    def validate_storage(s3_url, timeout=None, **kwargs):
+        timeouts.append(timeout)
+        if s3_url == "http://hung":
+            release.wait(0.6)  # worker stays busy past the per-BSL timeout
+            return False, "late", None, None
+        return True, "ok", 1, None
+
+    with mock.patch.object(KubernetesClient, "list_backup_storage_locations", lambda self: BSLS), \
+            mock.patch.object(s3_validation_service, "validate_storage", validate_storage):
+        response = TestClient(app).post("/api/storage/validate-all?concurrency=1&timeout=0.3")
+    release.set()
+
+    results = {line["bsl"]: line for line in map(json.loads, response.text.splitlines()) if line["type"] == "result"}
+    assert results["hung"]["success"] is False
+    assert results["hung"]["message"].startswith("Timed out")
+    assert results["healthy"]["success"] is True
+    assert results["healthy"]["latencyMs"] < 300
+    assert timeouts == [0.3, 0.3]
+
+
+def test_validation_client_timeouts_are_bounded():
+    service = S3ValidationService()
+    client = service.client_pool.get("http://s3", "us-east-1", timeout=2)
+    assert client.meta.config.connect_timeout == 2
+    assert client.meta.config.read_timeout == 2
+    assert client.meta.config.retries["total_max_attempts"] == 1
+    assert service.client_pool.get("http://s3", "us-east-1") is not client
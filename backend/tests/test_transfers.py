@@ -0,0 +1,34 @@
+"""Transfer tracker lookups"""
+
+from app.services.transfers import TransferTracker
+
+
+def data_upload(name: str, backup: str, phase: str = "InProgress") -> dict:
+    return {
+        "metadata": {"name": name, "labels": {"velero.io/backup-name": backup}},
+        "spec": {},
+        "status": {"phase": phase, "node": "node-1", "progress": {"totalBytes": 100, "bytesDone": 10}},
+    }
+
+
+def tracked(*objects) -> TransferTracker:
+    tracker = TransferTracker()
+    for obj in objects:
+        tracker._apply(("backup", obj["metadata"]["labels"]["velero.io/backup-name"]), "datauploads", "ADDED", obj)
+    return tracker
+
+
+def test_lookup_finds_only_the_requested_objects():
+    objects = [data_upload(f"du-{i}", f"backup-{i % 3}") for i in range(9)]
+    tracker = tracked(*objects)
+    live = tracker.lookup("datauploads", objects[:2])
+    assert sorted(live) == ["du-0", "du-1"]
+    assert live["du-1"].owner == "backup-1"
+
+
+def test_lookup_skips_untracked_and_unowned_objects():
+    tracker = tracked(data_upload("du-0", "backup-0"))
+    unowned = {"metadata": {"name": "du-x"}, "status": {}}
+    assert tracker.lookup("datauploads", [data_upload("du-9", "backup-0"), unowned]) == {}
+    # Same name under another kind is a different transfer
+    assert tracker.lookup("podvolumebackups", [data_upload("du-0", "backup-0")]) == {}
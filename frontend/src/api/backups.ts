@@ -1,5 +1,5 @@
 import apiClient from './client'
-import type { Backup, CreateBackupRequest } from '@/types/velero'
+import type { Backup, BackupListParams, BackupPage, CreateBackupRequest } from '@/types/velero'
 
 export const backupsApi = {
     // Get all backups
@@ -8,6 +8,15 @@ export const backupsApi = {
         return response.data
     },
 
+    // Get one page of backups (server-side filter/sort/pagination)
+    getPage: async (params: BackupListParams): Promise<BackupPage> => {
+        const response = await apiClient.get<Backup[]>('/backups', { params })
+        return {
+            items: response.data,
+            continue: response.headers['x-continue'],
+        }
+    },
+
     // Get single backup
     getById: async (name: string): Promise<Backup> => {
         const response = await apiClient.get<Backup>(`/backups/${name}`)
@@ -41,8 +41,9 @@ export default apiClient
 // ==================== Type Definitions ====================
 export interface PodVolumeBackup {
     name: string
-    pvcName: string
+    pod: string
     volumeName: string
+    node: string
     phase: string
     message?: string
     progress?: {
@@ -56,6 +57,8 @@ export interface BackupRepository {
     phase: string
     maintenanceFrequency?: string
     lastMaintenanceTime?: string
+    lagSeconds?: number
+    overdue?: boolean
     message?: string
 }
 
@@ -63,7 +66,13 @@ export interface NodeAgent {
     name: string
     nodeName: string
     status: string
+    ready: boolean
     restartCount: number
+    inProgress: number
+    queued: number
+    bytesPerSecond: number
+    stalled: number
+    saturated: boolean
 }
 
 // ==================== Backup APIs ====================
@@ -71,9 +80,14 @@ export async function deleteBackup(name: string): Promise<void> {
     await apiClient.delete(`/backups/${name}`)
 }
 
-export async function getBackupLogs(name: string): Promise<{ downloadUrl?: string }> {
-    const response = await apiClient.get(`/backups/${name}/logs`)
-    return response.data
+// Logs are streamed as text by the backend; open the URL directly
+function apiUrl(path: string): string {
+    const activeCluster = useClusterStore.getState().getActiveCluster()
+    return activeCluster ? activeCluster.url + '/api' + path : path
+}
+
+export function getBackupLogsUrl(name: string): string {
+    return apiUrl(`/backups/${name}/logs`)
 }
 
 export async function getBackupVolumeBackups(name: string): Promise<PodVolumeBackup[]> {
@@ -82,9 +96,8 @@ export async function getBackupVolumeBackups(name: string): Promise<PodVolumeBac
 }
 
 // ==================== Restore APIs ====================
-export async function getRestoreLogs(name: string): Promise<{ downloadUrl?: string }> {
-    const response = await apiClient.get(`/restores/${name}/logs`)
-    return response.data
+export function getRestoreLogsUrl(name: string): string {
+    return apiUrl(`/restores/${name}/logs`)
 }
 
 // ==================== System Status APIs ====================
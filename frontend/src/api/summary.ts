@@ -0,0 +1,10 @@
+import apiClient from './client'
+import type { DashboardSummary } from '@/types/velero'
+
+export const summaryApi = {
+    // Get dashboard KPIs
+    get: async (recent = 3): Promise<DashboardSummary> => {
+        const response = await apiClient.get<DashboardSummary>('/summary', { params: { recent } })
+        return response.data
+    },
+}
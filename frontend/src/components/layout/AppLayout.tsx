@@ -1,8 +1,11 @@
 import { Outlet } from 'react-router-dom'
 import Sidebar from './Sidebar'
 import TopNav from './TopNav'
+import { useVeleroEvents } from '@/hooks/useVeleroEvents'
 
 export default function AppLayout() {
+    useVeleroEvents()
+
     return (
         <div className="flex h-screen bg-dark-950">
             <Sidebar />
@@ -1,11 +1,15 @@
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import { backupsApi } from '@/api/backups'
 import type { CreateBackupRequest } from '@/types/velero'
+import { EVENT_LIST_STALE_TIME } from '@/hooks/useVeleroEvents'
 
 export function useBackups() {
     return useQuery({
         queryKey: ['backups'],
         queryFn: backupsApi.getAll,
+        // Patched by useVeleroEvents (SSE); the finite stale time still
+        // recovers from events missed while the stream was down
+        staleTime: EVENT_LIST_STALE_TIME,
     })
 }
 
@@ -4,11 +4,15 @@ import type {
     CreateRestoreRequest,
     CreateRestoreWithModificationsRequest,
 } from '@/types/velero'
+import { EVENT_LIST_STALE_TIME } from '@/hooks/useVeleroEvents'
 
 export function useRestores() {
     return useQuery({
         queryKey: ['restores'],
         queryFn: restoresApi.getAll,
+        // Patched by useVeleroEvents (SSE); the finite stale time still
+        // recovers from events missed while the stream was down
+        staleTime: EVENT_LIST_STALE_TIME,
     })
 }
 
@@ -0,0 +1,9 @@
+import { useQuery } from '@tanstack/react-query'
+import { summaryApi } from '@/api/summary'
+
+export function useSummary() {
+    return useQuery({
+        queryKey: ['summary'],
+        queryFn: () => summaryApi.get(),
+    })
+}
@@ -0,0 +1,107 @@
+import { useEffect } from 'react'
+import { useQueryClient } from '@tanstack/react-query'
+import { useClusterStore } from '@/store/clusterStore'
+
+type EventType = 'ADDED' | 'MODIFIED' | 'DELETED'
+
+interface VeleroEvent<T> {
+    type: EventType
+    resource: string
+    name: string
+    resourceVersion?: string
+    object: T
+}
+
+// Stale time of the lists patched from the stream
+export const EVENT_LIST_STALE_TIME = 60_000
+
+// Lists are polled at this interval while the stream is not connected
+const DISCONNECTED_POLL_INTERVAL = 15_000
+
+// The summary is refetched at most once per interval during event bursts
+const SUMMARY_THROTTLE = 2_000
+
+// SSE resource -> react-query list key
+const QUERY_KEYS: Record<string, string> = {
+    backups: 'backups',
+    restores: 'restores',
+    schedules: 'schedules',
+}
+
+function applyEvent<T extends { name: string }>(items: T[] | undefined, event: VeleroEvent<T>): T[] | undefined {
+    if (!items) return items
+    const rest = items.filter((item) => item.name !== event.name)
+    if (event.type === 'DELETED') return rest
+    const index = items.findIndex((item) => item.name === event.name)
+    if (index === -1) return [event.object, ...rest]
+    const next = [...items]
+    next[index] = event.object
+    return next
+}
+
+/**
+ * Subscribe to GET /api/events and patch cached lists in place,
+ * instead of re-downloading them on every change.
+ * EventSource reconnects on its own and resumes via Last-Event-ID;
+ * the lists are polled while it is disconnected.
+ */
+export function useVeleroEvents() {
+    const queryClient = useQueryClient()
+    const activeCluster = useClusterStore((state) => state.getActiveCluster())
+    const baseUrl = activeCluster?.url
+
+    useEffect(() => {
+        if (!baseUrl) return
+
+        const source = new EventSource(`${baseUrl}/api/events?resources=${Object.keys(QUERY_KEYS).join(',')}`)
+        let summaryTimer: ReturnType<typeof setTimeout> | undefined
+        let pollTimer: ReturnType<typeof setInterval> | undefined
+
+        const invalidateLists = () => {
+            Object.values(QUERY_KEYS).forEach((key) => {
+                queryClient.invalidateQueries({ queryKey: [key] })
+            })
+            queryClient.invalidateQueries({ queryKey: ['summary'] })
+        }
+
+        const invalidateSummary = () => {
+            if (summaryTimer) return
+            summaryTimer = setTimeout(() => {
+                summaryTimer = undefined
+                queryClient.invalidateQueries({ queryKey: ['summary'] })
+            }, SUMMARY_THROTTLE)
+        }
+
+        // Connection lost (EventSource is retrying): poll until it is back
+        source.onerror = () => {
+            if (pollTimer || source.readyState === EventSource.OPEN) return
+            pollTimer = setInterval(invalidateLists, DISCONNECTED_POLL_INTERVAL)
+        }
+        source.onopen = () => {
+            clearInterval(pollTimer)
+            pollTimer = undefined
+        }
+
+        Object.entries(QUERY_KEYS).forEach(([resource, key]) => {
+            source.addEventListener(resource, (message) => {
+                const event = JSON.parse((message as MessageEvent).data) as VeleroEvent<{ name: string }>
+                queryClient.setQueryData<{ name: string }[]>([key], (items) => applyEvent(items, event))
+                invalidateSummary()
+                if (event.type === 'DELETED') {
+                    queryClient.removeQueries({ queryKey: [key, event.name], exact: true })
+                } else {
+                    queryClient.setQueryData([key, event.name], event.object)
+                }
+            })
+        })
+
+        // Cursor could not be resumed: refetch everything once
+        source.addEventListener('resync', invalidateLists)
+
+        return () => {
+            source.close()
+            clearTimeout(summaryTimer)
+            clearInterval(pollTimer)
+        }
+    }, [baseUrl, queryClient])
+}
@@ -8,7 +8,7 @@ import { formatDate, formatDuration } from '@/utils/formatters'
 import { getPhaseVariant, getPhaseLabel } from '@/utils/phase'
 import { Plus, RefreshCw, AlertCircle, Trash2, FileText, Database } from 'lucide-react'
 import type { Backup } from '@/types/velero'
-import { deleteBackup, getBackupLogs, getBackupVolumeBackups, PodVolumeBackup } from '@/api/client'
+import { deleteBackup, getBackupLogsUrl, getBackupVolumeBackups, PodVolumeBackup } from '@/api/client'
 
 export default function BackupsPage() {
     const { data: backups, isLoading, error, refetch } = useBackups()
@@ -28,17 +28,8 @@ export default function BackupsPage() {
         }
     }
 
-    const handleViewLogs = async (name: string) => {
-        try {
-            const logs = await getBackupLogs(name)
-            if (logs.downloadUrl) {
-                window.open(logs.downloadUrl, '_blank')
-            } else {
-                alert('No logs available')
-            }
-        } catch (e) {
-            alert('Failed to fetch logs')
-        }
+    const handleViewLogs = (name: string) => {
+        window.open(getBackupLogsUrl(name), '_blank')
     }
 
     const handleViewDetails = async (name: string) => {
@@ -221,7 +212,7 @@ export default function BackupsPage() {
                                 <table className="w-full text-sm text-left text-gray-300">
                                     <thead className="bg-dark-700 text-gray-100 uppercase">
                                         <tr>
-                                            <th className="px-4 py-2">PVC</th>
+                                            <th className="px-4 py-2">Pod</th>
                                             <th className="px-4 py-2">Volume</th>
                                             <th className="px-4 py-2">Phase</th>
                                             <th className="px-4 py-2">Progress</th>
@@ -231,7 +222,7 @@ export default function BackupsPage() {
                                     <tbody>
                                         {volumeBackups.map((pvb) => (
                                             <tr key={pvb.name} className="border-b border-gray-700/50">
-                                                <td className="px-4 py-2">{pvb.pvcName}</td>
+                                                <td className="px-4 py-2">{pvb.pod}</td>
                                                 <td className="px-4 py-2">{pvb.volumeName}</td>
                                                 <td className="px-4 py-2">
                                                     <Badge variant={getPhaseVariant(pvb.phase)}>{pvb.phase}</Badge>
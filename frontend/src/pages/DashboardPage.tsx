@@ -1,8 +1,7 @@
 import { Card, CardHeader, CardContent } from '@/components/ui/Card'
 import Button from '@/components/ui/Button'
 import Badge from '@/components/ui/Badge'
-import { useBackups } from '@/hooks/useBackups'
-import { useRestores } from '@/hooks/useRestores'
+import { useSummary } from '@/hooks/useSummary'
 import { formatDate } from '@/utils/formatters'
 import { getPhaseVariant } from '@/utils/phase'
 import { Database, Upload, Calendar, CheckCircle, XCircle, RefreshCw } from 'lucide-react'
@@ -10,16 +9,15 @@ import { useNavigate } from 'react-router-dom'
 
 export default function DashboardPage() {
     const navigate = useNavigate()
-    const { data: backups, isLoading: backupsLoading } = useBackups()
-    const { data: restores, isLoading: restoresLoading } = useRestores()
+    const { data: summary, isLoading } = useSummary()
 
-    const recentBackups = backups?.slice(0, 3) || []
-    const recentRestores = restores?.slice(0, 2) || []
+    const recentBackups = summary?.recentBackups.slice(0, 3) || []
+    const recentRestores = summary?.recentRestores.slice(0, 2) || []
 
-    const completedBackups = backups?.filter((b) => b.phase === 'Completed').length || 0
-    const inProgressRestores = restores?.filter((r) => r.phase === 'InProgress').length || 0
-    const failedOps = (backups?.filter((b) => b.phase === 'Failed').length || 0) +
-        (restores?.filter((r) => r.phase === 'Failed').length || 0)
+    const completedBackups = summary?.backups.byPhase['Completed'] || 0
+    const inProgressRestores = summary?.restores.byPhase['InProgress'] || 0
+    const failedOps = (summary?.backups.byPhase['Failed'] || 0) +
+        (summary?.restores.byPhase['Failed'] || 0)
 
     return (
         <div className="space-y-6">
@@ -35,11 +33,11 @@ export default function DashboardPage() {
                     <div className="flex items-center justify-between">
                         <div>
                             <p className="text-sm text-gray-400">Total Backups</p>
-                            {backupsLoading ? (
+                            {isLoading ? (
                                 <RefreshCw className="w-6 h-6 text-gray-400 animate-spin mt-2" />
                             ) : (
                                 <>
-                                    <p className="text-3xl font-bold text-gray-100 mt-2">{backups?.length || 0}</p>
+                                    <p className="text-3xl font-bold text-gray-100 mt-2">{summary?.backups.total || 0}</p>
                                     <p className="text-xs text-success mt-1 flex items-center">
                                         <span className="mr-1">✓</span> {completedBackups} completed
                                     </p>
@@ -56,11 +54,11 @@ export default function DashboardPage() {
                     <div className="flex items-center justify-between">
                         <div>
                             <p className="text-sm text-gray-400">Total Restores</p>
-                            {restoresLoading ? (
+                            {isLoading ? (
                                 <RefreshCw className="w-6 h-6 text-gray-400 animate-spin mt-2" />
                             ) : (
                                 <>
-                                    <p className="text-3xl font-bold text-gray-100 mt-2">{restores?.length || 0}</p>
+                                    <p className="text-3xl font-bold text-gray-100 mt-2">{summary?.restores.total || 0}</p>
                                     <p className="text-xs text-info mt-1 flex items-center">
                                         <span className="mr-1">→</span> {inProgressRestores} in progress
                                     </p>
@@ -77,9 +75,9 @@ export default function DashboardPage() {
                     <div className="flex items-center justify-between">
                         <div>
                             <p className="text-sm text-gray-400">Active Schedules</p>
-                            <p className="text-3xl font-bold text-gray-100 mt-2">-</p>
+                            <p className="text-3xl font-bold text-gray-100 mt-2">{summary?.schedulesActive ?? '-'}</p>
                             <p className="text-xs text-gray-500 mt-1 flex items-center">
-                                <Calendar className="w-3 h-3 mr-1" /> Coming soon
+                                <Calendar className="w-3 h-3 mr-1" /> {summary?.schedulesTotal ?? 0} total
                             </p>
                         </div>
                         <div className="w-12 h-12 rounded-lg bg-success/10 flex items-center justify-center">
@@ -110,7 +108,7 @@ export default function DashboardPage() {
                 <Card>
                     <CardHeader title="Recent Backups" />
                     <CardContent>
-                        {backupsLoading ? (
+                        {isLoading ? (
                             <div className="py-8 text-center">
                                 <RefreshCw className="w-8 h-8 text-gray-400 animate-spin mx-auto mb-3" />
                                 <p className="text-gray-400">Loading...</p>
@@ -139,7 +137,7 @@ export default function DashboardPage() {
                 <Card>
                     <CardHeader title="Recent Restores" />
                     <CardContent>
-                        {restoresLoading ? (
+                        {isLoading ? (
                             <div className="py-8 text-center">
                                 <RefreshCw className="w-8 h-8 text-gray-400 animate-spin mx-auto mb-3" />
                                 <p className="text-gray-400">Loading...</p>
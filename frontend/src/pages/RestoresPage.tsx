@@ -8,7 +8,7 @@ import { formatDate, formatDuration } from '@/utils/formatters'
 import { getPhaseVariant, getPhaseLabel } from '@/utils/phase'
 import { Plus, RefreshCw, AlertCircle, FileText } from 'lucide-react'
 import type { Restore } from '@/types/velero'
-import { getRestoreLogs } from '@/api/client'
+import { getRestoreLogsUrl } from '@/api/client'
 import { useNavigate } from 'react-router-dom'
 
 export default function RestoresPage() {
@@ -16,17 +16,8 @@ export default function RestoresPage() {
     const { data: restores, isLoading, error, refetch } = useRestores()
     const [isCreateModalOpen, setIsCreateModalOpen] = useState(false)
 
-    const handleViewLogs = async (name: string) => {
-        try {
-            const logs = await getRestoreLogs(name)
-            if (logs.downloadUrl) {
-                window.open(logs.downloadUrl, '_blank')
-            } else {
-                alert('No logs available')
-            }
-        } catch (e) {
-            alert('Failed to fetch logs')
-        }
+    const handleViewLogs = (name: string) => {
+        window.open(getRestoreLogsUrl(name), '_blank')
     }
 
     if (error) {
@@ -116,15 +116,16 @@ export default function SchedulesPage() {
                                 <th className="text-left py-3 px-4 text-xs font-semibold text-gray-400 uppercase">Cron</th>
                                 <th className="text-left py-3 px-4 text-xs font-semibold text-gray-400 uppercase">TTL</th>
                                 <th className="text-left py-3 px-4 text-xs font-semibold text-gray-400 uppercase">Last Backup</th>
+                                <th className="text-left py-3 px-4 text-xs font-semibold text-gray-400 uppercase">Next Run</th>
                                 <th className="text-right py-3 px-4 text-xs font-semibold text-gray-400 uppercase">Actions</th>
                             </tr>
                         </thead>
                         <tbody>
                             {isLoading && (
-                                <tr><td colSpan={6} className="py-8 text-center text-gray-400">Loading...</td></tr>
+                                <tr><td colSpan={7} className="py-8 text-center text-gray-400">Loading...</td></tr>
                             )}
                             {!isLoading && schedules?.length === 0 && (
-                                <tr><td colSpan={6} className="py-8 text-center text-gray-400">No schedules found.</td></tr>
+                                <tr><td colSpan={7} className="py-8 text-center text-gray-400">No schedules found.</td></tr>
                             )}
                             {schedules?.map((schedule) => (
                                 <tr key={schedule.name} className="border-b border-gray-700/30 hover:bg-dark-700/50">
@@ -137,6 +138,9 @@ export default function SchedulesPage() {
                                     <td className="py-3 px-4 text-gray-300 text-sm">
                                         {schedule.lastBackup ? formatDate(schedule.lastBackup) : '-'}
                                     </td>
+                                    <td className="py-3 px-4 text-gray-300 text-sm">
+                                        {schedule.nextRunTime ? formatDate(schedule.nextRunTime) : '-'}
+                                    </td>
                                     <td className="py-3 px-4 text-right">
                                         <Button
                                             size="sm"
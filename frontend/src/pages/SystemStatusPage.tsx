@@ -104,6 +104,7 @@ const SystemStatusPage: React.FC = () => {
                                         <td className="px-4 py-3 text-gray-300">{repo.maintenanceFrequency || '-'}</td>
                                         <td className="px-4 py-3 text-gray-300">
                                             {repo.lastMaintenanceTime ? new Date(repo.lastMaintenanceTime).toLocaleString() : '-'}
+                                            {repo.overdue && <span className="ml-2"><Badge variant="warning">Overdue</Badge></span>}
                                         </td>
                                         <td className="px-4 py-3 text-gray-400 max-w-xs truncate" title={repo.message}>
                                             {repo.message || '-'}
@@ -130,12 +131,14 @@ const SystemStatusPage: React.FC = () => {
                                 <th className="px-4 py-3">Node</th>
                                 <th className="px-4 py-3">Status</th>
                                 <th className="px-4 py-3">Restarts</th>
+                                <th className="px-4 py-3">Transfers</th>
+                                <th className="px-4 py-3">Throughput</th>
                             </tr>
                         </thead>
                         <tbody className="divide-y divide-gray-700/30">
                             {nodeAgents.length === 0 ? (
                                 <tr>
-                                    <td colSpan={4} className="px-4 py-8 text-center text-gray-500">
+                                    <td colSpan={6} className="px-4 py-8 text-center text-gray-500">
                                         No node agents found.
                                     </td>
                                 </tr>
@@ -150,6 +153,14 @@ const SystemStatusPage: React.FC = () => {
                                             </Badge>
                                         </td>
                                         <td className="px-4 py-3 text-gray-300">{agent.restartCount}</td>
+                                        <td className="px-4 py-3 text-gray-300">
+                                            {agent.inProgress} running / {agent.queued} queued
+                                            {agent.saturated && <span className="ml-2"><Badge variant="warning">Saturated</Badge></span>}
+                                            {agent.stalled > 0 && <span className="ml-2"><Badge variant="danger">{agent.stalled} stalled</Badge></span>}
+                                        </td>
+                                        <td className="px-4 py-3 text-gray-300">
+                                            {(agent.bytesPerSecond / 1024 / 1024).toFixed(1)} MB/s
+                                        </td>
                                     </tr>
                                 ))
                             )}
@@ -9,6 +9,23 @@ export interface Backup {
     backupStorage?: string
 }
 
+export interface BackupListParams {
+    limit?: number
+    continue?: string
+    phase?: string
+    storageLocation?: string
+    schedule?: string
+    since?: string
+    until?: string
+    namePrefix?: string
+    sort?: string
+}
+
+export interface BackupPage {
+    items: Backup[]
+    continue?: string
+}
+
 export interface Restore {
     name: string
     phase: string
@@ -23,6 +40,7 @@ export interface Schedule {
     name: string
     schedule: string
     lastBackup: string | null
+    nextRunTime?: string | null
     enabled: boolean
     phase?: string
     ttl?: string
@@ -44,6 +62,23 @@ export interface BackupStorageLocation {
     message?: string
 }
 
+export interface ResourceSummary {
+    total: number
+    byPhase: Record<string, number>
+    warnings: number
+    errors: number
+}
+
+export interface DashboardSummary {
+    backups: ResourceSummary
+    restores: ResourceSummary
+    schedulesTotal: number
+    schedulesActive: number
+    recentBackups: Backup[]
+    recentRestores: Restore[]
+    lastSuccessfulBackups: Record<string, { name: string; completionTimestamp: string }>
+}
+
 // Request Types
 export interface CreateBackupRequest {
     name: string